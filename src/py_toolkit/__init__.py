@@ -22,13 +22,31 @@ from .salesforce_utility import (
 
     # From query.py
     query_salesforce_soql,
+    iter_salesforce_soql_batches,
+    write_salesforce_soql_batches,
+
+    # From bulk_query.py
+    create_salesforce_bulk_query_job,
+    wait_for_salesforce_bulk_query_job,
+    iter_salesforce_bulk_query_batches,
+    query_salesforce_bulk,
+
+    # From describe_cache.py
+    SalesforceDescribeCache,
+    describe_salesforce_sobject,
+    salesforce_column_types,
 
     # From reporting.py
     query_salesforce_report,
+    query_salesforce_report_full,
 
     # Potentially transformations if you want them top-level
     flatten_record,
-    convert_to_eastern_time
+    flatten_records,
+    convert_to_eastern_time,
+    convert_values_to_eastern_time,
+    convert_datetime_columns_to_eastern_time,
+    cast_salesforce_columns
 )
 
 # ================== GENESYS ==================
@@ -44,8 +62,57 @@ from .genesys_utility import (
 
     # From conversation_details_query.py
     build_post_analytics_conversations_details_query_payloads,
+    iter_conversation_pages_for_conversations_details_query_payload,
+    iter_all_pages_for_conversations_details_query_payload,
     fetch_all_pages_for_conversations_details_query_payload,
     fetch_post_analytics_conversations_details_query_df,
+    iter_post_analytics_conversations_details_query_batches,
+    write_post_analytics_conversations_details_query_batches,
+    fetch_post_analytics_conversations_details_query_incremental,
+
+    # From conversation_aggregates_query.py
+    build_post_analytics_conversations_aggregates_query_payloads,
+    fetch_post_analytics_conversations_aggregates_query_payload,
+    fetch_post_analytics_conversations_aggregates_query_df,
+
+    # From interval_planner.py
+    local_day_intervals,
+
+    # From conversation_details_jobs.py
+    submit_conversation_details_job,
+    wait_for_conversation_details_job,
+    iter_conversation_details_job_results,
+    iter_conversation_pages_for_conversations_details_job_payload,
+    iter_all_pages_for_conversations_details_job_payload,
+    fetch_all_pages_for_conversations_details_job_payload,
+
+    # From conversation_schema.py
+    ConversationSegmentBuffer,
+    ConversationTablesBuffer,
+    normalize_conversations,
+
+    # From extract_state.py
+    GenesysExtractStateStore,
+
+    # From response_cache.py
+    GenesysResponseCache,
+
+    # From token_manager.py
+    GenesysTokenManager,
+
+    # From client_factory.py
+    GenesysClientFactory,
+
+    # From transport.py
+    GenesysTransport,
+    get_genesys_transport,
+    configure_genesys_transport,
+
+    # From user_directory.py
+    GenesysUserDirectory,
+
+    # From rate_limit.py
+    GenesysRateLimiter,
 
     # From transformations.py
     clean_genesys_id_column
@@ -82,17 +149,58 @@ __all__ = [
     "get_salesforce_refresh_token",
     "print_salesforce_authorize_url",
     "query_salesforce_soql",
+    "iter_salesforce_soql_batches",
+    "write_salesforce_soql_batches",
+    "create_salesforce_bulk_query_job",
+    "wait_for_salesforce_bulk_query_job",
+    "iter_salesforce_bulk_query_batches",
+    "query_salesforce_bulk",
+    "SalesforceDescribeCache",
+    "describe_salesforce_sobject",
+    "salesforce_column_types",
     "query_salesforce_report",
+    "query_salesforce_report_full",
     "flatten_record",
+    "flatten_records",
     "convert_to_eastern_time",
+    "convert_values_to_eastern_time",
+    "convert_datetime_columns_to_eastern_time",
+    "cast_salesforce_columns",
 
     # GENESYS
     "get_genesys_access_token",
     "genesys_users_setup",
     "genesys_conversation_setup",
     "build_post_analytics_conversations_details_query_payloads",
+    "iter_conversation_pages_for_conversations_details_query_payload",
+    "iter_all_pages_for_conversations_details_query_payload",
     "fetch_all_pages_for_conversations_details_query_payload",
     "fetch_post_analytics_conversations_details_query_df",
+    "iter_post_analytics_conversations_details_query_batches",
+    "write_post_analytics_conversations_details_query_batches",
+    "fetch_post_analytics_conversations_details_query_incremental",
+    "build_post_analytics_conversations_aggregates_query_payloads",
+    "fetch_post_analytics_conversations_aggregates_query_payload",
+    "fetch_post_analytics_conversations_aggregates_query_df",
+    "local_day_intervals",
+    "submit_conversation_details_job",
+    "wait_for_conversation_details_job",
+    "iter_conversation_details_job_results",
+    "iter_conversation_pages_for_conversations_details_job_payload",
+    "iter_all_pages_for_conversations_details_job_payload",
+    "fetch_all_pages_for_conversations_details_job_payload",
+    "ConversationSegmentBuffer",
+    "ConversationTablesBuffer",
+    "normalize_conversations",
+    "GenesysExtractStateStore",
+    "GenesysResponseCache",
+    "GenesysTokenManager",
+    "GenesysClientFactory",
+    "GenesysTransport",
+    "get_genesys_transport",
+    "configure_genesys_transport",
+    "GenesysUserDirectory",
+    "GenesysRateLimiter",
     "clean_genesys_id_column",
     
     # Google Sheets    
@@ -0,0 +1,33 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+
+class SQLiteStore:
+    """
+    Base for the toolkit's on-disk SQLite stores (extract state, response and describe caches).
+
+    Creates the database's folder and tables on first use. Each call opens its own
+    connection, so one instance can be shared between worker threads; subclasses
+    hold `_lock` around read-modify-write sequences.
+    """
+
+    def __init__(self, path: str, schema: str):
+        self.path = path
+        store_dir = os.path.dirname(self.path)
+        if store_dir and not os.path.exists(store_dir):
+            os.makedirs(store_dir)
+
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.executescript(schema)
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:  # commits on success, rolls back on error
+                yield conn
+        finally:
+            conn.close()
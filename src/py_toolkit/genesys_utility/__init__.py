@@ -3,9 +3,44 @@ from .users import genesys_users_setup
 from .conversation import genesys_conversation_setup
 from .conversation_details_query import (
     build_post_analytics_conversations_details_query_payloads,
+    iter_conversation_pages_for_conversations_details_query_payload,
+    iter_all_pages_for_conversations_details_query_payload,
     fetch_all_pages_for_conversations_details_query_payload,
-    fetch_post_analytics_conversations_details_query_df
+    fetch_post_analytics_conversations_details_query_df,
+    iter_post_analytics_conversations_details_query_batches,
+    write_post_analytics_conversations_details_query_batches,
+    fetch_post_analytics_conversations_details_query_incremental
 )
+from .conversation_aggregates_query import (
+    build_post_analytics_conversations_aggregates_query_payloads,
+    fetch_post_analytics_conversations_aggregates_query_payload,
+    fetch_post_analytics_conversations_aggregates_query_df
+)
+from .interval_planner import local_day_intervals
+from .conversation_details_jobs import (
+    submit_conversation_details_job,
+    wait_for_conversation_details_job,
+    iter_conversation_details_job_results,
+    iter_conversation_pages_for_conversations_details_job_payload,
+    iter_all_pages_for_conversations_details_job_payload,
+    fetch_all_pages_for_conversations_details_job_payload
+)
+from .conversation_schema import (
+    ConversationSegmentBuffer,
+    ConversationTablesBuffer,
+    normalize_conversations
+)
+from .extract_state import GenesysExtractStateStore
+from .response_cache import GenesysResponseCache
+from .token_manager import GenesysTokenManager
+from .client_factory import GenesysClientFactory
+from .transport import (
+    GenesysTransport,
+    get_genesys_transport,
+    configure_genesys_transport
+)
+from .user_directory import GenesysUserDirectory
+from .rate_limit import GenesysRateLimiter
 from .transformations import clean_genesys_id_column
 
 __all__ = [
@@ -13,7 +48,34 @@ __all__ = [
     "genesys_users_setup",
     "genesys_conversation_setup",
     "build_post_analytics_conversations_details_query_payloads",
+    "iter_conversation_pages_for_conversations_details_query_payload",
+    "iter_all_pages_for_conversations_details_query_payload",
     "fetch_all_pages_for_conversations_details_query_payload",
     "fetch_post_analytics_conversations_details_query_df",
+    "iter_post_analytics_conversations_details_query_batches",
+    "write_post_analytics_conversations_details_query_batches",
+    "fetch_post_analytics_conversations_details_query_incremental",
+    "build_post_analytics_conversations_aggregates_query_payloads",
+    "fetch_post_analytics_conversations_aggregates_query_payload",
+    "fetch_post_analytics_conversations_aggregates_query_df",
+    "local_day_intervals",
+    "submit_conversation_details_job",
+    "wait_for_conversation_details_job",
+    "iter_conversation_details_job_results",
+    "iter_conversation_pages_for_conversations_details_job_payload",
+    "iter_all_pages_for_conversations_details_job_payload",
+    "fetch_all_pages_for_conversations_details_job_payload",
+    "ConversationSegmentBuffer",
+    "ConversationTablesBuffer",
+    "normalize_conversations",
+    "GenesysExtractStateStore",
+    "GenesysResponseCache",
+    "GenesysTokenManager",
+    "GenesysClientFactory",
+    "GenesysTransport",
+    "get_genesys_transport",
+    "configure_genesys_transport",
+    "GenesysUserDirectory",
+    "GenesysRateLimiter",
     "clean_genesys_id_column"
 ]
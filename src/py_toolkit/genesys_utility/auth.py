@@ -1,35 +1,31 @@
 import os
-import base64
-import requests
 import PureCloudPlatformClientV2 as genesys
 from .common import _update_env_file
+from .token_manager import get_token_manager, _client_credentials_token, _set_configuration_token
+from .transport import get_genesys_transport
+
+def _write_env_token(access_token):
+    _update_env_file("GENESYS_ACCESS_TOKEN", access_token)
 
 def get_genesys_access_token(client_id, client_secret, environment):
     """
-    Fetches a new access token from Genesys PureCloud API and updates genesys.configuration.
-    Also writes the token to .env for later usage.
+    Returns an access token for the Genesys PureCloud API and sets genesys.configuration.
+    The token is cached process-wide with its expiry, so /oauth/token is only hit
+    (and .env only rewritten) when there is no token yet or it is about to lapse.
+    Every new token, including background refreshes, is written to
+    genesys.configuration and .env.
     """
-    authorization = base64.b64encode(
-        bytes(client_id + ":" + client_secret, "ISO-8859-1")
-    ).decode("ascii")
-
-    request_headers = {
-        "Authorization": f"Basic {authorization}",
-        "Content-Type": "application/x-www-form-urlencoded"
-    }
-    request_body = {
-        "grant_type": "client_credentials"
-    }
-
-    response = requests.post(
-        f"https://login.{environment}/oauth/token",
-        data=request_body,
-        headers=request_headers
+    host = f"https://api.{environment}"
+    transport = get_genesys_transport()
+    manager = get_token_manager(
+        client_id,
+        client_secret,
+        host,
+        lambda: _client_credentials_token(client_id, client_secret, host=host, transport=transport),
+        transport=transport
     )
-    
-    if response.status_code == 200:
-        access_token = response.json().get("access_token")
-        genesys.configuration.access_token = access_token
-        _update_env_file("GENESYS_ACCESS_TOKEN", access_token)
-    else:
-        response.raise_for_status()
+    manager.add_listener(_set_configuration_token)
+    manager.add_listener(_write_env_token)
+    access_token = manager.get_token()
+    genesys.configuration.access_token = access_token
+    return access_token
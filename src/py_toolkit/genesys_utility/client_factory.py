@@ -0,0 +1,77 @@
+import PureCloudPlatformClientV2 as genesys
+from .rate_limit import GenesysRateLimiter
+from .token_manager import (
+    DEFAULT_TOKEN_LIFETIME,
+    get_token_manager,
+    _resolve_api_host,
+    _client_credentials_token
+)
+from .transport import GenesysTransport
+
+
+class GenesysClientFactory:
+    """
+    Isolated Genesys clients for one org/region.
+
+    Each factory owns its ApiClient (pointed at its region's host and carrying its own
+    token), its own connection pools and its own GenesysRateLimiter, and never touches
+    the global genesys.configuration, so several orgs can be extracted concurrently in
+    one process:
+
+        org_a = GenesysClientFactory(id_a, secret_a, region="us_east_2")
+        org_b = GenesysClientFactory(id_b, secret_b, region="eu_west_1")
+        fetch_post_analytics_conversations_details_query_df(
+            org_a.conversations_api(), intervals, df, "conversation_id",
+            rate_limiter=org_a.rate_limiter
+        )
+
+    `region` is a PureCloudRegionHosts member, its name ("eu_west_1"),
+    an environment domain ("mypurecloud.ie") or a full API host URL.
+    """
+
+    def __init__(
+        self,
+        client_id,
+        client_secret,
+        region="us_east_2",
+        transport=None,
+        rate_limiter=None
+    ):
+        self.host = _resolve_api_host(region)
+        self.transport = transport if transport is not None else GenesysTransport()
+        self.rate_limiter = rate_limiter if rate_limiter is not None else GenesysRateLimiter()
+
+        self.api_client = self.transport.attach(genesys.api_client.ApiClient(host=self.host))
+
+        host, transport = self.host, self.transport
+        self.token_manager = get_token_manager(
+            client_id,
+            client_secret,
+            self.host,
+            lambda: _client_credentials_token(
+                client_id, client_secret, host=host, transport=transport
+            ),
+            transport=transport,
+            default_lifetime=DEFAULT_TOKEN_LIFETIME
+        )
+        self.token_manager.add_listener(self._set_token)
+        self._set_token(self.token_manager.get_token())
+
+    def _set_token(self, access_token):
+        # ApiClient prefers its own access_token over genesys.configuration's
+        self.api_client.access_token = access_token
+
+    def api(self, api_class):
+        """
+        Returns any PureCloud API class (e.g. genesys.RoutingApi) bound to this org's client.
+        """
+        return api_class(self.api_client)
+
+    def conversations_api(self):
+        return self.api(genesys.ConversationsApi)
+
+    def users_api(self):
+        return self.api(genesys.UsersApi)
+
+    def routing_api(self):
+        return self.api(genesys.RoutingApi)
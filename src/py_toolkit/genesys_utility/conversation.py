@@ -1,14 +1,18 @@
 import PureCloudPlatformClientV2 as genesys
+from .token_manager import _configure_genesys_client
+from .transport import get_genesys_transport
 
-def genesys_conversation_setup(client_id, client_secret):
+def genesys_conversation_setup(client_id, client_secret, region=genesys.PureCloudRegionHosts.us_east_2):
     """
     Sets up and returns a Genesys ConversationsApi instance,
     pre-configured with credentials.
+    The token is shared (and kept refreshed) across every setup call for the same credentials,
+    and every client reuses the package's pooled connections (see transport.py).
+    This configures the global genesys.configuration; to work with several orgs or
+    regions at once, use GenesysClientFactory instead.
     """
-    region = genesys.PureCloudRegionHosts.us_east_2
-    genesys.configuration.host = region.get_api_host()
-    apiclient = genesys.api_client.ApiClient().get_client_credentials_token(client_id, client_secret)
-    genesys.configuration.access_token = apiclient.access_token
-    api_instance = genesys.ConversationsApi()
+    _configure_genesys_client(client_id, client_secret, region)
+    api_client = get_genesys_transport().attach(genesys.api_client.ApiClient())
+    api_instance = genesys.ConversationsApi(api_client)
     return api_instance
 
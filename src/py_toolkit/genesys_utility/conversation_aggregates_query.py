@@ -0,0 +1,160 @@
+import json
+import pandas as pd
+from functools import partial
+from typing import List, Tuple, Union
+from .rate_limit import GenesysRateLimiter
+from .conversation_details_query import _map_payloads, _interval_string
+
+# Statistics Genesys can return for each aggregate metric, with the dtype each column is built with
+AGGREGATE_STATS_SCHEMA = {
+    "count": "Int64",
+    "sum": "float64",
+    "min": "float64",
+    "max": "float64",
+    "current": "float64",
+    "ratio": "float64",
+    "numerator": "float64",
+    "denominator": "float64",
+    "target": "float64",
+}
+
+
+def build_post_analytics_conversations_aggregates_query_payloads(
+    intervals: List[Union[Tuple[str, str], str]],
+    metrics: List[str],
+    group_by: List[str] = None,
+    granularity: str = None,
+    filter: dict = None,
+    time_zone: str = None
+) -> List[str]:
+    """
+    Builds one conversation aggregates query JSON string per interval
+    ((start_date, end_date) tuple or ISO interval string).
+    metrics are Genesys metric names (e.g. ["nOffered", "tHandle", "tTalk"]),
+    group_by dimension names (e.g. ["queueId", "mediaType"]), and granularity an
+    ISO-8601 duration (e.g. "PT30M", "P1D") bucketing each interval.
+    """
+    if not metrics:
+        raise ValueError("metrics must name at least one aggregate metric.")
+
+    payloads_json_list = []
+    for interval in intervals:
+        payload_dict = {
+            "interval": _interval_string(interval),
+            "metrics": list(metrics),
+        }
+        if group_by:
+            payload_dict["groupBy"] = list(group_by)
+        if granularity:
+            payload_dict["granularity"] = granularity
+        if filter:
+            payload_dict["filter"] = filter
+        if time_zone:
+            payload_dict["timeZone"] = time_zone
+
+        payloads_json_list.append(json.dumps(payload_dict))
+
+    return payloads_json_list
+
+
+def fetch_post_analytics_conversations_aggregates_query_payload(api_client, payload_json, rate_limiter=None) -> list:
+    """
+    Posts a single aggregates query and returns its results as a list of
+    {"group": {...}, "data": [...]} dicts.
+    """
+    if rate_limiter is None:
+        rate_limiter = GenesysRateLimiter()
+
+    response_data = rate_limiter.call(
+        api_client.post_analytics_conversations_aggregates_query, json.loads(payload_json)
+    ).to_dict()
+    return response_data.get("results") or []
+
+
+def _aggregate_results_frame(results: list, group_by: List[str]) -> pd.DataFrame:
+    """
+    Flattens aggregate results into one row per (bucket, group, metric, qualifier),
+    built from column buffers with declared dtypes.
+    """
+    group_columns = list(group_by or [])
+    for container in results:
+        for dimension in container.get("group") or {}:
+            if dimension not in group_columns:
+                group_columns.append(dimension)
+
+    buffers = {
+        column: []
+        for column in ["interval_start", "interval_end", *group_columns, "metric", "qualifier", *AGGREGATE_STATS_SCHEMA]
+    }
+
+    for container in results:
+        group = container.get("group") or {}
+        for bucket in container.get("data") or []:
+            interval_start, _, interval_end = (bucket.get("interval") or "").partition("/")
+            for metric in bucket.get("metrics") or []:
+                stats = metric.get("stats") or {}
+                buffers["interval_start"].append(interval_start or None)
+                buffers["interval_end"].append(interval_end or None)
+                for column in group_columns:
+                    buffers[column].append(group.get(column))
+                buffers["metric"].append(metric.get("metric"))
+                buffers["qualifier"].append(metric.get("qualifier"))
+                for stat in AGGREGATE_STATS_SCHEMA:
+                    buffers[stat].append(stats.get(stat))
+
+    columns = {
+        "interval_start": pd.to_datetime(pd.Series(buffers["interval_start"], dtype="object"), utc=True),
+        "interval_end": pd.to_datetime(pd.Series(buffers["interval_end"], dtype="object"), utc=True),
+    }
+    for column in group_columns:
+        columns[column] = pd.Series(buffers[column], dtype="category")
+    columns["metric"] = pd.Series(buffers["metric"], dtype="category")
+    columns["qualifier"] = pd.Series(buffers["qualifier"], dtype="string")
+    for stat, dtype in AGGREGATE_STATS_SCHEMA.items():
+        columns[stat] = pd.Series(buffers[stat], dtype=dtype)
+
+    return pd.DataFrame(columns)
+
+
+def fetch_post_analytics_conversations_aggregates_query_df(
+    api_client,
+    intervals,
+    metrics,
+    group_by=None,
+    granularity=None,
+    filter=None,
+    time_zone=None,
+    max_workers: int = 1,
+    rate_limiter=None
+) -> pd.DataFrame:
+    """
+    Runs a conversation aggregates query for every interval and returns a tidy DataFrame:
+    interval_start/interval_end (UTC), one column per group_by dimension, metric, qualifier,
+    and the metric's stats (count, sum, min, max, ...), one row per bucket/group/metric.
+
+    Only the aggregated numbers are transferred, so dashboard-style counts and durations
+    (nOffered, tHandle, tTalk, ...) don't require pulling every conversation.
+    With max_workers > 1 intervals run concurrently under one shared GenesysRateLimiter;
+    rows always follow interval order.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+
+    payloads_json_list = build_post_analytics_conversations_aggregates_query_payloads(
+        intervals, metrics, group_by=group_by, granularity=granularity, filter=filter, time_zone=time_zone
+    )
+
+    if rate_limiter is None:
+        rate_limiter = GenesysRateLimiter()
+
+    fetch_payload = partial(
+        fetch_post_analytics_conversations_aggregates_query_payload,
+        api_client,
+        rate_limiter=rate_limiter
+    )
+    payload_results = _map_payloads(fetch_payload, payloads_json_list, max_workers)
+
+    return _aggregate_results_frame(
+        [container for results in payload_results for container in results],
+        group_by
+    )
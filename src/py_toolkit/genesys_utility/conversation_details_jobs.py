@@ -0,0 +1,146 @@
+import json
+import time
+from .rate_limit import GenesysRateLimiter
+from .conversation_schema import (
+    normalize_conversations,
+    _check_normalize,
+    _collect_conversation_pages
+)
+
+# Largest page the job results endpoint hands back per cursor step
+MAX_JOB_RESULTS_PAGE_SIZE = 1000
+
+JOB_PENDING_STATES = ("QUEUED", "PENDING")
+JOB_FAILED_STATES = ("FAILED", "CANCELLED", "EXPIRED")
+
+
+def submit_conversation_details_job(api_client, payload_json, rate_limiter=None) -> str:
+    """
+    Submits a details query payload (as built for the synchronous query) as an async job.
+    Paging is dropped since jobs return a cursor instead. Returns the job ID.
+    """
+    if rate_limiter is None:
+        rate_limiter = GenesysRateLimiter()
+
+    payload_dict = json.loads(payload_json)
+    payload_dict.pop("paging", None)
+
+    response = rate_limiter.call(api_client.post_analytics_conversations_details_jobs, payload_dict)
+    return response.job_id
+
+
+def wait_for_conversation_details_job(
+    api_client,
+    job_id: str,
+    rate_limiter=None,
+    poll_interval: float = 2.0,
+    max_poll_interval: float = 30.0,
+    timeout: float = 3600.0
+):
+    """
+    Polls a details job until it is FULFILLED, backing off between polls.
+    Raises RuntimeError if the job fails/expires and TimeoutError if it never finishes.
+    """
+    if rate_limiter is None:
+        rate_limiter = GenesysRateLimiter()
+
+    deadline = time.monotonic() + timeout
+    wait = poll_interval
+
+    while True:
+        status = rate_limiter.call(api_client.get_analytics_conversations_details_job, job_id)
+        state = status.state
+
+        if state == "FULFILLED":
+            return status
+        if state in JOB_FAILED_STATES:
+            raise RuntimeError(
+                f"Genesys details job {job_id} ended in state {state}: {status.error_message}"
+            )
+        if time.monotonic() + wait > deadline:
+            raise TimeoutError(f"Genesys details job {job_id} still {state} after {timeout} seconds.")
+
+        time.sleep(wait)
+        wait = min(wait * 1.5, max_poll_interval)
+
+
+def iter_conversation_details_job_results(
+    api_client,
+    job_id: str,
+    rate_limiter=None,
+    page_size: int = MAX_JOB_RESULTS_PAGE_SIZE
+):
+    """
+    Streams the results of a fulfilled details job, following the cursor.
+    Yields one list of conversation dicts per page.
+    """
+    if rate_limiter is None:
+        rate_limiter = GenesysRateLimiter()
+
+    cursor = None
+    while True:
+        kwargs = {"page_size": page_size}
+        if cursor:
+            kwargs["cursor"] = cursor
+
+        response_data = rate_limiter.call(
+            api_client.get_analytics_conversations_details_job_results, job_id, **kwargs
+        ).to_dict()
+
+        conversations = response_data.get('conversations') or []
+        if conversations:
+            yield conversations
+
+        cursor = response_data.get('cursor')
+        if not cursor:
+            break
+
+
+def iter_conversation_pages_for_conversations_details_job_payload(api_client, payload_json, rate_limiter=None):
+    """
+    Submits the payload as an async job, waits for it, then yields each cursor
+    page's raw list of conversation dicts.
+    """
+    if rate_limiter is None:
+        rate_limiter = GenesysRateLimiter()
+
+    job_id = submit_conversation_details_job(api_client, payload_json, rate_limiter=rate_limiter)
+    wait_for_conversation_details_job(api_client, job_id, rate_limiter=rate_limiter)
+
+    yield from iter_conversation_details_job_results(api_client, job_id, rate_limiter=rate_limiter)
+
+
+def iter_all_pages_for_conversations_details_job_payload(
+    api_client,
+    payload_json,
+    rate_limiter=None,
+    normalize: str = "json"
+):
+    """
+    Job-based counterpart of iter_all_pages_for_conversations_details_query_payload:
+    yields one normalized DataFrame per cursor page.
+    """
+    _check_normalize(normalize)
+    for conversations in iter_conversation_pages_for_conversations_details_job_payload(
+        api_client, payload_json, rate_limiter=rate_limiter
+    ):
+        yield normalize_conversations(conversations, normalize)
+
+
+def fetch_all_pages_for_conversations_details_job_payload(
+    api_client,
+    payload_json,
+    rate_limiter=None,
+    normalize: str = "json"
+):
+    """
+    Job-based counterpart of fetch_all_pages_for_conversations_details_query_payload.
+    Returns a DataFrame of conversation data.
+    """
+    _check_normalize(normalize)
+    return _collect_conversation_pages(
+        iter_conversation_pages_for_conversations_details_job_payload(
+            api_client, payload_json, rate_limiter=rate_limiter
+        ),
+        normalize
+    )
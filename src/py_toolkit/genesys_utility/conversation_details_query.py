@@ -1,7 +1,30 @@
+import os
+import glob
 import json
 import warnings
 import pandas as pd
-from typing import List, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Iterator, List, Tuple, Union
+from .rate_limit import GenesysRateLimiter
+from .extract_state import (
+    GenesysExtractStateStore,
+    details_payload_key,
+    details_interval_key,
+    details_payload_is_settled
+)
+from .conversation_details_jobs import (
+    iter_conversation_pages_for_conversations_details_job_payload,
+    iter_all_pages_for_conversations_details_job_payload,
+    fetch_all_pages_for_conversations_details_job_payload
+)
+from .conversation_schema import (
+    normalize_conversations,
+    _check_normalize,
+    _collect_conversation_pages
+)
 
 warnings.filterwarnings(
     "ignore",
@@ -14,17 +37,48 @@ warnings.filterwarnings(
     message=".*HTTPResponse.getheader.*"
 )
 
+# API limits for POST /api/v2/analytics/conversations/details/query
+MAX_PREDICATES_PER_FILTER = 100
+MAX_PAGE_SIZE = 100
+
+# "query" pages the synchronous endpoint, "jobs" uses async details jobs
+DETAILS_MODES = ("query", "jobs")
+
+def _interval_string(interval) -> str:
+    """
+    Returns a Genesys 'start/end' ISO interval.
+    Strings (e.g. from local_day_intervals) pass through unchanged;
+    (start_date, end_date) tuples keep the legacy fixed 05:00Z day boundary.
+    """
+    if isinstance(interval, str):
+        return interval
+    start_date, end_date = interval
+    return f"{start_date}T05:00:00.000Z/{end_date}T05:00:00.000Z"
+
+
 def build_post_analytics_conversations_details_query_payloads(
     df: pd.DataFrame,
     column_name: str,
-    intervals: List[Tuple[str, str]],
-    chunk_size: int = 10
+    intervals: List[Union[Tuple[str, str], str]],
+    chunk_size: int = MAX_PREDICATES_PER_FILTER,
+    page_size: int = MAX_PAGE_SIZE
 ) -> List[str]:
     """
     Splits conversation IDs into chunks and creates a JSON string for each chunk + interval.
+    Intervals are (start_date, end_date) tuples or full ISO interval strings
+    (see interval_planner.local_day_intervals for DST-correct days in a local time zone).
+    Each payload matches at most chunk_size conversations, so there is no need to split
+    the range into smaller intervals.
+    By default each chunk is packed with as many ID predicates as the API accepts
+    and pages are requested at the API's maximum size, to minimise request count.
     """
-    # Filter out NaN/None conversation IDs and convert them to str
-    all_ids = df[column_name].dropna().astype(str).tolist()
+    if not 1 <= chunk_size <= MAX_PREDICATES_PER_FILTER:
+        raise ValueError(f"chunk_size must be between 1 and {MAX_PREDICATES_PER_FILTER}.")
+    if not 1 <= page_size <= MAX_PAGE_SIZE:
+        raise ValueError(f"page_size must be between 1 and {MAX_PAGE_SIZE}.")
+
+    # Filter out NaN/None conversation IDs, convert them to str and drop repeats
+    all_ids = df[column_name].dropna().astype(str).drop_duplicates().tolist()
 
     # Split into chunks of size `chunk_size`
     chunks = [all_ids[i : i + chunk_size] for i in range(0, len(all_ids), chunk_size)]
@@ -32,16 +86,16 @@ def build_post_analytics_conversations_details_query_payloads(
     payloads_json_list = []
 
     # For each interval, build payloads for every chunk of IDs
-    for start_date, end_date in intervals:
+    for interval in intervals:
         for chunk in chunks:
             payload_dict = {
                 "order": "desc",
                 "orderBy": "conversationStart",
                 "paging": {
-                    "pageSize": 50,
+                    "pageSize": page_size,
                     "pageNumber": 1
                 },
-                "interval": f"{start_date}T05:00:00.000Z/{end_date}T05:00:00.000Z",
+                "interval": _interval_string(interval),
                 "segmentFilters": [
                     {"type": "or", "predicates": [{"dimension": "mediaType", "value": "voice"}]},
                     {
@@ -71,54 +125,413 @@ def build_post_analytics_conversations_details_query_payloads(
     return payloads_json_list
 
 
-def fetch_all_pages_for_conversations_details_query_payload(api_client, payload_json):
+def iter_conversation_pages_for_conversations_details_query_payload(
+    api_client,
+    payload_json,
+    rate_limiter=None,
+    cache=None
+):
     """
     Given a Genesys API client and a single JSON payload string,
-    iterates through all paginated results (pageNumber 1,2,3,...) until no more data.
-    Returns a DataFrame of conversation data.
+    iterates through all paginated results (pageNumber 1,2,3,...) until no more data,
+    yielding each page's raw list of conversation dicts as it arrives.
+    Every page goes through `rate_limiter` (a GenesysRateLimiter), so throttled
+    pages are retried instead of failing the whole extract.
+
+    Paging stops as soon as the reported totalHits have been read, so a last page that
+    happens to be full doesn't cost an extra request for an empty one.
+
+    If a GenesysResponseCache is passed as `cache`, each page is looked up there first
+    and fetched pages of settled intervals are stored, so reruns cost no API calls.
     """
-    frames = []
+    if rate_limiter is None:
+        rate_limiter = GenesysRateLimiter()
+
     page_number = 1
-    page_size = 50
+    page_size = json.loads(payload_json)["paging"]["pageSize"]
 
     while True:
         payload_dict = json.loads(payload_json)
         payload_dict["paging"]["pageNumber"] = page_number
 
-        # POST request
-        response_data = api_client.post_analytics_conversations_details_query(payload_dict).to_dict()
+        response_data = cache.get(payload_json, page_number) if cache is not None else None
+        if response_data is None:
+            # POST request
+            response_data = rate_limiter.call(
+                api_client.post_analytics_conversations_details_query, payload_dict
+            ).to_dict()
+            if cache is not None:
+                response_data = cache.put(payload_json, page_number, response_data)
 
-        conversations = response_data.get('conversations', [])
+        conversations = response_data.get('conversations') or []
         if not conversations:
             break  # No more data
 
-        df_page = pd.json_normalize(conversations)
-        frames.append(df_page)
+        yield conversations
 
+        total_hits = response_data.get('total_hits')
         if len(conversations) < page_size:
             break
+        if total_hits is not None and page_number * page_size >= total_hits:
+            break  # Last page was full, but there's nothing after it
         page_number += 1
 
-    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+def iter_all_pages_for_conversations_details_query_payload(
+    api_client,
+    payload_json,
+    rate_limiter=None,
+    normalize: str = "json",
+    cache=None
+):
+    """
+    Same paging as iter_conversation_pages_for_conversations_details_query_payload,
+    but yields one normalized DataFrame per page (see normalize_conversations).
+    """
+    _check_normalize(normalize)
+    for conversations in iter_conversation_pages_for_conversations_details_query_payload(
+        api_client, payload_json, rate_limiter=rate_limiter, cache=cache
+    ):
+        yield normalize_conversations(conversations, normalize)
+
+
+def fetch_all_pages_for_conversations_details_query_payload(
+    api_client,
+    payload_json,
+    rate_limiter=None,
+    normalize: str = "json",
+    cache=None
+):
+    """
+    Collects every page of a single JSON payload into one DataFrame
+    (or a dict of linked DataFrames for normalize="tables").
+    With normalize="segments"/"tables" the pages are appended into typed column buffers.
+    Pages are served from `cache` (a GenesysResponseCache) when present.
+    """
+    _check_normalize(normalize)
+    return _collect_conversation_pages(
+        iter_conversation_pages_for_conversations_details_query_payload(
+            api_client, payload_json, rate_limiter=rate_limiter, cache=cache
+        ),
+        normalize
+    )
+
+
+def _check_mode(mode: str):
+    if mode not in DETAILS_MODES:
+        raise ValueError(f"mode must be one of {list(DETAILS_MODES)}, got {mode!r}.")
+
+
+def _cache_kwargs(mode: str, cache) -> dict:
+    """
+    Keyword arguments that hand `cache` to the per-payload functions.
+    Only the synchronous query pages are cacheable.
+    """
+    if cache is None:
+        return {}
+    if mode != "query":
+        raise ValueError("cache is only supported with mode='query'.")
+    return {"cache": cache}
 
 
-def fetch_post_analytics_conversations_details_query_df(api_client, intervals, df, column_name):
+def _map_payloads(func, payloads_json_list, max_workers: int) -> list:
     """
-    1) Build JSON payloads in 10-ID chunks, across intervals.
-    2) For each payload, page through all responses.
-    3) Combine into one final DataFrame.
+    Runs func over every payload, on a bounded thread pool when max_workers > 1.
+    Results always come back in payload order.
     """
+    if max_workers == 1 or len(payloads_json_list) <= 1:
+        return [func(payload_json) for payload_json in payloads_json_list]
+
+    # executor.map yields results in submission order, so the output is stable
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, payloads_json_list))
+
+
+def fetch_post_analytics_conversations_details_query_df(
+    api_client,
+    intervals,
+    df,
+    column_name,
+    max_workers: int = 1,
+    rate_limiter=None,
+    mode: str = "query",
+    normalize: str = "json",
+    cache=None
+):
+    """
+    1) Build JSON payloads with as many IDs per chunk as the API allows, across intervals.
+    2) For each payload, page through all responses. With max_workers > 1 the
+       payloads are fanned out across a bounded thread pool.
+       All workers share one GenesysRateLimiter budget.
+    3) Combine into one final DataFrame, always in payload order.
+
+    mode="query" pages the synchronous details query; mode="jobs" runs each payload
+    as an async details job instead, which suits multi-week intervals.
+
+    normalize="json" returns one pd.json_normalize row per conversation.
+    normalize="segments" returns the declared, typed segment-level explosion
+    (see conversation_schema), built from column buffers in a single pass.
+    normalize="tables" returns a dict of linked conversations/participants/sessions/
+    segments/metrics DataFrames, joinable on conversation_id/participant_id/session_id.
+
+    Pass a GenesysResponseCache as `cache` to reuse pages of settled intervals
+    across runs instead of re-querying them (mode="query" only).
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+    _check_mode(mode)
+    _check_normalize(normalize)
+    cache_kwargs = _cache_kwargs(mode, cache)
+
     payloads_json_list = build_post_analytics_conversations_details_query_payloads(
-        df, column_name, intervals, chunk_size=10
+        df, column_name, intervals
+    )
+
+    if rate_limiter is None:
+        rate_limiter = GenesysRateLimiter()
+
+    if normalize in ("segments", "tables"):
+        # Workers only fetch; every page lands in one set of column buffers, in order
+        page_functions = {
+            "query": iter_conversation_pages_for_conversations_details_query_payload,
+            "jobs": iter_conversation_pages_for_conversations_details_job_payload,
+        }
+        iter_pages = partial(page_functions[mode], api_client, rate_limiter=rate_limiter, **cache_kwargs)
+        payload_pages = _map_payloads(lambda p: list(iter_pages(p)), payloads_json_list, max_workers)
+        return _collect_conversation_pages(
+            (conversations for pages in payload_pages for conversations in pages),
+            normalize
+        )
+
+    fetch_functions = {
+        "query": fetch_all_pages_for_conversations_details_query_payload,
+        "jobs": fetch_all_pages_for_conversations_details_job_payload,
+    }
+    fetch_payload = partial(
+        fetch_functions[mode],
+        api_client,
+        rate_limiter=rate_limiter,
+        **cache_kwargs
     )
+    payload_frames = _map_payloads(fetch_payload, payloads_json_list, max_workers)
 
-    all_frames = []
-    for payload_json in payloads_json_list:
-        df_this_payload = fetch_all_pages_for_conversations_details_query_payload(api_client, payload_json)
-        if not df_this_payload.empty:
-            all_frames.append(df_this_payload)
+    all_frames = [df_this_payload for df_this_payload in payload_frames if not df_this_payload.empty]
 
     return pd.concat(all_frames, ignore_index=True) if all_frames else pd.DataFrame()
 
 
+def iter_post_analytics_conversations_details_query_batches(
+    api_client,
+    intervals,
+    df,
+    column_name,
+    max_workers: int = 1,
+    rate_limiter=None,
+    mode: str = "query",
+    normalize: str = "json",
+    cache=None
+) -> Iterator[pd.DataFrame]:
+    """
+    Generator version of fetch_post_analytics_conversations_details_query_df.
+    Yields one normalized DataFrame (or dict of tables) per page, in payload order,
+    so an extract never has to be held in memory at once.
+
+    With max_workers > 1 at most `max_workers` payloads are in flight; each one's pages
+    are only buffered until it is that payload's turn to be yielded.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+    _check_mode(mode)
+    _check_normalize(normalize)
+    cache_kwargs = _cache_kwargs(mode, cache)
+    iter_functions = {
+        "query": iter_all_pages_for_conversations_details_query_payload,
+        "jobs": iter_all_pages_for_conversations_details_job_payload,
+    }
+
+    payloads_json_list = build_post_analytics_conversations_details_query_payloads(
+        df, column_name, intervals
+    )
+
+    if rate_limiter is None:
+        rate_limiter = GenesysRateLimiter()
+
+    iter_payload = partial(
+        iter_functions[mode], api_client, rate_limiter=rate_limiter, normalize=normalize, **cache_kwargs
+    )
+
+    if max_workers == 1 or len(payloads_json_list) <= 1:
+        for payload_json in payloads_json_list:
+            yield from iter_payload(payload_json)
+        return
+
+    def collect_payload(payload_json):
+        return list(iter_payload(payload_json))
+
+    payloads = iter(payloads_json_list)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque(executor.submit(collect_payload, p) for p in islice(payloads, max_workers))
+        try:
+            while pending:
+                pages = pending.popleft().result()
+                next_payload = next(payloads, None)
+                if next_payload is not None:
+                    pending.append(executor.submit(collect_payload, next_payload))
+                yield from pages
+        finally:
+            # Consumer stopped early: don't start payloads nobody will read
+            for future in pending:
+                future.cancel()
+
+
+def write_post_analytics_conversations_details_query_batches(
+    api_client,
+    intervals,
+    df,
+    column_name,
+    output_dir: str,
+    file_format: str = "parquet",
+    max_workers: int = 1,
+    rate_limiter=None,
+    mode: str = "query",
+    normalize: str = "json",
+    cache=None
+) -> List[str]:
+    """
+    Streams every page of the extract straight to disk as numbered part files
+    (part-00000.parquet, part-00001.parquet, ...) in `output_dir`, keeping memory flat.
+    With normalize="tables" each table gets its own subfolder (output_dir/segments/...).
+    file_format is "parquet" (needs pyarrow or fastparquet) or "csv".
+    Returns the list of files written.
+    """
+    if file_format not in ("parquet", "csv"):
+        raise ValueError(f"file_format must be 'parquet' or 'csv', got {file_format!r}.")
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    written = []
+    batches = iter_post_analytics_conversations_details_query_batches(
+        api_client, intervals, df, column_name,
+        max_workers=max_workers, rate_limiter=rate_limiter, mode=mode, normalize=normalize,
+        cache=cache
+    )
+    for part_number, page in enumerate(batches):
+        written.extend(_write_result(page, output_dir, f"part-{part_number:05d}", file_format))
+
+    return written
+
+
+def _write_result(result, output_dir: str, name: str, file_format: str) -> List[str]:
+    """
+    Writes a DataFrame to output_dir/<name>.<file_format>, or a dict of tables
+    to output_dir/<table>/<name>.<file_format>. Returns the paths written.
+    """
+    tables = result.items() if isinstance(result, dict) else [("", result)]
+    written = []
+    for table, df_table in tables:
+        table_dir = os.path.join(output_dir, table)
+        os.makedirs(table_dir, exist_ok=True)
+        path = os.path.normpath(os.path.join(table_dir, f"{name}.{file_format}"))
+        if file_format == "parquet":
+            df_table.to_parquet(path, index=False)
+        else:
+            df_table.to_csv(path, index=False)
+        written.append(path)
+    return written
+
+
+def _remove_results(output_dir: str, name_pattern: str, file_format: str):
+    """
+    Deletes the files _write_result wrote for names matching `name_pattern` (a glob),
+    whether directly in output_dir or in a per-table subfolder.
+    """
+    root = glob.escape(output_dir)
+    for folder in (root, os.path.join(root, "*")):
+        for path in glob.glob(os.path.join(folder, f"{name_pattern}.{file_format}")):
+            os.remove(path)
+
+
+def fetch_post_analytics_conversations_details_query_incremental(
+    api_client,
+    intervals,
+    df,
+    column_name,
+    output_dir: str,
+    state_store=None,
+    file_format: str = "parquet",
+    settle_hours: float = 24.0,
+    max_workers: int = 1,
+    rate_limiter=None,
+    mode: str = "query",
+    normalize: str = "json"
+) -> List[str]:
+    """
+    Incremental, resumable version of fetch_post_analytics_conversations_details_query_df.
+
+    Each payload's rows are written to output_dir as <payload key>.<file_format> and then
+    recorded in `state_store` (a GenesysExtractStateStore), along with every conversation
+    ID it covered. Per interval, only the IDs not yet recorded are sorted and chunked into
+    payloads, so reruns only fetch new work (even when new IDs are added to df) and a
+    crashed run resumes where it stopped. Payloads whose interval ended less than
+    `settle_hours` ago are re-fetched every run and never recorded, because their
+    conversations can still change. Their rows go to open-<interval key>-<n>.<file_format>,
+    and those files are deleted whenever the interval is fetched again, so a refetch with
+    a different set of IDs never leaves an earlier run's rows behind.
+
+    Returns the files written by this run.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+    if file_format not in ("parquet", "csv"):
+        raise ValueError(f"file_format must be 'parquet' or 'csv', got {file_format!r}.")
+    _check_mode(mode)
+    _check_normalize(normalize)
+
+    if state_store is None:
+        state_store = GenesysExtractStateStore()
+    if rate_limiter is None:
+        rate_limiter = GenesysRateLimiter()
+
+    all_ids = sorted(df[column_name].dropna().astype(str).unique())
+    pending = []
+    for interval in intervals:
+        interval_string = _interval_string(interval)
+        done = state_store.completed_conversation_ids(interval_string, all_ids)
+        remaining = [conversation_id for conversation_id in all_ids if conversation_id not in done]
+        if not remaining:
+            continue
+
+        # Rows an earlier run fetched while the interval was still open are replaced by this fetch
+        open_name = f"open-{details_interval_key(interval_string)}"
+        _remove_results(output_dir, f"{open_name}-*", file_format)
+        payloads_json_list = build_post_analytics_conversations_details_query_payloads(
+            pd.DataFrame({column_name: remaining}), column_name, [interval]
+        )
+        for part_number, payload_json in enumerate(payloads_json_list):
+            if details_payload_is_settled(payload_json, settle_hours):
+                name = details_payload_key(payload_json)
+            else:
+                name = f"{open_name}-{part_number:05d}"
+            pending.append((name, payload_json))
+
+    fetch_functions = {
+        "query": fetch_all_pages_for_conversations_details_query_payload,
+        "jobs": fetch_all_pages_for_conversations_details_job_payload,
+    }
+    fetch_payload = partial(
+        fetch_functions[mode], api_client, rate_limiter=rate_limiter, normalize=normalize
+    )
+
+    written = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(fetch_payload, [payload_json for _, payload_json in pending])
+        # Each payload is written and recorded as soon as it's in, so a crash loses at most the in-flight ones
+        for (name, payload_json), result in zip(pending, results):
+            paths = _write_result(result, output_dir, name, file_format)
+            written.extend(paths)
+
+            if details_payload_is_settled(payload_json, settle_hours):
+                row_count = len(result["conversations"] if isinstance(result, dict) else result)
+                state_store.mark_complete(payload_json, row_count, result_path=";".join(paths))
 
+    return written
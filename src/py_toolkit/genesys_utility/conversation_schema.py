@@ -0,0 +1,256 @@
+import pandas as pd
+
+# Declared columns for the segment-level explosion of a details response.
+# Keys match the snake_case fields of the PureCloud SDK's to_dict() output;
+# values are the dtype each column is built with.
+CONVERSATION_SCHEMA = {
+    "conversation_id": "string",
+    "conversation_start": "datetime",
+    "conversation_end": "datetime",
+    "originating_direction": "category",
+    "conversation_initiator": "category",
+    "customer_participation": "boolean",
+    "external_tag": "string",
+    "media_stats_min_conversation_mos": "float",
+    "media_stats_min_conversation_r_factor": "float",
+}
+
+PARTICIPANT_SCHEMA = {
+    "participant_id": "string",
+    "participant_name": "string",
+    "purpose": "category",
+    "user_id": "string",
+    "external_contact_id": "string",
+    "team_id": "string",
+}
+
+SESSION_SCHEMA = {
+    "session_id": "string",
+    "media_type": "category",
+    "direction": "category",
+    "ani": "string",
+    "dnis": "string",
+    "session_dnis": "string",
+    "address_from": "string",
+    "address_to": "string",
+    "remote": "string",
+    "provider": "category",
+    "outbound_campaign_id": "string",
+    "recording": "boolean",
+}
+
+SEGMENT_SCHEMA = {
+    "segment_type": "category",
+    "segment_start": "datetime",
+    "segment_end": "datetime",
+    "queue_id": "string",
+    "disconnect_type": "category",
+    "wrap_up_code": "string",
+    "wrap_up_note": "string",
+    "conference": "boolean",
+    "error_code": "string",
+}
+
+METRIC_SCHEMA = {
+    "name": "category",
+    "value": "Int64",
+    "emit_date": "datetime",
+}
+
+# One row per segment, carrying its conversation/participant/session context
+SEGMENT_EXPLOSION_SCHEMA = {
+    **CONVERSATION_SCHEMA,
+    **PARTICIPANT_SCHEMA,
+    **SESSION_SCHEMA,
+    **SEGMENT_SCHEMA,
+}
+
+# Linked tables: each child table carries the keys of every level above it
+CONVERSATION_TABLE_SCHEMAS = {
+    "conversations": CONVERSATION_SCHEMA,
+    "participants": {"conversation_id": "string", **PARTICIPANT_SCHEMA},
+    "sessions": {"conversation_id": "string", "participant_id": "string", **SESSION_SCHEMA},
+    "segments": {
+        "conversation_id": "string", "participant_id": "string", "session_id": "string",
+        "segment_index": "Int64", **SEGMENT_SCHEMA,
+    },
+    "metrics": {
+        "conversation_id": "string", "participant_id": "string", "session_id": "string",
+        **METRIC_SCHEMA,
+    },
+}
+
+# "json" keeps the pd.json_normalize shape (one row per conversation, nested lists);
+# "segments" uses the declared segment-level explosion above;
+# "tables" returns the linked CONVERSATION_TABLE_SCHEMAS tables as a dict of DataFrames
+NORMALIZE_MODES = ("json", "segments", "tables")
+
+
+def _typed_column(values: list, dtype: str) -> pd.Series:
+    """
+    Builds one column from a buffer of raw values with its declared dtype.
+    """
+    if dtype == "datetime":
+        return pd.Series(pd.to_datetime(values, utc=True, errors="coerce"), dtype="datetime64[ns, UTC]")
+    if dtype == "float":
+        return pd.Series(values, dtype="float64")
+    return pd.Series(values, dtype=dtype)
+
+
+def _build_frame(buffers: dict, schema: dict) -> pd.DataFrame:
+    return pd.DataFrame({
+        column: _typed_column(buffers[column], dtype)
+        for column, dtype in schema.items()
+    })
+
+
+class ConversationSegmentBuffer:
+    """
+    Per-column buffers for the segment-level explosion of conversation pages.
+
+    Pages are appended as raw SDK dicts; each declared column is only materialized
+    (and typed) once, in to_frame(), so no per-page frames are built or concatenated.
+    Conversations, participants or sessions with no children still get one row.
+    """
+
+    def __init__(self):
+        self._buffers = {column: [] for column in SEGMENT_EXPLOSION_SCHEMA}
+        self.row_count = 0
+
+    def append_page(self, conversations: list):
+        """
+        Appends every segment of a page of conversation dicts to the column buffers.
+        """
+        buffers = self._buffers
+        empty = {}
+
+        for conversation in conversations:
+            participants = conversation.get("participants") or [empty]
+            for participant in participants:
+                sessions = participant.get("sessions") or [empty]
+                for session in sessions:
+                    segments = session.get("segments") or [empty]
+                    for segment in segments:
+                        for source, columns in (
+                            (conversation, CONVERSATION_SCHEMA),
+                            (participant, PARTICIPANT_SCHEMA),
+                            (session, SESSION_SCHEMA),
+                            (segment, SEGMENT_SCHEMA),
+                        ):
+                            for column in columns:
+                                buffers[column].append(source.get(column))
+                        self.row_count += 1
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Returns the buffered rows as a DataFrame with the declared columns and dtypes.
+        An empty buffer still returns every declared column.
+        """
+        return _build_frame(self._buffers, SEGMENT_EXPLOSION_SCHEMA)
+
+
+class ConversationTablesBuffer:
+    """
+    Per-column buffers for the linked conversations/participants/sessions/segments/metrics
+    tables. A single walk over each page fills all five tables; every child row carries
+    conversation_id (and participant_id/session_id where applicable) to join on.
+    """
+
+    def __init__(self):
+        self._buffers = {
+            table: {column: [] for column in schema}
+            for table, schema in CONVERSATION_TABLE_SCHEMAS.items()
+        }
+
+    def append_page(self, conversations: list):
+        """
+        Appends a page of conversation dicts to the table buffers.
+        """
+        conv_buf = self._buffers["conversations"]
+        part_buf = self._buffers["participants"]
+        sess_buf = self._buffers["sessions"]
+        seg_buf = self._buffers["segments"]
+        metric_buf = self._buffers["metrics"]
+
+        for conversation in conversations:
+            conversation_id = conversation.get("conversation_id")
+            for column in CONVERSATION_SCHEMA:
+                conv_buf[column].append(conversation.get(column))
+
+            for participant in conversation.get("participants") or []:
+                participant_id = participant.get("participant_id")
+                part_buf["conversation_id"].append(conversation_id)
+                for column in PARTICIPANT_SCHEMA:
+                    part_buf[column].append(participant.get(column))
+
+                for session in participant.get("sessions") or []:
+                    session_id = session.get("session_id")
+                    sess_buf["conversation_id"].append(conversation_id)
+                    sess_buf["participant_id"].append(participant_id)
+                    for column in SESSION_SCHEMA:
+                        sess_buf[column].append(session.get(column))
+
+                    for segment_index, segment in enumerate(session.get("segments") or []):
+                        seg_buf["conversation_id"].append(conversation_id)
+                        seg_buf["participant_id"].append(participant_id)
+                        seg_buf["session_id"].append(session_id)
+                        seg_buf["segment_index"].append(segment_index)
+                        for column in SEGMENT_SCHEMA:
+                            seg_buf[column].append(segment.get(column))
+
+                    for metric in session.get("metrics") or []:
+                        metric_buf["conversation_id"].append(conversation_id)
+                        metric_buf["participant_id"].append(participant_id)
+                        metric_buf["session_id"].append(session_id)
+                        for column in METRIC_SCHEMA:
+                            metric_buf[column].append(metric.get(column))
+
+    def to_frames(self) -> dict:
+        """
+        Returns {"conversations": df, "participants": df, "sessions": df,
+        "segments": df, "metrics": df}, each typed per CONVERSATION_TABLE_SCHEMAS.
+        """
+        return {
+            table: _build_frame(self._buffers[table], schema)
+            for table, schema in CONVERSATION_TABLE_SCHEMAS.items()
+        }
+
+
+def _check_normalize(normalize: str):
+    if normalize not in NORMALIZE_MODES:
+        raise ValueError(f"normalize must be one of {list(NORMALIZE_MODES)}, got {normalize!r}.")
+
+
+def normalize_conversations(conversations: list, normalize: str = "json"):
+    """
+    Normalizes one page of conversation dicts.
+    normalize="json" uses pd.json_normalize; normalize="segments" returns the
+    typed, declared segment-level explosion; normalize="tables" returns a dict of
+    linked conversations/participants/sessions/segments/metrics DataFrames.
+    """
+    _check_normalize(normalize)
+    if normalize == "json":
+        return pd.json_normalize(conversations)
+    return _collect_conversation_pages([conversations], normalize)
+
+
+def _collect_conversation_pages(pages, normalize: str = "json"):
+    """
+    Combines an iterable of raw conversation pages into one result.
+    "segments" and "tables" append every page into a single set of column buffers;
+    "json" normalizes each page and concatenates them.
+    """
+    if normalize == "segments":
+        buffer = ConversationSegmentBuffer()
+        for conversations in pages:
+            buffer.append_page(conversations)
+        return buffer.to_frame()
+
+    if normalize == "tables":
+        buffer = ConversationTablesBuffer()
+        for conversations in pages:
+            buffer.append_page(conversations)
+        return buffer.to_frames()
+
+    frames = [pd.json_normalize(conversations) for conversations in pages]
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
@@ -0,0 +1,136 @@
+import os
+import json
+import hashlib
+from datetime import datetime, timedelta, timezone
+import pandas as pd
+from .._sqlite_store import SQLiteStore
+from .common import _get_env_path
+
+
+def _get_state_path() -> str:
+    """
+    Returns the default state database path, next to the toolkit's .env:
+        ~/Documents/py_toolkit/genesys_extract_state.sqlite
+    """
+    return os.path.join(os.path.dirname(_get_env_path()), "genesys_extract_state.sqlite")
+
+
+def details_payload_key(payload_json: str) -> str:
+    """
+    Stable hash of a details payload (interval + filters + ID chunk).
+    Paging is ignored, so the same work always gets the same key.
+    """
+    payload_dict = json.loads(payload_json)
+    payload_dict.pop("paging", None)
+    canonical = json.dumps(payload_dict, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def details_interval_key(interval: str) -> str:
+    """
+    Stable hash of a 'start/end' ISO interval, for naming files that belong to the
+    whole interval rather than to one payload.
+    """
+    return hashlib.sha256(interval.encode("utf-8")).hexdigest()
+
+
+def details_payload_is_settled(payload_json: str, settle_hours: float = 24.0) -> bool:
+    """
+    True once the payload's interval ended more than `settle_hours` ago,
+    i.e. Genesys is no longer expected to change its conversations.
+    """
+    interval_end = pd.Timestamp(json.loads(payload_json)["interval"].split("/")[1])
+    if interval_end.tzinfo is None:
+        interval_end = interval_end.tz_localize("UTC")
+    return interval_end.to_pydatetime() + timedelta(hours=settle_hours) <= datetime.now(timezone.utc)
+
+
+class GenesysExtractStateStore(SQLiteStore):
+    """
+    SQLite record of which details payloads an extract has already fetched, so a
+    rerun after a crash or throttling picks up where the last one stopped.
+
+    Completion is also kept per (interval, conversation ID), so a rerun with more IDs
+    only fetches the new ones, however they fall into 100-ID chunks.
+    """
+
+    def __init__(self, path: str = None):
+        super().__init__(
+            path or _get_state_path(),
+            """
+            CREATE TABLE IF NOT EXISTS completed_payloads (
+                payload_key TEXT PRIMARY KEY,
+                interval TEXT,
+                id_count INTEGER,
+                row_count INTEGER,
+                result_path TEXT,
+                completed_at TEXT
+            );
+            CREATE TABLE IF NOT EXISTS completed_conversations (
+                interval TEXT,
+                conversation_id TEXT,
+                completed_at TEXT,
+                PRIMARY KEY (interval, conversation_id)
+            );
+            """
+        )
+
+    def completed_conversation_ids(self, interval: str, conversation_ids) -> set:
+        """
+        Returns the subset of conversation_ids already fetched for `interval`
+        (a 'start/end' ISO interval, as sent in the payload).
+        """
+        conversation_ids = list(conversation_ids)
+        found = set()
+        with self._connect() as conn:
+            for i in range(0, len(conversation_ids), 500):
+                chunk = conversation_ids[i : i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT conversation_id FROM completed_conversations "
+                    f"WHERE interval = ? AND conversation_id IN ({placeholders})",
+                    [interval, *chunk]
+                ).fetchall()
+                found.update(row[0] for row in rows)
+        return found
+
+    def mark_complete(self, payload_json: str, row_count: int, result_path: str = None):
+        """
+        Records a payload, and each conversation ID it filters on, as fully fetched
+        (and where its rows were written, if anywhere).
+        """
+        payload_dict = json.loads(payload_json)
+        id_count = sum(
+            len(group.get("predicates", []))
+            for group in payload_dict.get("conversationFilters", [])
+        )
+        conversation_ids = [
+            predicate.get("value")
+            for group in payload_dict.get("conversationFilters", [])
+            for predicate in group.get("predicates", [])
+            if predicate.get("dimension") == "conversationId"
+        ]
+        completed_at = datetime.now(timezone.utc).isoformat()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO completed_payloads VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    details_payload_key(payload_json),
+                    payload_dict.get("interval"),
+                    id_count,
+                    row_count,
+                    result_path,
+                    completed_at,
+                )
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO completed_conversations VALUES (?, ?, ?)",
+                [(payload_dict.get("interval"), conversation_id, completed_at) for conversation_id in conversation_ids]
+            )
+
+    def completed_payloads(self) -> pd.DataFrame:
+        """
+        Returns the manifest of completed payloads as a DataFrame.
+        """
+        with self._connect() as conn:
+            return pd.read_sql_query("SELECT * FROM completed_payloads ORDER BY completed_at", conn)
@@ -0,0 +1,43 @@
+import pandas as pd
+from typing import List
+
+DEFAULT_TIME_ZONE = "America/New_York"
+
+
+def format_genesys_interval(start, end) -> str:
+    """
+    Formats two timestamps as a Genesys 'start/end' ISO interval in UTC.
+    """
+    def fmt(ts):
+        return pd.Timestamp(ts).tz_convert("UTC").strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+    return f"{fmt(start)}/{fmt(end)}"
+
+
+def _local_edges(start_date, end_date, time_zone: str, freq: str) -> pd.DatetimeIndex:
+    """
+    Boundaries from local midnight of start_date to local midnight of end_date,
+    every `freq` of local wall-clock time.
+    """
+    return pd.date_range(
+        pd.Timestamp(start_date).tz_localize(time_zone),
+        pd.Timestamp(end_date).tz_localize(time_zone),
+        freq=freq
+    )
+
+
+def local_day_intervals(start_date, end_date, time_zone: str = DEFAULT_TIME_ZONE, days: int = 1) -> List[str]:
+    """
+    Splits [start_date, end_date) into `days`-long intervals that start and end at local
+    midnight in `time_zone`, as UTC Genesys interval strings. DST days come out as 23 or
+    25 hours instead of the fixed 05:00Z boundary.
+    """
+    if days < 1:
+        raise ValueError("days must be at least 1.")
+
+    edges = _local_edges(start_date, end_date, time_zone, f"{days}D")
+    end = pd.Timestamp(end_date).tz_localize(time_zone)
+    if len(edges) == 0 or edges[-1] < end:
+        edges = edges.append(pd.DatetimeIndex([end]))
+
+    return [format_genesys_interval(start, stop) for start, stop in zip(edges[:-1], edges[1:]) if start < stop]
@@ -0,0 +1,133 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from PureCloudPlatformClientV2.rest import ApiException
+
+# Genesys answers 429 when throttled and occasionally 503 while shedding load
+RETRYABLE_STATUSES = (429, 503)
+
+
+def _get_header(headers, name):
+    """
+    Case-insensitive header lookup that works for plain dicts and urllib3 header objects.
+    """
+    if not headers:
+        return None
+    for key, value in dict(headers).items():
+        if key.lower() == name.lower():
+            return value
+    return None
+
+
+def _parse_retry_after(headers):
+    """
+    Returns the number of seconds Genesys asked us to wait, or None.
+    Reads Retry-After (seconds or HTTP date) and falls back to inin-ratelimit-reset.
+    """
+    retry_after = _get_header(headers, "Retry-After")
+    if retry_after is not None:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+            except (TypeError, ValueError):
+                pass
+
+    reset = _get_header(headers, "inin-ratelimit-reset")
+    if reset is not None:
+        try:
+            return max(float(reset), 0.0)
+        except ValueError:
+            pass
+
+    return None
+
+
+class GenesysRateLimiter:
+    """
+    Thread-safe token bucket shared by every worker calling the Genesys API.
+
+    Each call takes one token; tokens refill at `requests_per_minute`.
+    A throttled response pauses the whole bucket (not just the failing worker)
+    for the Retry-After period, then the call is retried with jittered backoff.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = 300,
+        burst: int = None,
+        max_retries: int = 5,
+        base_backoff: float = 1.0,
+        max_backoff: float = 60.0
+    ):
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive.")
+
+        self.rate = requests_per_minute / 60.0
+        self.capacity = float(burst if burst is not None else max(1, int(self.rate)))
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Blocks until a token is available and the bucket is not paused.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now > self._last_refill:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+                    self._last_refill = now
+
+                wait = self._blocked_until - now
+                if wait <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """
+        Stops every worker sharing this bucket from calling for `seconds`
+        and drains the tokens, so nobody bursts when the pause ends.
+        """
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+            self._last_refill = self._blocked_until
+
+    def _backoff_seconds(self, attempt: int, headers) -> float:
+        retry_after = _parse_retry_after(headers)
+        if retry_after is not None:
+            # Small jitter keeps the workers from waking up in lockstep
+            return retry_after + random.uniform(0, self.base_backoff)
+        # Full jitter exponential backoff
+        return random.uniform(0, min(self.max_backoff, self.base_backoff * (2 ** attempt)))
+
+    def call(self, func, *args, **kwargs):
+        """
+        Calls func(*args, **kwargs) under the rate limit, retrying throttled responses.
+        Non-retryable errors, and the last throttled error, are re-raised.
+        """
+        attempt = 0
+        while True:
+            self.acquire()
+            try:
+                return func(*args, **kwargs)
+            except ApiException as e:
+                if e.status not in RETRYABLE_STATUSES or attempt >= self.max_retries:
+                    raise
+                wait = self._backoff_seconds(attempt, e.headers)
+                self.pause(wait)
+                attempt += 1
@@ -0,0 +1,146 @@
+import os
+import json
+import time
+from datetime import date, datetime
+from .._sqlite_store import SQLiteStore
+from .common import _get_env_path
+from .extract_state import details_payload_key, details_payload_is_settled
+
+
+def _json_default(value):
+    # to_dict() leaves dates and times as datetime objects
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _get_cache_path() -> str:
+    """
+    Returns the default response cache path, next to the toolkit's .env:
+        ~/Documents/py_toolkit/genesys_response_cache.sqlite
+    """
+    return os.path.join(os.path.dirname(_get_env_path()), "genesys_response_cache.sqlite")
+
+
+class GenesysResponseCache(SQLiteStore):
+    """
+    On-disk cache of details query responses, keyed by payload hash and page number.
+
+    Only payloads whose interval has settled are stored, since those never change.
+    Entries older than `ttl_seconds` are treated as misses and dropped; once the cache
+    holds more than `max_bytes`, the least recently used pages are evicted.
+    Pages are stored as JSON, with dates and times as ISO 8601 strings.
+    """
+
+    def __init__(
+        self,
+        path: str = None,
+        ttl_seconds: float = 30 * 24 * 3600,
+        max_bytes: int = 1024 ** 3,
+        settle_hours: float = 24.0
+    ):
+        if ttl_seconds is not None and ttl_seconds < 0:
+            raise ValueError("ttl_seconds must be non-negative (or None to never expire).")
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1.")
+
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.settle_hours = settle_hours
+
+        super().__init__(
+            path or _get_cache_path(),
+            """
+            DROP TABLE IF EXISTS response_pages;  -- pickled pages from older versions, never loaded
+            CREATE TABLE IF NOT EXISTS response_json_pages (
+                payload_key TEXT,
+                page_size INTEGER,
+                page_number INTEGER,
+                response TEXT,
+                size INTEGER,
+                created_at REAL,
+                last_used REAL,
+                PRIMARY KEY (payload_key, page_size, page_number)
+            );
+            """
+        )
+
+    @staticmethod
+    def _page_key(payload_json: str, page_number: int) -> tuple:
+        page_size = json.loads(payload_json).get("paging", {}).get("pageSize")
+        return details_payload_key(payload_json), page_size, page_number
+
+    def get(self, payload_json: str, page_number: int):
+        """
+        Returns the cached response dict for this payload page, or None on a miss.
+        """
+        key = self._page_key(payload_json, page_number)
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT response, created_at FROM response_json_pages "
+                "WHERE payload_key = ? AND page_size = ? AND page_number = ?",
+                key
+            ).fetchone()
+            if row is None:
+                return None
+
+            response, created_at = row
+            if self.ttl_seconds is not None and created_at + self.ttl_seconds <= now:
+                conn.execute(
+                    "DELETE FROM response_json_pages WHERE payload_key = ? AND page_size = ? AND page_number = ?",
+                    key
+                )
+                return None
+
+            conn.execute(
+                "UPDATE response_json_pages SET last_used = ? "
+                "WHERE payload_key = ? AND page_size = ? AND page_number = ?",
+                (now, *key)
+            )
+        return json.loads(response)
+
+    def put(self, payload_json: str, page_number: int, response_data: dict) -> dict:
+        """
+        Stores a response dict for this payload page, if the payload's interval has settled,
+        then evicts least recently used pages until the cache fits in max_bytes.
+        Returns the page as get() will return it (dates and times as strings), so
+        callers can treat fresh and cached pages alike.
+        """
+        response = json.dumps(response_data, default=_json_default)
+        if not details_payload_is_settled(payload_json, self.settle_hours):
+            return json.loads(response)
+
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO response_json_pages VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (*self._page_key(payload_json, page_number), response, len(response), now, now)
+            )
+            self._evict(conn)
+        return json.loads(response)
+
+    def _evict(self, conn):
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM response_json_pages").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        doomed = []
+        for row in conn.execute(
+            "SELECT payload_key, page_size, page_number, size FROM response_json_pages ORDER BY last_used, created_at"
+        ):
+            if total <= self.max_bytes:
+                break
+            doomed.append(row[:3])
+            total -= row[3]
+        conn.executemany(
+            "DELETE FROM response_json_pages WHERE payload_key = ? AND page_size = ? AND page_number = ?",
+            doomed
+        )
+
+    def clear(self):
+        """
+        Drops every cached page.
+        """
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM response_json_pages")
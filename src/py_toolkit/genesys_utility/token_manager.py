@@ -0,0 +1,211 @@
+import re
+import time
+import base64
+import hashlib
+import threading
+import requests
+import PureCloudPlatformClientV2 as genesys
+from .transport import get_genesys_transport
+
+# Lifetime Genesys gives client credentials tokens by default (24 hours),
+# assumed only if a token response leaves out expires_in
+DEFAULT_TOKEN_LIFETIME = 86400
+# Tokens are refreshed this many seconds before they lapse
+DEFAULT_REFRESH_MARGIN = 300
+
+
+class GenesysTokenManager:
+    """
+    Caches one access token with its expiry and refreshes it before it lapses.
+
+    `fetch_token()` must return (access_token, expires_in_seconds); expires_in may be None,
+    in which case `default_lifetime` is assumed, and if that is None too the token is
+    never reused. Listeners are called with every new token, and with auto_refresh a
+    background timer fetches the next token `refresh_margin` seconds before expiry.
+    """
+
+    def __init__(
+        self,
+        fetch_token,
+        refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+        default_lifetime: float = None,
+        auto_refresh: bool = True
+    ):
+        self.fetch_token = fetch_token
+        self.refresh_margin = refresh_margin
+        self.default_lifetime = default_lifetime
+        self.auto_refresh = auto_refresh
+
+        self.access_token = None
+        self.expires_at = None
+        self._listeners = []
+        self._timer = None
+        self._lock = threading.RLock()
+
+    def _is_fresh(self) -> bool:
+        return (
+            self.access_token is not None
+            and self.expires_at is not None
+            and time.monotonic() < self.expires_at - self.refresh_margin
+        )
+
+    def get_token(self, force_refresh: bool = False) -> str:
+        """
+        Returns the cached token, fetching a new one if there is none or it is about to lapse.
+        """
+        with self._lock:
+            if force_refresh or not self._is_fresh():
+                self._refresh()
+            return self.access_token
+
+    def _refresh(self):
+        access_token, expires_in = self.fetch_token()
+        lifetime = expires_in if expires_in is not None else self.default_lifetime
+
+        self.access_token = access_token
+        self.expires_at = time.monotonic() + lifetime if lifetime is not None else None
+
+        for listener in list(self._listeners):
+            listener(access_token)
+        self._schedule_refresh(lifetime)
+
+    def _schedule_refresh(self, lifetime):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self.auto_refresh or lifetime is None:
+            return
+
+        self._timer = threading.Timer(max(lifetime - self.refresh_margin, 0), self._refresh_in_background)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _refresh_in_background(self):
+        try:
+            self.get_token(force_refresh=True)
+        except Exception:
+            # Leave the stale token in place; the next get_token() retries the fetch
+            pass
+
+    def add_listener(self, callback):
+        """
+        Registers callback(access_token), called whenever a new token is fetched.
+        """
+        with self._lock:
+            if callback not in self._listeners:
+                self._listeners.append(callback)
+
+    def invalidate(self):
+        """
+        Drops the cached token (e.g. after a 401) so the next get_token() fetches a new one.
+        """
+        with self._lock:
+            self.access_token = None
+            self.expires_at = None
+            self._schedule_refresh(None)
+
+
+_managers = {}
+_managers_lock = threading.Lock()
+
+
+def get_token_manager(
+    client_id,
+    client_secret,
+    host,
+    fetch_token,
+    transport=None,
+    **kwargs
+) -> GenesysTokenManager:
+    """
+    Returns the process-wide GenesysTokenManager for these credentials, host and
+    `transport` (default: get_genesys_transport()), creating it with `fetch_token`
+    (and any GenesysTokenManager kwargs) on first use.
+
+    Only the first caller's fetch_token is kept, so it must do nothing but a client
+    credentials grant over `transport`; side effects such as saving the token belong
+    in a listener. Keying on the transport means a reconfigured or per-org transport
+    gets its own manager instead of refreshing over another caller's.
+    """
+    if transport is None:
+        transport = get_genesys_transport()
+    secret_hash = hashlib.sha256(client_secret.encode("utf-8")).hexdigest()
+    key = (client_id, secret_hash, host, transport)
+    with _managers_lock:
+        if key not in _managers:
+            _managers[key] = GenesysTokenManager(fetch_token, **kwargs)
+        return _managers[key]
+
+
+def _resolve_api_host(region) -> str:
+    """
+    Returns the API host URL for a PureCloudRegionHosts member, its name ("us_east_2"),
+    an environment domain ("mypurecloud.com") or an API host URL.
+    """
+    if isinstance(region, genesys.PureCloudRegionHosts):
+        return region.get_api_host()
+    if isinstance(region, str) and region:
+        if region in genesys.PureCloudRegionHosts.__members__:
+            return genesys.PureCloudRegionHosts[region].get_api_host()
+        if region.startswith("https://"):
+            return region.rstrip("/")
+        return f"https://api.{region}"
+    raise ValueError(f"Unrecognized Genesys region: {region!r}.")
+
+
+def _client_credentials_token(client_id, client_secret, host=None, transport=None):
+    """
+    Posts a client credentials grant to /oauth/token on the login host for API `host`
+    (default: genesys.configuration.host), over `transport`'s pooled session.
+    Returns (access_token, expires_in). The SDK's ApiClient handshake discards
+    expires_in, so it isn't used.
+    """
+    transport = transport if transport is not None else get_genesys_transport()
+    login_host = re.sub(r"//api\.", "//login.", host or genesys.configuration.host, count=1)
+    authorization = base64.b64encode(
+        bytes(client_id + ":" + client_secret, "ISO-8859-1")
+    ).decode("ascii")
+
+    response = transport.post(
+        f"{login_host}/oauth/token",
+        data={"grant_type": "client_credentials"},
+        headers={
+            "Authorization": f"Basic {authorization}",
+            "Content-Type": "application/x-www-form-urlencoded"
+        }
+    )
+    if response.status_code != 200:
+        response.raise_for_status()
+        raise requests.HTTPError(
+            f"Unexpected status {response.status_code} from Genesys /oauth/token.", response=response
+        )
+
+    response_json = response.json()
+    return response_json.get("access_token"), response_json.get("expires_in")
+
+
+def _set_configuration_token(access_token):
+    genesys.configuration.access_token = access_token
+
+
+def _configure_genesys_client(client_id, client_secret, region):
+    """
+    Points genesys.configuration at `region` and gives it the shared token for these
+    credentials, logging in only if there is no fresh token yet. Refreshed tokens are
+    written back to genesys.configuration automatically.
+    """
+    host = _resolve_api_host(region)
+    genesys.configuration.host = host
+
+    transport = get_genesys_transport()
+    manager = get_token_manager(
+        client_id,
+        client_secret,
+        host,
+        lambda: _client_credentials_token(client_id, client_secret, host=host, transport=transport),
+        transport=transport,
+        default_lifetime=DEFAULT_TOKEN_LIFETIME
+    )
+    manager.add_listener(_set_configuration_token)
+    genesys.configuration.access_token = manager.get_token()
+    return manager
@@ -1,18 +1,36 @@
 import re
+import pandas as pd
 
-def clean_genesys_id_column(df, column_name):
+# One pattern does the whole job: an optional prefix up to the last '/', then a
+# lowercase UUID. Placeholders such as 'Pending' or 'admin' can never match it.
+_GENESYS_ID_PATTERN = re.compile(
+    r'^(?:.*/)?([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$'
+)
+
+CLEAN_ID_RETURN_TYPES = ("frame", "mask", "ids")
+
+def clean_genesys_id_column(df, column_name, return_type="frame"):
     """
     Strips any prefix up to '/', removes invalid placeholders,
     and enforces a valid UUID pattern for Genesys.
-    """
-    df[column_name] = df[column_name].str.replace(r'^.*/', '', regex=True)
 
-    # Remove rows with 'Pending' or 'admin'
-    df = df[df[column_name] != 'Pending']
-    df = df[df[column_name] != 'admin']
+    Single regex pass over the column; the caller's frame is never modified.
+    return_type="frame" returns the valid rows with the cleaned IDs,
+    "mask" returns a boolean Series aligned to df, and
+    "ids" returns the unique valid IDs as a Series.
+    """
+    if return_type not in CLEAN_ID_RETURN_TYPES:
+        raise ValueError(f"return_type must be one of {list(CLEAN_ID_RETURN_TYPES)}, got {return_type!r}.")
 
-    # Only keep rows that match a UUID pattern
-    df = df[df[column_name].str.match(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', na=False)]
+    cleaned_ids = df[column_name].str.extract(_GENESYS_ID_PATTERN, expand=False)
+    mask = cleaned_ids.notna()
 
-    return df
+    if return_type == "mask":
+        return mask
+    if return_type == "ids":
+        return pd.Series(pd.unique(cleaned_ids[mask]), name=column_name, dtype=cleaned_ids.dtype)
 
+    # Boolean indexing already copies the rows; the shallow copy just drops the "slice of df" flag
+    cleaned_df = df.loc[mask].copy(deep=False)
+    cleaned_df.isetitem(cleaned_df.columns.get_loc(column_name), cleaned_ids[mask])
+    return cleaned_df
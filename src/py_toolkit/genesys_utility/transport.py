@@ -0,0 +1,96 @@
+import threading
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from PureCloudPlatformClientV2.rest import RESTClientObject
+
+# Connections kept alive per host; size it to at least the number of concurrent workers
+DEFAULT_POOL_SIZE = 16
+# Distinct hosts kept pooled (login + API host, with room for a second region)
+DEFAULT_NUM_POOLS = 4
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_READ_TIMEOUT = 120.0
+
+
+class GenesysTransport:
+    """
+    One pooled, keep-alive HTTP transport for every Genesys call in the package.
+
+    `session` (requests) serves the OAuth calls, and `pool_manager` (urllib3, built with
+    the SDK's SSL/proxy settings) is swapped into each PureCloud ApiClient, so calls reuse
+    warm TLS connections instead of opening new ones. Pools block when full, so workers
+    beyond pool_size wait for a free connection rather than opening throwaway ones.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        num_pools: int = DEFAULT_NUM_POOLS,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT
+    ):
+        if pool_size < 1 or num_pools < 1:
+            raise ValueError("pool_size and num_pools must be at least 1.")
+
+        self.pool_size = pool_size
+        self.timeout = (connect_timeout, read_timeout)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=num_pools, pool_maxsize=pool_size, pool_block=True)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.pool_manager = RESTClientObject(pools_size=num_pools, max_size=pool_size).pool_manager
+        # Applies to every connection pool the manager creates from here on
+        self.pool_manager.connection_pool_kw["timeout"] = urllib3.Timeout(
+            connect=connect_timeout, read=read_timeout
+        )
+
+    def post(self, url, **kwargs):
+        """
+        requests-style POST over the pooled session, with the transport's timeouts by default.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.post(url, **kwargs)
+
+    def attach(self, api_client):
+        """
+        Points a PureCloud ApiClient at the shared connection pools. Returns the client.
+        """
+        api_client.rest_client.pool_manager = self.pool_manager
+        return api_client
+
+    def close(self):
+        """
+        Closes every pooled connection.
+        """
+        self.session.close()
+        self.pool_manager.clear()
+
+
+_default_transport = None
+_default_transport_lock = threading.Lock()
+
+
+def get_genesys_transport() -> GenesysTransport:
+    """
+    Returns the package-wide GenesysTransport, creating it with the defaults on first use.
+    """
+    global _default_transport
+    with _default_transport_lock:
+        if _default_transport is None:
+            _default_transport = GenesysTransport()
+        return _default_transport
+
+
+def configure_genesys_transport(**kwargs) -> GenesysTransport:
+    """
+    Replaces the package-wide transport (e.g. configure_genesys_transport(pool_size=32)
+    before a high-concurrency pull). Clients set up afterwards use the new pools.
+    """
+    global _default_transport
+    with _default_transport_lock:
+        if _default_transport is not None:
+            _default_transport.close()
+        _default_transport = GenesysTransport(**kwargs)
+        return _default_transport
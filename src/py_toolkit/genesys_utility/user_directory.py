@@ -0,0 +1,284 @@
+import os
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+import pandas as pd
+from .common import _get_env_path
+from .rate_limit import GenesysRateLimiter
+
+# Largest page GET /api/v2/users hands back
+MAX_USERS_PAGE_SIZE = 500
+# Largest page the routing queue/member listings hand back
+MAX_ROUTING_PAGE_SIZE = 100
+# Most IDs GET /api/v2/users accepts in one `id` filter
+MAX_USER_IDS_PER_REQUEST = 100
+
+USER_DIRECTORY_COLUMNS = [
+    "user_id", "name", "email", "username", "title", "department", "state",
+    "division_id", "division_name", "manager_id", "version", "queue_ids", "queue_names",
+]
+
+
+def _get_snapshot_path() -> str:
+    """
+    Returns the default directory snapshot path, next to the toolkit's .env:
+        ~/Documents/py_toolkit/genesys_user_directory.json
+    """
+    return os.path.join(os.path.dirname(_get_env_path()), "genesys_user_directory.json")
+
+
+def _fetch_all_entities(list_func, rate_limiter, max_workers: int, page_size: int, *args, **kwargs) -> list:
+    """
+    Calls a paged Genesys listing for page 1, then fetches the remaining pages concurrently.
+    Listings that don't report a page_count (e.g. queue members) are instead followed
+    page by page while they have a next_uri or come back full.
+    Returns every entity as a dict, in page order.
+    """
+    def fetch_page(page_number):
+        return rate_limiter.call(
+            list_func, *args, page_size=page_size, page_number=page_number, **kwargs
+        ).to_dict()
+
+    first = fetch_page(1)
+    entities = list(first.get("entities") or [])
+
+    if first.get("page_count") is None:
+        page, page_number = first, 1
+        while page.get("next_uri") or len(page.get("entities") or []) >= page_size:
+            page_number += 1
+            page = fetch_page(page_number)
+            if not page.get("entities"):
+                break
+            entities.extend(page["entities"])
+        return entities
+
+    if first["page_count"] > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for page in executor.map(fetch_page, range(2, first["page_count"] + 1)):
+                entities.extend(page.get("entities") or [])
+
+    return entities
+
+
+def _user_record(user: dict) -> dict:
+    division = user.get("division") or {}
+    manager = user.get("manager") or {}
+    return {
+        "user_id": user.get("id"),
+        "name": user.get("name"),
+        "email": user.get("email"),
+        "username": user.get("username"),
+        "title": user.get("title"),
+        "department": user.get("department"),
+        "state": user.get("state"),
+        "division_id": division.get("id"),
+        "division_name": division.get("name"),
+        "manager_id": manager.get("id"),
+        "version": user.get("version"),
+        "queue_ids": [],
+        "queue_names": [],
+    }
+
+
+class GenesysUserDirectory:
+    """
+    In-memory index of Genesys users (with divisions and, given a RoutingApi, queues),
+    keyed by user ID.
+
+    load() pulls the whole directory with concurrent page fetches; refresh() only
+    fetches what is missing or stale; save_snapshot()/the constructor persist and
+    restore the index locally so scripts don't re-page every user on startup.
+    """
+
+    def __init__(
+        self,
+        users_api,
+        routing_api=None,
+        snapshot_path: str = None,
+        rate_limiter=None,
+        max_workers: int = 4
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+
+        self.users_api = users_api
+        self.routing_api = routing_api
+        self.snapshot_path = snapshot_path or _get_snapshot_path()
+        self.rate_limiter = rate_limiter if rate_limiter is not None else GenesysRateLimiter()
+        self.max_workers = max_workers
+
+        self.users = {}
+        self.loaded_at = None
+        self._lookups = {}
+        self._lock = threading.Lock()
+
+        if os.path.exists(self.snapshot_path):
+            self.load_snapshot()
+
+    def __len__(self):
+        return len(self.users)
+
+    def __contains__(self, user_id):
+        return user_id in self.users
+
+    def get(self, user_id, default=None):
+        """
+        Returns the user's record dict, or `default` if the ID isn't indexed.
+        """
+        return self.users.get(user_id, default)
+
+    def _upsert(self, records) -> int:
+        """
+        Adds or replaces records, returning how many were new or changed.
+        """
+        changed = 0
+        with self._lock:
+            for record in records:
+                current = self.users.get(record["user_id"])
+                if current is None or current != record:
+                    self.users[record["user_id"]] = record
+                    changed += 1
+            if changed:
+                self._lookups = {}
+        return changed
+
+    def _fetch_queue_memberships(self) -> dict:
+        """
+        Returns {user_id: [(queue_id, queue_name), ...]} for every routing queue.
+        """
+        queues = _fetch_all_entities(
+            self.routing_api.get_routing_queues, self.rate_limiter, self.max_workers, MAX_ROUTING_PAGE_SIZE
+        )
+
+        def members_of(queue):
+            return queue, _fetch_all_entities(
+                self.routing_api.get_routing_queue_members, self.rate_limiter, 1, MAX_ROUTING_PAGE_SIZE,
+                queue["id"]
+            )
+
+        memberships = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for queue, members in executor.map(members_of, queues):
+                for member in members:
+                    memberships.setdefault(member.get("id"), []).append((queue["id"], queue.get("name")))
+        return memberships
+
+    def _records(self, users: list, memberships: dict = None) -> list:
+        records = [_user_record(user) for user in users]
+        for record in records:
+            if memberships is not None:
+                queues = memberships.get(record["user_id"], [])
+            else:
+                # Keep the queues we already know until the next full load
+                known = self.users.get(record["user_id"]) or {}
+                queues = list(zip(known.get("queue_ids", []), known.get("queue_names", [])))
+            record["queue_ids"] = [queue_id for queue_id, _ in queues]
+            record["queue_names"] = [queue_name for _, queue_name in queues]
+        return records
+
+    def load(self, state: str = "any") -> int:
+        """
+        Pulls every user (and queue memberships, if a routing_api was given) and indexes them.
+        Returns how many users were added or changed.
+        """
+        users = _fetch_all_entities(
+            self.users_api.get_users, self.rate_limiter, self.max_workers, MAX_USERS_PAGE_SIZE, state=state
+        )
+        memberships = self._fetch_queue_memberships() if self.routing_api is not None else None
+
+        changed = self._upsert(self._records(users, memberships))
+        self.loaded_at = datetime.now(timezone.utc)
+        return changed
+
+    def refresh(self, user_ids=None, max_age_hours: float = 24.0) -> int:
+        """
+        Incrementally updates the index.
+        With user_ids, fetches only the IDs not yet indexed (in bulk, 100 per request).
+        Without, reloads the directory if it is empty or older than max_age_hours.
+        Returns how many users were added or changed.
+        """
+        if user_ids is None:
+            age = None if self.loaded_at is None else datetime.now(timezone.utc) - self.loaded_at
+            if age is None or age.total_seconds() > max_age_hours * 3600:
+                return self.load()
+            return 0
+
+        missing = [
+            user_id for user_id in pd.unique(pd.Series(user_ids, dtype="object").dropna())
+            if user_id not in self.users
+        ]
+        chunks = [
+            missing[i : i + MAX_USER_IDS_PER_REQUEST]
+            for i in range(0, len(missing), MAX_USER_IDS_PER_REQUEST)
+        ]
+
+        def fetch_chunk(chunk):
+            return self.rate_limiter.call(
+                self.users_api.get_users, page_size=len(chunk), page_number=1, id=chunk, state="any"
+            ).to_dict().get("entities") or []
+
+        users = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for entities in executor.map(fetch_chunk, chunks):
+                users.extend(entities)
+
+        return self._upsert(self._records(users))
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Returns the directory as a DataFrame, one row per user.
+        """
+        return pd.DataFrame(list(self.users.values()), columns=USER_DIRECTORY_COLUMNS)
+
+    def _lookup(self, field: str) -> pd.Series:
+        if field not in USER_DIRECTORY_COLUMNS:
+            raise ValueError(f"field must be one of {USER_DIRECTORY_COLUMNS}, got {field!r}.")
+        with self._lock:
+            if field not in self._lookups:
+                self._lookups[field] = pd.Series(
+                    {user_id: record[field] for user_id, record in self.users.items()}, dtype="object"
+                )
+            return self._lookups[field]
+
+    def map(self, user_ids, field: str = "name", fetch_missing: bool = False) -> pd.Series:
+        """
+        Vectorized lookup of `field` for a Series (or list) of user IDs, e.g.
+            df["agent_name"] = directory.map(df["user_id"])
+        IDs not in the directory map to NaN, unless fetch_missing fetches them first.
+        """
+        user_ids = user_ids if isinstance(user_ids, pd.Series) else pd.Series(user_ids)
+        if fetch_missing:
+            self.refresh(user_ids=user_ids)
+        return user_ids.map(self._lookup(field))
+
+    def save_snapshot(self, path: str = None) -> str:
+        """
+        Writes the index to a local JSON snapshot and returns its path.
+        """
+        path = path or self.snapshot_path
+        snapshot_dir = os.path.dirname(path)
+        if snapshot_dir and not os.path.exists(snapshot_dir):
+            os.makedirs(snapshot_dir)
+
+        with self._lock:
+            snapshot = {
+                "loaded_at": self.loaded_at.isoformat() if self.loaded_at else None,
+                "users": list(self.users.values()),
+            }
+        with open(path, "w") as file:
+            json.dump(snapshot, file, default=str)
+        return path
+
+    def load_snapshot(self, path: str = None):
+        """
+        Replaces the index with a previously saved snapshot.
+        """
+        with open(path or self.snapshot_path, "r") as file:
+            snapshot = json.load(file)
+
+        with self._lock:
+            self.users = {record["user_id"]: record for record in snapshot.get("users", [])}
+            loaded_at = snapshot.get("loaded_at")
+            self.loaded_at = datetime.fromisoformat(loaded_at) if loaded_at else None
+            self._lookups = {}
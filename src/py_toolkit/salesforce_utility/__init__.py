@@ -2,11 +2,33 @@ from .auth import (
     get_salesforce_refresh_token,
     print_salesforce_authorize_url
 )
-from .query import query_salesforce_soql
-from .reporting import query_salesforce_report
+from .query import (
+    query_salesforce_soql,
+    iter_salesforce_soql_batches,
+    write_salesforce_soql_batches
+)
+from .bulk_query import (
+    create_salesforce_bulk_query_job,
+    wait_for_salesforce_bulk_query_job,
+    iter_salesforce_bulk_query_batches,
+    query_salesforce_bulk
+)
+from .describe_cache import (
+    SalesforceDescribeCache,
+    describe_salesforce_sobject,
+    salesforce_column_types
+)
+from .reporting import (
+    query_salesforce_report,
+    query_salesforce_report_full
+)
 from .transformations import (
     flatten_record,
-    convert_to_eastern_time
+    flatten_records,
+    convert_to_eastern_time,
+    convert_values_to_eastern_time,
+    convert_datetime_columns_to_eastern_time,
+    cast_salesforce_columns
 )
 
 # If you also want to expose the lower-level helpers from common or elsewhere,
@@ -16,8 +38,22 @@ __all__ = [
     "get_salesforce_refresh_token",
     "print_salesforce_authorize_url",
     "query_salesforce_soql",
+    "iter_salesforce_soql_batches",
+    "write_salesforce_soql_batches",
+    "create_salesforce_bulk_query_job",
+    "wait_for_salesforce_bulk_query_job",
+    "iter_salesforce_bulk_query_batches",
+    "query_salesforce_bulk",
+    "SalesforceDescribeCache",
+    "describe_salesforce_sobject",
+    "salesforce_column_types",
     "query_salesforce_report",
+    "query_salesforce_report_full",
     "flatten_record",
+    "flatten_records",
     "convert_to_eastern_time",
+    "convert_values_to_eastern_time",
+    "convert_datetime_columns_to_eastern_time",
+    "cast_salesforce_columns",
 ]
 
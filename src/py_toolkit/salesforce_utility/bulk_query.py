@@ -0,0 +1,190 @@
+import time
+import requests
+import pandas as pd
+import janitor
+from .common import SALESFORCE_BASE_URL, SALESFORCE_API_VERSION, _get_salesforce_headers
+from .query import (
+    _write_batches,
+    _cast_to_describe_types,
+    _soql_sobject
+)
+from .transformations import convert_datetime_columns_to_eastern_time
+
+# Job states after which no more polling is needed
+BULK_TERMINAL_STATES = ("JobComplete", "Failed", "Aborted")
+# Rows per DataFrame batch parsed out of a result chunk
+DEFAULT_BATCH_ROWS = 50_000
+# Bulk CSV checkbox values
+_BULK_BOOLEAN_VALUES = {"true": True, "false": False}
+
+
+def _bulk_jobs_url(base_url: str) -> str:
+    return f"{base_url or SALESFORCE_BASE_URL}/services/data/{SALESFORCE_API_VERSION}/jobs/query"
+
+
+def create_salesforce_bulk_query_job(query_string: str, include_all: bool = False, base_url: str = None) -> str:
+    """
+    Creates a Bulk API 2.0 query job and returns its job ID.
+    include_all also returns deleted and archived records (queryAll).
+    """
+    response = requests.post(
+        _bulk_jobs_url(base_url),
+        headers=_get_salesforce_headers(),
+        json={
+            "operation": "queryAll" if include_all else "query",
+            "query": query_string,
+            "contentType": "CSV",
+            "columnDelimiter": "COMMA",
+            "lineEnding": "LF",
+        }
+    )
+    response.raise_for_status()
+    return response.json()["id"]
+
+
+def wait_for_salesforce_bulk_query_job(
+    job_id: str,
+    poll_interval: float = 1.0,
+    max_poll_interval: float = 30.0,
+    timeout: float = None,
+    base_url: str = None
+) -> dict:
+    """
+    Polls a Bulk API 2.0 query job until it finishes, doubling the wait between polls
+    up to max_poll_interval. Returns the job info; raises RuntimeError if the job
+    failed or was aborted, TimeoutError if it is still running after `timeout` seconds.
+    """
+    headers = _get_salesforce_headers()
+    started = time.monotonic()
+    wait = poll_interval
+
+    while True:
+        response = requests.get(f"{_bulk_jobs_url(base_url)}/{job_id}", headers=headers)
+        response.raise_for_status()
+        job = response.json()
+
+        if job.get("state") == "JobComplete":
+            return job
+        if job.get("state") in BULK_TERMINAL_STATES:
+            raise RuntimeError(
+                f"Bulk query job {job_id} {job['state'].lower()}: {job.get('errorMessage') or 'no error message'}"
+            )
+        if timeout is not None and time.monotonic() - started + wait > timeout:
+            raise TimeoutError(f"Bulk query job {job_id} still {job.get('state')} after {timeout} seconds.")
+
+        time.sleep(wait)
+        wait = min(wait * 2, max_poll_interval)
+
+
+def _convert_bulk_boolean_columns(batch: pd.DataFrame) -> pd.DataFrame:
+    """
+    Maps columns holding only "true"/"false" (and blanks) to booleans, as the REST query
+    endpoint returns checkbox fields. batch is modified in place and returned.
+    """
+    for column in batch.columns:
+        values = batch[column].dropna()
+        if len(values) and values.isin(_BULK_BOOLEAN_VALUES.keys()).all():
+            batch[column] = batch[column].map(_BULK_BOOLEAN_VALUES)
+    return batch
+
+
+def iter_salesforce_bulk_query_batches(
+    job_id: str,
+    max_records: int = None,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    base_url: str = None,
+    sobject: str = None,
+    describe_cache=None
+):
+    """
+    Streams a completed Bulk API 2.0 query job's CSV results, following Sforce-Locator
+    from chunk to chunk, and yields DataFrames of at most batch_rows rows with the same
+    columns query_salesforce_soql returns. max_records caps the records per result chunk.
+    Values are read as text, so Ids and numbers like CaseNumber "00001026" keep their leading
+    zeros; only "true"/"false" columns become booleans. With sobject, columns are cast by that
+    sObject's describe, as query_salesforce_soql(typed=True) does.
+    """
+    headers = {**_get_salesforce_headers(), "Accept": "text/csv"}
+    locator = None
+
+    while True:
+        params = {}
+        if locator:
+            params["locator"] = locator
+        if max_records:
+            params["maxRecords"] = max_records
+
+        with requests.get(
+            f"{_bulk_jobs_url(base_url)}/{job_id}/results", params=params, headers=headers, stream=True
+        ) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            try:
+                reader = pd.read_csv(
+                    response.raw,
+                    chunksize=batch_rows,
+                    dtype=str,
+                    keep_default_na=False,
+                    na_values=[""]
+                )
+                for batch in reader:
+                    # Relationship columns come as Owner.Name; match flatten_records' Owner__Name
+                    batch.columns = [column.replace(".", "__") for column in batch.columns]
+                    batch = _convert_bulk_boolean_columns(batch)
+                    batch = _cast_to_describe_types(batch, sobject, describe_cache, base_url=base_url)
+                    yield convert_datetime_columns_to_eastern_time(batch).clean_names()
+            except pd.errors.EmptyDataError:
+                pass
+            locator = response.headers.get("Sforce-Locator")
+
+        if not locator or locator == "null":
+            break
+
+
+def query_salesforce_bulk(
+    query_string: str,
+    output_dir: str = None,
+    file_format: str = "parquet",
+    include_all: bool = False,
+    max_records: int = None,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    poll_interval: float = 1.0,
+    max_poll_interval: float = 30.0,
+    timeout: float = None,
+    base_url: str = None,
+    typed: bool = False,
+    describe_cache=None
+):
+    """
+    Runs a SOQL query through Bulk API 2.0: creates the query job, polls it with backoff,
+    then streams its CSV results. Suited to large objects the REST query endpoint would
+    take hours to page through.
+
+    Returns a DataFrame shaped like query_salesforce_soql's. With output_dir, each batch
+    is instead written as part-00000.<file_format>, part-00001.<file_format>, ... so
+    memory stays flat, and the list of paths written is returned.
+    file_format is "parquet" (needs pyarrow or fastparquet) or "csv".
+    typed is as for query_salesforce_soql.
+    """
+    if file_format not in ("parquet", "csv"):
+        raise ValueError(f"file_format must be 'parquet' or 'csv', got {file_format!r}.")
+
+    job_id = create_salesforce_bulk_query_job(query_string, include_all=include_all, base_url=base_url)
+    wait_for_salesforce_bulk_query_job(
+        job_id, poll_interval=poll_interval, max_poll_interval=max_poll_interval, timeout=timeout, base_url=base_url
+    )
+    batches = iter_salesforce_bulk_query_batches(
+        job_id,
+        max_records=max_records,
+        batch_rows=batch_rows,
+        base_url=base_url,
+        sobject=_soql_sobject(query_string) if typed else None,
+        describe_cache=describe_cache
+    )
+
+    if output_dir is None:
+        frames = list(batches)
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    return _write_batches(batches, output_dir, file_format)
+
@@ -1,4 +1,8 @@
 import os
+from dotenv import load_dotenv
+
+SALESFORCE_BASE_URL = "https://acftac.my.salesforce.com"
+SALESFORCE_API_VERSION = "v60.0"
 
 def _get_env_path() -> str:
     """
@@ -39,3 +43,14 @@ def _update_env_file(key: str, value: str):
         if not key_found:
             file.write(f"{key}={value}\n")
 
+
+def _get_salesforce_headers() -> dict:
+    load_dotenv(dotenv_path=_get_env_path())
+    refresh_token = os.getenv("SF_REFRESH")
+    if not refresh_token:
+        raise ValueError("Missing 'SF_REFRESH' token in .env file.")
+
+    return {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {refresh_token}",
+    }
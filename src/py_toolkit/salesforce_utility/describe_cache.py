@@ -0,0 +1,201 @@
+import os
+import json
+import time
+import threading
+import requests
+from .._sqlite_store import SQLiteStore
+from .common import SALESFORCE_BASE_URL, SALESFORCE_API_VERSION, _get_env_path, _get_salesforce_headers
+
+# Describe field attributes kept in the cache; enough to type columns and follow relationships
+DESCRIBE_FIELD_KEYS = ("name", "type", "relationshipName", "referenceTo")
+
+
+def _get_describe_cache_path() -> str:
+    """
+    Returns the default describe cache path, next to the toolkit's .env:
+        ~/Documents/py_toolkit/salesforce_describe_cache.sqlite
+    """
+    return os.path.join(os.path.dirname(_get_env_path()), "salesforce_describe_cache.sqlite")
+
+
+class SalesforceDescribeCache(SQLiteStore):
+    """
+    On-disk cache of sObject describe metadata, keyed by org, sObject and API version.
+
+    Entries older than `ttl_seconds` are treated as misses and fetched again, so field
+    changes in the org are picked up. Describes are also kept in memory once read, so
+    repeated typed queries in one process don't touch the database at all.
+    """
+
+    def __init__(self, path: str = None, ttl_seconds: float = 24 * 3600):
+        if ttl_seconds is not None and ttl_seconds < 0:
+            raise ValueError("ttl_seconds must be non-negative (or None to never expire).")
+
+        self.ttl_seconds = ttl_seconds
+        self._memory = {}
+        super().__init__(
+            path or _get_describe_cache_path(),
+            """
+            CREATE TABLE IF NOT EXISTS sobject_describes (
+                org TEXT,
+                sobject TEXT,
+                api_version TEXT,
+                describe TEXT,
+                created_at REAL,
+                PRIMARY KEY (org, sobject, api_version)
+            )
+            """
+        )
+
+    def _expired(self, created_at: float) -> bool:
+        return self.ttl_seconds is not None and created_at + self.ttl_seconds <= time.time()
+
+    def get(self, org: str, sobject: str, api_version: str):
+        """
+        Returns the cached describe dict, or None on a miss.
+        """
+        key = (org, sobject.lower(), api_version)
+        with self._lock:
+            if key in self._memory:
+                describe, created_at = self._memory[key]
+                if not self._expired(created_at):
+                    return describe
+                del self._memory[key]
+
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT describe, created_at FROM sobject_describes WHERE org = ? AND sobject = ? AND api_version = ?",
+                    key
+                ).fetchone()
+                if row is None:
+                    return None
+                if self._expired(row[1]):
+                    conn.execute(
+                        "DELETE FROM sobject_describes WHERE org = ? AND sobject = ? AND api_version = ?", key
+                    )
+                    return None
+
+            describe = json.loads(row[0])
+            self._memory[key] = (describe, row[1])
+        return describe
+
+    def put(self, org: str, sobject: str, api_version: str, describe: dict):
+        """
+        Stores a describe dict.
+        """
+        key = (org, sobject.lower(), api_version)
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO sobject_describes VALUES (?, ?, ?, ?, ?)",
+                (*key, json.dumps(describe), now)
+            )
+            self._memory[key] = (describe, now)
+
+    def clear(self):
+        """
+        Drops every cached describe.
+        """
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM sobject_describes")
+            self._memory.clear()
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def _get_default_describe_cache() -> SalesforceDescribeCache:
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = SalesforceDescribeCache()
+        return _default_cache
+
+
+def describe_salesforce_sobject(
+    sobject: str,
+    cache: SalesforceDescribeCache = None,
+    base_url: str = None,
+    api_version: str = None
+) -> dict:
+    """
+    Returns an sObject's describe metadata as {"name": ..., "fields": [...]}, each field
+    reduced to its name, type, relationshipName and referenceTo.
+    Served from `cache` (the shared on-disk cache by default) while fresh. base_url and
+    api_version pick the org and API version (default: SALESFORCE_BASE_URL and
+    SALESFORCE_API_VERSION), and key the cache entry.
+    """
+    if cache is None:
+        cache = _get_default_describe_cache()
+    org = base_url or SALESFORCE_BASE_URL
+    api_version = api_version or SALESFORCE_API_VERSION
+
+    describe = cache.get(org, sobject, api_version)
+    if describe is not None:
+        return describe
+
+    response = requests.get(
+        f"{org}/services/data/{api_version}/sobjects/{sobject}/describe/",
+        headers=_get_salesforce_headers()
+    )
+    response.raise_for_status()
+    data = response.json()
+
+    describe = {
+        "name": data.get("name", sobject),
+        "fields": [{key: field.get(key) for key in DESCRIBE_FIELD_KEYS} for field in data.get("fields", [])],
+    }
+    cache.put(org, sobject, api_version, describe)
+    return describe
+
+
+def salesforce_column_types(
+    sobject: str,
+    columns,
+    sep: str = "__",
+    cache: SalesforceDescribeCache = None,
+    base_url: str = None,
+    api_version: str = None
+) -> dict:
+    """
+    Maps flattened result columns (e.g. "Amount", "Owner__Name", "Account__r__Region__c")
+    to Salesforce field types, following relationship names through each related sObject's
+    describe. Columns that don't resolve to a field (aggregates, polymorphic lookups,
+    subqueries) are left out. base_url and api_version are as for describe_salesforce_sobject.
+    """
+    indexes = {}
+
+    def index(name):
+        if name not in indexes:
+            fields = describe_salesforce_sobject(
+                name, cache=cache, base_url=base_url, api_version=api_version
+            )["fields"]
+            indexes[name] = (
+                {field["name"].lower(): field for field in fields},
+                {(field.get("relationshipName") or "").lower(): field for field in fields},
+            )
+        return indexes[name]
+
+    def resolve(name, tokens):
+        # Separators also appear inside names (Region__c, Account__r, ns__Field__c),
+        # so try every split of the leading tokens into a relationship name
+        fields, relationships = index(name)
+        if len(tokens) == 1 or sep.join(tokens).lower() in fields:
+            field = fields.get(sep.join(tokens).lower())
+            return field["type"] if field else None
+        for k in range(1, len(tokens)):
+            references = (relationships.get(sep.join(tokens[:k]).lower()) or {}).get("referenceTo") or []
+            if len(references) == 1:
+                field_type = resolve(references[0], tokens[k:])
+                if field_type is not None:
+                    return field_type
+        return None
+
+    column_types = {}
+    for column in columns:
+        field_type = resolve(sobject, str(column).split(sep))
+        if field_type is not None:
+            column_types[column] = field_type
+
+    return column_types
@@ -1,42 +1,382 @@
 import os
+import re
+from typing import List
 import requests
 import pandas as pd
 import janitor
-from dotenv import load_dotenv
-from .common import _get_env_path
-from .transformations import flatten_record, convert_to_eastern_time
+from concurrent.futures import ThreadPoolExecutor
+from .common import SALESFORCE_BASE_URL, SALESFORCE_API_VERSION, _get_salesforce_headers
+from .transformations import flatten_records, convert_datetime_columns_to_eastern_time, cast_salesforce_columns
+from .describe_cache import salesforce_column_types
 
-def query_salesforce_soql(query_string: str) -> pd.DataFrame:
+# Datetime fields a query can be sliced on for parallel extraction
+SLICE_FIELDS = ("CreatedDate", "SystemModstamp", "LastModifiedDate")
+
+# Top-level clauses that follow WHERE in a SOQL statement
+_TRAILING_CLAUSE_PATTERN = re.compile(r"\b(WITH|GROUP\s+BY|ORDER\s+BY|LIMIT|OFFSET|FOR)\s", re.IGNORECASE)
+
+
+def _iter_soql_record_pages(query_string: str, headers: dict, batch_size: int = None):
+    """
+    Runs a SOQL query and yields each batch of records, following nextRecordsUrl
+    until Salesforce reports the result set is done. batch_size (200-2,000) asks
+    Salesforce for smaller pages than its default 2,000 records.
+    """
+    if batch_size is not None:
+        headers = {**headers, "Sforce-Query-Options": f"batchSize={batch_size}"}
+    response = requests.get(
+        f"{SALESFORCE_BASE_URL}/services/data/{SALESFORCE_API_VERSION}/query/",
+        params={"q": query_string},
+        headers=headers
+    )
+    while True:
+        response.raise_for_status()
+        data = response.json()
+        yield data.get("records", [])
+
+        next_records_url = data.get("nextRecordsUrl")
+        if data.get("done", True) or not next_records_url:
+            break
+        response = requests.get(SALESFORCE_BASE_URL + next_records_url, headers=headers)
+
+
+def _cast_to_describe_types(
+    df: pd.DataFrame,
+    sobject: str,
+    describe_cache,
+    base_url: str = None,
+    api_version: str = None
+) -> pd.DataFrame:
+    """
+    Casts df's columns to their field types from sobject's describe (in the org at
+    base_url), when sobject is given.
+    """
+    if sobject:
+        column_types = salesforce_column_types(
+            sobject, df.columns, cache=describe_cache, base_url=base_url, api_version=api_version
+        )
+        cast_salesforce_columns(df, column_types)
+    return df
+
+
+def _records_to_df(records: list, sobject: str = None, describe_cache=None) -> pd.DataFrame:
+    # Flatten and convert date/times to EST column-wise rather than per record and cell
+    df = _cast_to_describe_types(flatten_records(records), sobject, describe_cache)
+    return convert_datetime_columns_to_eastern_time(df).clean_names()
+
+
+def _soql_sobject(query_string: str) -> str:
+    """
+    Returns the sObject named in a query's top-level FROM clause.
+    """
+    match = _find_top_level(re.compile(r"\bFROM\s+(\w+)", re.IGNORECASE), query_string)
+    if not match:
+        raise ValueError(f"Couldn't find the FROM sObject in query: {query_string!r}")
+    return match.group(1)
+
+
+def _soql_select_columns(query_string: str):
+    """
+    Returns the result columns a query's SELECT list produces, named as _records_to_df
+    names them (Owner.Name -> owner_name), or None when they can't be known from the
+    query text alone (subqueries, aggregates, aliases, TYPEOF or FIELDS()).
+    """
+    select = _find_top_level(re.compile(r"^\s*SELECT\s", re.IGNORECASE), query_string)
+    from_match = _find_top_level(re.compile(r"\bFROM\b", re.IGNORECASE), query_string)
+    if not select or not from_match:
+        return None
+
+    select_list = query_string[select.end():from_match.start()]
+    if "(" in select_list or re.search(r"\bTYPEOF\b", select_list, re.IGNORECASE):
+        return None
+    fields = [field.strip() for field in select_list.split(",")]
+    if not all(re.fullmatch(r"\w+(\.\w+)*", field) for field in fields):
+        return None
+
+    names = [field.replace(".", "__") for field in fields]
+    return list(pd.DataFrame(columns=list(dict.fromkeys(names))).clean_names().columns)
+
+
+def _top_level_spans(query_string: str):
+    """
+    Yields (start, end) spans of query_string outside parentheses and quoted literals,
+    so clause keywords inside subqueries or string values are never matched.
+    """
+    depth, start, quote = 0, 0, None
+    for i, char in enumerate(query_string):
+        if quote:
+            if char == quote and query_string[i - 1] != "\\":
+                quote = None
+                if depth == 0:
+                    start = i + 1
+            continue
+        if char in ("'", '"') or char == "(":
+            if depth == 0 and start < i:
+                yield start, i
+            if char == "(":
+                depth += 1
+            else:
+                quote = char
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                start = i + 1
+    if depth == 0 and not quote and start < len(query_string):
+        yield start, len(query_string)
+
+
+def _find_top_level(pattern, query_string: str):
+    for start, end in _top_level_spans(query_string):
+        match = pattern.search(query_string, start, end)
+        if match:
+            return match
+    return None
+
+
+def _add_soql_condition(query_string: str, condition: str) -> str:
+    """
+    ANDs `condition` onto the top-level WHERE clause, adding one if there isn't any.
+    """
+    trailing = _find_top_level(_TRAILING_CLAUSE_PATTERN, query_string)
+    insert_at = trailing.start() if trailing else len(query_string)
+    head, tail = query_string[:insert_at].rstrip(), query_string[insert_at:]
+
+    where = _find_top_level(re.compile(r"\bWHERE\b", re.IGNORECASE), head)
+    if where:
+        head = f"{head[:where.end()]} ({head[where.end():].strip()}) AND {condition}"
+    else:
+        head = f"{head} WHERE {condition}"
+    return f"{head} {tail}".rstrip()
+
+
+def _soql_slice_bounds(query_string: str, slice_field: str, slices: int, headers: dict) -> list:
+    """
+    Returns `slices` + 1 datetime bounds evenly covering slice_field's range in the query.
+    """
+    from_match = _find_top_level(re.compile(r"\bFROM\b", re.IGNORECASE), query_string)
+    range_query = f"SELECT MIN({slice_field}) lo, MAX({slice_field}) hi {query_string[from_match.start():]}"
+    trailing = _find_top_level(re.compile(r"\bORDER\s+BY\b", re.IGNORECASE), range_query)
+    if trailing:
+        range_query = range_query[:trailing.start()].rstrip()
+
+    records = [record for page in _iter_soql_record_pages(range_query, headers) for record in page]
+    if not records or records[0].get("lo") is None:
+        return []
+
+    lo, hi = pd.Timestamp(records[0]["lo"]), pd.Timestamp(records[0]["hi"])
+    return [lo + (hi - lo) * i / slices for i in range(slices + 1)]
+
+
+def query_salesforce_soql(
+    query_string: str,
+    parallel_slices: int = 1,
+    slice_field: str = "CreatedDate",
+    max_workers: int = None,
+    typed: bool = False,
+    describe_cache=None
+) -> pd.DataFrame:
     """
     Executes a SOQL query against Salesforce, returns the results in a flattened DataFrame.
+    Every batch is fetched by following nextRecordsUrl, so large results are never truncated.
+
+    With parallel_slices > 1 the query is split into that many slice_field
+    (CreatedDate, SystemModstamp or LastModifiedDate) ranges, which are fetched
+    concurrently and combined in range order. Sliced queries can't use LIMIT, OFFSET
+    or GROUP BY.
+
+    With typed=True, columns are cast by their field types from the FROM sObject's
+    describe (cached on disk by describe_cache, a SalesforceDescribeCache): numbers to
+    Int64/float64, checkboxes to boolean, picklists to category, and dates and datetimes
+    to datetime64 (datetimes in US/Eastern) instead of strings.
+    """
+    if parallel_slices < 1:
+        raise ValueError("parallel_slices must be at least 1.")
+
+    headers = _get_salesforce_headers()
+    sobject = _soql_sobject(query_string) if typed else None
+
+    if parallel_slices == 1:
+        records = [record for page in _iter_soql_record_pages(query_string, headers) for record in page]
+        return _records_to_df(records, sobject, describe_cache)
+
+    if slice_field not in SLICE_FIELDS:
+        raise ValueError(f"slice_field must be one of {list(SLICE_FIELDS)}, got {slice_field!r}.")
+    if _find_top_level(re.compile(r"\b(LIMIT|OFFSET|GROUP\s+BY)\b", re.IGNORECASE), query_string):
+        raise ValueError("Queries using LIMIT, OFFSET or GROUP BY can't be split into parallel slices.")
+
+    bounds = _soql_slice_bounds(query_string, slice_field, parallel_slices, headers)
+    if not bounds:
+        return _records_to_df([], sobject, describe_cache)
+
+    def soql_datetime(ts):
+        return ts.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+    slice_queries = []
+    for i, (lower, upper) in enumerate(zip(bounds[:-1], bounds[1:])):
+        # The last slice includes the upper bound so the newest record isn't lost
+        upper_operator = "<=" if i == parallel_slices - 1 else "<"
+        condition = (
+            f"{slice_field} >= {soql_datetime(lower)} AND {slice_field} {upper_operator} {soql_datetime(upper)}"
+        )
+        slice_queries.append(_add_soql_condition(query_string, condition))
+
+    def fetch_slice(slice_query):
+        return [record for page in _iter_soql_record_pages(slice_query, headers) for record in page]
+
+    with ThreadPoolExecutor(max_workers=max_workers or parallel_slices) as executor:
+        slice_records = list(executor.map(fetch_slice, slice_queries))
+
+    return _records_to_df([record for records in slice_records for record in records], sobject, describe_cache)
+
+
+def iter_salesforce_soql_batches(
+    query_string: str,
+    batch_size: int = None,
+    typed: bool = False,
+    describe_cache=None
+):
+    """
+    Streams a SOQL query: yields one DataFrame, shaped like query_salesforce_soql's,
+    per nextRecordsUrl page as it arrives, so only a page of records is held at a time.
+    batch_size (200-2,000) sets the records per page; typed is as for query_salesforce_soql.
+    """
+    headers = _get_salesforce_headers()
+    sobject = _soql_sobject(query_string) if typed else None
+    for records in _iter_soql_record_pages(query_string, headers, batch_size=batch_size):
+        if records:
+            yield _records_to_df(records, sobject, describe_cache)
+
+
+def _write_batches(batches, output_dir: str, file_format: str) -> List[str]:
+    """
+    Writes each DataFrame batch to output_dir as part-00000.<file_format>, part-00001.<file_format>, ...
+    Returns the paths written.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    written = []
+    for part_number, batch in enumerate(batches):
+        path = os.path.join(output_dir, f"part-{part_number:05d}.{file_format}")
+        if file_format == "parquet":
+            batch.to_parquet(path, index=False)
+        else:
+            batch.to_csv(path, index=False)
+        written.append(path)
+    return written
+
+
+def _conform_batch(batch: pd.DataFrame, columns: list, output_path: str) -> pd.DataFrame:
     """
-    load_dotenv(dotenv_path=_get_env_path())
-    refresh_token = os.getenv("SF_REFRESH")
-    if not refresh_token:
-        raise ValueError("Missing 'SF_REFRESH' token in .env file.")
+    Lines a batch up with the file's columns. Columns missing from the batch are filled
+    with nulls, and all-null extras (e.g. a bare Owner column where every Owner lookup on
+    the page was empty) are dropped; other new columns can't be added to a single file.
+    """
+    new_columns = [column for column in batch.columns if column not in columns and batch[column].notna().any()]
+    if new_columns:
+        raise ValueError(
+            f"Column(s) {new_columns} first appeared after the first batch and can't be added to "
+            f"{output_path}; write a partitioned dataset (partitioned=True) instead."
+        )
+    missing = [column for column in columns if column not in batch.columns]
+    batch = batch.reindex(columns=columns)
+    # Untyped placeholders, so the Parquet schema takes them as string rather than double
+    batch[missing] = batch[missing].astype(object)
+    return batch
+
 
-    base_url = "https://acftac.my.salesforce.com"
-    api_version = "v60.0"
-    endpoint = f"{base_url}/services/data/{api_version}/query/?q="
+def write_salesforce_soql_batches(
+    query_string: str,
+    output_path: str,
+    file_format: str = "parquet",
+    partitioned: bool = False,
+    batch_size: int = None,
+    typed: bool = False,
+    describe_cache=None
+):
+    """
+    Streams a SOQL query to disk page by page, keeping memory at about one page whatever
+    the result size.
+
+    By default every page is appended to the single file output_path. Its columns come
+    from the query's SELECT list, or from the first page when the list can't be read
+    up front (subqueries, aggregates, TYPEOF); untyped integer columns are widened to
+    float (typed Int64 ones stay integer), and all-null ones to string, so later pages fit. The file is written under a temporary
+    name and only renamed to output_path once every page is in, so a failure part-way
+    leaves no partial file behind. With partitioned=True, output_path is a directory and
+    each page is written as its own part-00000.<file_format>, part-00001.<file_format>, ...
+    file_format is "parquet" (needs pyarrow) or "csv". typed is as for query_salesforce_soql,
+    and gives every page the same dtypes. Returns the list of paths written.
+    """
+    if file_format not in ("parquet", "csv"):
+        raise ValueError(f"file_format must be 'parquet' or 'csv', got {file_format!r}.")
 
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {refresh_token}",
-    }
+    batches = iter_salesforce_soql_batches(
+        query_string, batch_size=batch_size, typed=typed, describe_cache=describe_cache
+    )
+    if partitioned:
+        return _write_batches(batches, output_path, file_format)
 
-    response = requests.get(endpoint + query_string, headers=headers)
-    response.raise_for_status()
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
 
-    data = response.json()
-    records = data.get("records", [])
+    columns = _soql_select_columns(query_string)
+    temp_path = f"{output_path}.part"
+    written = False
+    try:
+        if file_format == "csv":
+            for batch in batches:
+                if columns is None:
+                    columns = list(batch.columns)
+                batch = _conform_batch(batch, columns, output_path)
+                batch.to_csv(temp_path, mode="a" if written else "w", header=not written, index=False)
+                written = True
+        else:
+            written = _write_parquet_batches(batches, columns, temp_path, output_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
 
-    flattened_rows = []
-    for record in records:
-        flat_record = flatten_record(record)
-        # Convert potential date/time strings to EST
-        for k, v in flat_record.items():
-            flat_record[k] = convert_to_eastern_time(v)
-        flattened_rows.append(flat_record)
+    if not written:
+        return []
+    os.replace(temp_path, output_path)
+    return [output_path]
+
+
+def _write_parquet_batches(batches, columns, temp_path: str, output_path: str) -> bool:
+    """
+    Appends every batch to one Parquet file at temp_path, with the schema of the first
+    (conformed) batch. Returns whether anything was written.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
 
-    return pd.DataFrame(flattened_rows).clean_names()
+    writer = None
+    try:
+        for batch in batches:
+            if columns is None:
+                columns = list(batch.columns)
+            batch = _conform_batch(batch, columns, output_path)
+            if writer is None:
+                schema = pa.Schema.from_pandas(batch, preserve_index=False)
+                for i, field in enumerate(schema):
+                    if pa.types.is_null(field.type):
+                        schema = schema.set(i, field.with_type(pa.string()))
+                    elif pa.types.is_integer(field.type) and not isinstance(batch[field.name].dtype, pd.Int64Dtype):
+                        # Plain ints may be null on a later page; typed Int64 columns already allow nulls
+                        schema = schema.set(i, field.with_type(pa.float64()))
+                schema = schema.remove_metadata()
+                writer = pq.ParquetWriter(temp_path, schema)
+            try:
+                table = pa.Table.from_pandas(batch, schema=schema, preserve_index=False)
+            except (pa.ArrowInvalid, pa.ArrowTypeError) as exc:
+                raise ValueError(
+                    f"A batch doesn't match the types of {output_path} ({exc}); "
+                    f"write a partitioned dataset (partitioned=True) instead."
+                ) from exc
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
 
+    return writer is not None
@@ -1,28 +1,124 @@
-import os
+import copy
+import warnings
+from decimal import Decimal
 import requests
 import pandas as pd
 import janitor
-from dotenv import load_dotenv
-from .common import _get_env_path
-from .transformations import _convert_salesforce_datetime_to_est_str
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from .common import SALESFORCE_BASE_URL, SALESFORCE_API_VERSION, _get_salesforce_headers
+from .transformations import convert_values_to_eastern_time, cast_salesforce_columns
 
-def query_salesforce_report(report_id: str) -> pd.DataFrame:
+# Detail rows a synchronous report run returns at most
+REPORT_ROW_LIMIT = 2000
+# Detail column types query_salesforce_report_full can slice a report on
+REPORT_SLICE_TYPES = ("date", "datetime", "int", "double", "currency", "percent")
+# Detail column types typed=True casts from raw values; other columns keep their labels
+REPORT_CAST_TYPES = ("int", "double", "currency", "percent", "boolean", "date", "datetime")
+
+def _report_grouping_labels(groupings: list, labels: dict = None) -> dict:
     """
-    Queries a Salesforce report (via Analytics API) by its ID and returns the data as a DataFrame.
+    Maps every grouping key in a groupingsDown/groupingsAcross tree ("0", "0_1", ...)
+    to its label.
+    """
+    if labels is None:
+        labels = {}
+    for grouping in groupings or []:
+        labels[grouping.get("key")] = grouping.get("label")
+        _report_grouping_labels(grouping.get("groupings"), labels)
+    return labels
+
+
+def _report_frame(report_json: dict, typed: bool = False) -> pd.DataFrame:
+    """
+    Decodes a report response's detail rows (every factMap bucket) into a DataFrame
+    with one column per detail column API name, plus a column per row/column grouping
+    holding each bucket's grouping label.
+
+    Cells are gathered per column in one pass, with each column's type read once from
+    detailColumnInfo. Untyped, date/datetime columns become US/Eastern strings and other
+    columns prefer each cell's label; typed, numeric, boolean and date/datetime columns are
+    cast from raw values (see cast_salesforce_columns), and the rest still use labels, so
+    name and lookup columns show names rather than record Ids.
     """
-    load_dotenv(dotenv_path=_get_env_path())
-    refresh_token = os.getenv("SF_REFRESH")
-    if not refresh_token:
-        raise ValueError("SF_REFRESH token is missing from the .env file.")
-
-    base_url = "https://acftac.my.salesforce.com"
-    api_version = "v60.0"
-    endpoint = f"{base_url}/services/data/{api_version}/analytics/reports/{report_id}"
-
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {refresh_token}",
+    metadata = report_json.get("reportMetadata", {})
+    detail_cols = metadata.get("detailColumns", [])
+    detail_info = report_json.get("reportExtendedMetadata", {}).get("detailColumnInfo", {})
+    column_types = {column: detail_info.get(column, {}).get("dataType") for column in detail_cols}
+    # Whether each column keeps raw values rather than display labels
+    use_raw = [
+        column_types[column] in (REPORT_CAST_TYPES if typed else ("date", "datetime")) for column in detail_cols
+    ]
+
+    grouping_names = {
+        "down": [grouping.get("name") for grouping in metadata.get("groupingsDown") or []],
+        "across": [grouping.get("name") for grouping in metadata.get("groupingsAcross") or []],
     }
+    grouping_labels = {
+        "down": _report_grouping_labels((report_json.get("groupingsDown") or {}).get("groupings")),
+        "across": _report_grouping_labels((report_json.get("groupingsAcross") or {}).get("groupings")),
+    }
+    grouping_columns = [
+        name for name in grouping_names["down"] + grouping_names["across"] if name and name not in column_types
+    ]
+
+    buffers = {column: [] for column in grouping_columns + detail_cols}
+    label_buffers = {column: [] for column, raw in zip(detail_cols, use_raw) if not raw}
+
+    # Each factMap key ("<down key>!<across key>") corresponds to a grouping or "bucket" of rows
+    for fm_key, fm_value in report_json.get("factMap", {}).items():
+        rows = fm_value.get("rows") or []
+        if not rows:
+            continue
+
+        for axis, key in zip(("down", "across"), fm_key.split("!")):
+            if key == "T":
+                continue
+            parts = key.split("_")
+            for level, name in enumerate(grouping_names[axis][:len(parts)]):
+                if name in buffers and name not in column_types:
+                    buffers[name].extend([grouping_labels[axis].get("_".join(parts[:level + 1]))] * len(rows))
+
+        row_cells = [row.get("dataCells", []) for row in rows]
+        for i, column in enumerate(detail_cols):
+            buffers[column].extend([cells[i].get("value") for cells in row_cells])
+            if column in label_buffers:
+                label_buffers[column].extend([cells[i].get("label") for cells in row_cells])
+
+        # Buckets above a grouping's level don't carry it
+        row_count = max(len(values) for values in buffers.values())
+        for values in (*buffers.values(), *label_buffers.values()):
+            values.extend([None] * (row_count - len(values)))
+
+    columns = {}
+    for column, values in buffers.items():
+        field_type = column_types.get(column)
+        if typed and field_type == "currency":
+            values = [value.get("amount") if isinstance(value, dict) else value for value in values]
+        if not typed and field_type in ("date", "datetime"):
+            # Convert UTC date/time to EST if possible; each distinct value is parsed once
+            values = convert_values_to_eastern_time([value or None for value in values], datetimes_only=False)
+        values = pd.Series(values, dtype="object")
+        if column in label_buffers:
+            # For non-date fields, prefer the label if it's not "-"
+            labels = pd.Series(label_buffers[column], dtype="object")
+            values = labels.where(labels.notna() & ~labels.isin(["", "-"]), values)
+        columns[column] = values
+
+    df = pd.DataFrame(columns)
+    if typed:
+        cast_salesforce_columns(df, {column: field_type for column, field_type in column_types.items() if field_type})
+    return df
+
+
+def query_salesforce_report(report_id: str, typed: bool = False) -> pd.DataFrame:
+    """
+    Queries a Salesforce report (via Analytics API) by its ID and returns the data as a DataFrame.
+    Grouped reports get a column per grouping holding each row's grouping label.
+    With typed=True, numeric, boolean and date/datetime columns are cast by their
+    detailColumnInfo types instead of using labels.
+    """
+    headers = _get_salesforce_headers()
+    endpoint = f"{SALESFORCE_BASE_URL}/services/data/{SALESFORCE_API_VERSION}/analytics/reports/{report_id}"
 
     response = requests.get(endpoint, headers=headers)
     if response.status_code != 200:
@@ -34,43 +130,203 @@ def query_salesforce_report(report_id: str) -> pd.DataFrame:
     if not report_json:
         return pd.DataFrame()
 
-    detail_cols = report_json.get("reportMetadata", {}).get("detailColumns", [])
-    detail_info = report_json.get("reportExtendedMetadata", {}).get("detailColumnInfo", {})
+    if not report_json.get("allData", True):
+        warnings.warn(
+            f"Report {report_id} returned only its first {REPORT_ROW_LIMIT:,} detail rows; "
+            f"use query_salesforce_report_full to extract all of them.",
+            stacklevel=2
+        )
 
-    # Map each detail column to its dataType
-    column_data_types = {}
-    for col_api_name in detail_cols:
-        meta = detail_info.get(col_api_name, {})
-        column_data_types[col_api_name] = meta.get("dataType", None)
-
-    fact_map = report_json.get("factMap", {})
-    all_rows = []
-
-    # Each factMap key corresponds to a grouping or "bucket" of rows
-    for fm_key, fm_value in fact_map.items():
-        rows = fm_value.get("rows", [])
-        for row in rows:
-            data_cells = row.get("dataCells", [])
-            row_dict = {}
-
-            for i, cell in enumerate(data_cells):
-                col_api_name = detail_cols[i]
-                col_type = column_data_types.get(col_api_name)
-                raw_value = cell.get("value")
-                label_value = cell.get("label")
-
-                if col_type in ("date", "datetime"):
-                    # Convert UTC date/time to EST if possible
-                    if raw_value:
-                        row_dict[col_api_name] = _convert_salesforce_datetime_to_est_str(raw_value)
-                    else:
-                        row_dict[col_api_name] = None
-                else:
-                    # For non-date fields, prefer the label if it's not "-"
-                    display_value = label_value if label_value and label_value != "-" else raw_value
-                    row_dict[col_api_name] = display_value
+    return _report_frame(report_json, typed=typed).clean_names()
+
+
+def _report_cell_sort_value(raw_value, data_type: str):
+    """
+    Returns a comparable value for a slice column cell, or None for blanks.
+    """
+    if isinstance(raw_value, dict):  # currency cells: {"amount": ..., "currency": ...}
+        raw_value = raw_value.get("amount")
+    if raw_value in (None, ""):
+        return None
+    if data_type == "date":
+        return pd.Timestamp(raw_value).normalize()
+    if data_type == "datetime":
+        timestamp = pd.Timestamp(raw_value)
+        return timestamp.tz_localize("UTC") if timestamp.tzinfo is None else timestamp.tz_convert("UTC")
+    return float(raw_value)
 
-            all_rows.append(row_dict)
 
-    return pd.DataFrame(all_rows).clean_names()
+def _report_filter_value(value, data_type: str) -> str:
+    if data_type == "date":
+        return value.strftime("%Y-%m-%d")
+    if data_type == "datetime":
+        return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+    if data_type == "int":
+        return str(int(value))
+    # Plain decimal notation, exact to the float's shortest repr (no rounding, no exponent)
+    return format(Decimal(repr(value)), "f")
+
+
+def _slice_filters(piece: dict, slice_column: str, data_type: str) -> list:
+    """
+    Report filters selecting one slice: {"blank": True}, {"equals": v}, or a
+    [lo, hi) range whose ends may be open.
+    """
+    if piece.get("blank"):
+        return [{"column": slice_column, "operator": "equals", "value": ""}]
+    if "equals" in piece:
+        return [{"column": slice_column, "operator": "equals", "value": _report_filter_value(piece["equals"], data_type)}]
+
+    filters = []
+    if piece.get("lo") is not None:
+        operator = "greaterThan" if piece.get("lo_exclusive") else "greaterOrEqual"
+        filters.append({"column": slice_column, "operator": operator, "value": _report_filter_value(piece["lo"], data_type)})
+    else:
+        # Blanks get their own slice, so open-ended ranges leave them out
+        filters.append({"column": slice_column, "operator": "notEqual", "value": ""})
+    if piece.get("hi") is not None:
+        filters.append({"column": slice_column, "operator": "lessThan", "value": _report_filter_value(piece["hi"], data_type)})
+    return filters
+
+
+def _split_slice(piece: dict, observed: list, ways: int) -> list:
+    """
+    Splits a truncated slice at quantiles of the slice values its truncated run returned,
+    so every child is narrower. Raises RuntimeError when the slice can't be narrowed.
+    """
+    distinct = sorted(set(observed))
+    lo = piece.get("lo")
+    if "equals" in piece or piece.get("blank") or not distinct:
+        raise RuntimeError(
+            f"More than {REPORT_ROW_LIMIT:,} report rows share one slice_column value; "
+            f"pick a slice_column with more distinct values."
+        )
+
+    cuts = []
+    for i in range(1, ways):
+        cut = distinct[min(len(distinct) - 1, len(distinct) * i // ways)]
+        if (lo is None or cut > lo) and cut not in cuts:
+            cuts.append(cut)
+    if not cuts:
+        if len(distinct) > 1:
+            cuts = [distinct[-1]]
+        else:
+            # Every returned row has the slice's lower bound: give it its own slice, then continue past it
+            value = distinct[0]
+            return [{"equals": value}, {"lo": value, "lo_exclusive": True, "hi": piece.get("hi")}]
+
+    edges = [lo, *cuts, piece.get("hi")]
+    children = []
+    for i, (start, stop) in enumerate(zip(edges[:-1], edges[1:])):
+        child = {"lo": start, "hi": stop}
+        if i == 0 and piece.get("lo_exclusive"):
+            child["lo_exclusive"] = True
+        children.append(child)
+    return children
+
+
+def _slice_sort_key(piece: dict) -> tuple:
+    if piece.get("blank"):
+        return (2,)
+    if "equals" in piece:
+        return (1, piece["equals"], 0)
+    if piece.get("lo") is None:
+        return (0,)
+    return (1, piece["lo"], 1 if piece.get("lo_exclusive") else 0)
+
+
+def query_salesforce_report_full(
+    report_id: str,
+    slice_column: str = None,
+    slices: int = 4,
+    max_workers: int = 4,
+    typed: bool = False
+) -> pd.DataFrame:
+    """
+    Queries a Salesforce report like query_salesforce_report, but returns every detail row,
+    not just the first 2,000 a report run is capped at.
+
+    The report is run once; if Salesforce reports it incomplete, it is re-run with extra
+    filters on slice_column (a date, datetime or numeric detail column, by API name) that
+    split it into value ranges, up to max_workers at a time. A range that still comes back
+    truncated is split again at the values it returned, and blank values get a range of
+    their own, so the merged result covers the report exactly once, slices in slice_column order.
+    Each re-run counts against the org's hourly report run limit.
+    """
+    if slices < 2:
+        raise ValueError("slices must be at least 2.")
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+
+    headers = _get_salesforce_headers()
+    endpoint = f"{SALESFORCE_BASE_URL}/services/data/{SALESFORCE_API_VERSION}/analytics/reports/{report_id}"
+
+    response = requests.get(f"{endpoint}/describe", headers=headers)
+    response.raise_for_status()
+    describe = response.json()
+    report_metadata = describe["reportMetadata"]
+
+    def run_report(extra_filters=()):
+        metadata = copy.deepcopy(report_metadata)
+        filters = metadata.get("reportFilters") or []
+        metadata["reportFilters"] = filters + list(extra_filters)
+        if extra_filters and metadata.get("reportBooleanFilter"):
+            added = " AND ".join(str(len(filters) + i + 1) for i in range(len(extra_filters)))
+            metadata["reportBooleanFilter"] = f"({metadata['reportBooleanFilter']}) AND {added}"
+
+        run_response = requests.post(
+            endpoint, params={"includeDetails": "true"}, headers=headers, json={"reportMetadata": metadata}
+        )
+        run_response.raise_for_status()
+        return run_response.json()
+
+    report_json = run_report()
+    if report_json.get("allData", True):
+        return _report_frame(report_json, typed=typed).clean_names()
+
+    detail_columns = report_metadata.get("detailColumns", [])
+    column_info = describe.get("reportExtendedMetadata", {}).get("detailColumnInfo", {})
+    if slice_column is None:
+        raise ValueError(
+            f"Report {report_id} has more than {REPORT_ROW_LIMIT:,} detail rows; pass slice_column "
+            f"(one of its date, datetime or numeric detail columns) to extract them all."
+        )
+    data_type = column_info.get(slice_column, {}).get("dataType")
+    if slice_column not in detail_columns or data_type not in REPORT_SLICE_TYPES:
+        raise ValueError(
+            f"slice_column must be a detail column of type {', '.join(REPORT_SLICE_TYPES)}; "
+            f"got {slice_column!r} ({data_type})."
+        )
+    slice_index = detail_columns.index(slice_column)
+
+    def observed_values(run_json):
+        values = []
+        for bucket in (run_json.get("factMap") or {}).values():
+            for row in bucket.get("rows", []):
+                value = _report_cell_sort_value(row["dataCells"][slice_index].get("value"), data_type)
+                if value is not None:
+                    values.append(value)
+        return values
+
+    def run_slice(piece):
+        return run_report(_slice_filters(piece, slice_column, data_type))
+
+    finished = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {
+            executor.submit(run_slice, piece): piece
+            for piece in [*_split_slice({}, observed_values(report_json), slices), {"blank": True}]
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                piece = pending.pop(future)
+                slice_json = future.result()
+                if slice_json.get("allData", True):
+                    finished.append((_slice_sort_key(piece), _report_frame(slice_json, typed=typed)))
+                else:
+                    for child in _split_slice(piece, observed_values(slice_json), slices):
+                        pending[executor.submit(run_slice, child)] = child
 
+    finished.sort(key=lambda item: item[0])
+    return pd.concat([frame for _, frame in finished], ignore_index=True).clean_names()
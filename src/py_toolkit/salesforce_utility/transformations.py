@@ -1,7 +1,30 @@
 import re
+from datetime import datetime
+from functools import lru_cache
+import numpy as np
+import pandas as pd
 from dateutil import parser
 import pytz
 
+# Start of the ISO8601 date/time strings Salesforce returns
+_ISO_DATETIME_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}T")
+_EASTERN = pytz.timezone("US/Eastern")
+# Distinct date/time strings memoized by the scalar conversions
+EASTERN_TIME_CACHE_SIZE = 65_536
+# pandas dtype for each Salesforce field type cast_salesforce_columns handles;
+# date and datetime are parsed to datetime64 (datetime in US/Eastern)
+SALESFORCE_FIELD_DTYPES = {
+    "int": "Int64",
+    "double": "float64",
+    "currency": "float64",
+    "percent": "float64",
+    "boolean": "boolean",
+    "picklist": "category",
+    "date": "datetime64[ns]",
+    "datetime": "datetime64[ns, US/Eastern]",
+}
+_BOOLEAN_VALUES = {True: True, False: False, "true": True, "false": False}
+
 def flatten_record(record: dict, parent_key: str = "", sep: str = "__") -> dict:
     """
     Recursively flattens a Salesforce record dictionary.
@@ -24,34 +47,150 @@ def flatten_record(record: dict, parent_key: str = "", sep: str = "__") -> dict:
     return dict(items)
 
 
-def convert_to_eastern_time(value) -> str:
+def _flatten_relationships(record: dict, prefix: str, sep: str, flat: dict) -> dict:
+    for key, value in record.items():
+        if isinstance(value, dict):
+            if key == "attributes":
+                continue
+            if "attributes" in value:
+                _flatten_relationships(value, f"{prefix}{key}{sep}", sep, flat)
+                continue
+        flat[prefix + key] = value
+    return flat
+
+
+def flatten_records(records: list, sep: str = "__") -> pd.DataFrame:
     """
-    Converts a string that looks like ISO8601 date/time from UTC to US/Eastern.
-    Returns original if parsing fails.
+    Flattens a list of Salesforce records into a DataFrame, as flatten_record would each
+    record, but building the frame once. Only relationship objects (dicts carrying
+    'attributes') become <Relationship>__<Field> columns; compound fields such as
+    BillingAddress and child subquery results stay whole in one cell.
     """
-    if isinstance(value, str) and re.search(r"\d{4}-\d{2}-\d{2}T", value):
-        try:
-            dt_utc = parser.parse(value)
-            if not dt_utc.tzinfo:
-                dt_utc = dt_utc.replace(tzinfo=pytz.utc)
-            dt_est = dt_utc.astimezone(pytz.timezone("US/Eastern"))
-            return dt_est.strftime("%Y-%m-%d %H:%M:%S %Z")
-        except (ValueError, parser.ParserError):
-            return value
-    return value
+    return pd.DataFrame([_flatten_relationships(record, "", sep, {}) for record in records])
+
+
+def _format_eastern_time(utc_values: pd.Series) -> pd.Series:
+    """
+    Formats UTC timestamps as '%Y-%m-%d %H:%M:%S %Z' US/Eastern strings.
+    Built from string casts and the UTC offset, since .dt.strftime formats row by row.
+    """
+    utc_seconds = utc_values.dt.tz_localize(None).dt.floor("s")
+    local_seconds = utc_values.dt.tz_convert("US/Eastern").dt.tz_localize(None).dt.floor("s")
+    abbreviation = np.where(local_seconds - utc_seconds == pd.Timedelta(hours=-4), " EDT", " EST")
+    return local_seconds.astype(str) + abbreviation
 
 
+def convert_datetime_columns_to_eastern_time(df: pd.DataFrame, columns=None, sample_size: int = 100) -> pd.DataFrame:
+    """
+    Converts ISO8601 date/time columns from UTC to US/Eastern strings, a whole column at a time,
+    formatted as convert_to_eastern_time formats them. By default, columns are those whose first
+    `sample_size` non-null values include a date/time string. Cells that aren't date/time strings,
+    or don't parse, are left as they were. df is modified in place and returned.
+    """
+    if columns is None:
+        columns = []
+        for column in df.columns:
+            if df[column].dtype != object:
+                continue
+            sample = df[column].dropna().head(sample_size)
+            if any(isinstance(value, str) and _ISO_DATETIME_PATTERN.match(value) for value in sample):
+                columns.append(column)
+
+    for column in columns:
+        values = df[column]
+        is_datetime = values.str.match(_ISO_DATETIME_PATTERN, na=False)
+        parsed = pd.to_datetime(values[is_datetime], utc=True, format="ISO8601", errors="coerce")
+        converted = _format_eastern_time(parsed)
+        df[column] = values.mask(is_datetime, converted.where(parsed.notna(), values[is_datetime]))
+    return df
+
+
+def cast_salesforce_columns(df: pd.DataFrame, column_types: dict) -> pd.DataFrame:
+    """
+    Casts columns to the dtype for their Salesforce field type (see SALESFORCE_FIELD_DTYPES),
+    e.g. from salesforce_column_types. Other types, and columns not in df, are left alone;
+    values that don't parse become nulls. df is modified in place and returned.
+    """
+    for column, field_type in column_types.items():
+        if column not in df.columns or field_type not in SALESFORCE_FIELD_DTYPES:
+            continue
+        values = df[column]
+        if field_type == "datetime":
+            df[column] = pd.to_datetime(values, utc=True, format="ISO8601", errors="coerce").dt.tz_convert("US/Eastern")
+        elif field_type == "date":
+            df[column] = pd.to_datetime(values, format="ISO8601", errors="coerce")
+        elif field_type == "boolean":
+            df[column] = values.map(_BOOLEAN_VALUES).astype("boolean")
+        elif field_type == "picklist":
+            df[column] = values.astype("category")
+        else:
+            df[column] = pd.to_numeric(values, errors="coerce").astype(SALESFORCE_FIELD_DTYPES[field_type])
+    return df
+
+
+def _parse_utc_datetime(raw_value: str) -> datetime:
+    """
+    Parses a Salesforce date/time string, treating naive values as UTC. Strict ISO8601
+    (what the APIs return) goes through datetime.fromisoformat; anything else falls back
+    to dateutil's fuzzier parser.
+    """
+    try:
+        dt_utc = datetime.fromisoformat(raw_value)
+    except ValueError:
+        dt_utc = parser.parse(raw_value)
+    if not dt_utc.tzinfo:
+        dt_utc = dt_utc.replace(tzinfo=pytz.utc)
+    return dt_utc
+
+
+@lru_cache(maxsize=EASTERN_TIME_CACHE_SIZE)
 def _convert_salesforce_datetime_to_est_str(raw_value: str) -> str:
     """
     Used internally by the report query function for date/datetime cells.
+    Memoized, since exports repeat the same dates and timestamps many times over.
     """
     try:
-        dt_utc = parser.parse(raw_value)
-        if not dt_utc.tzinfo:
-            dt_utc = dt_utc.replace(tzinfo=pytz.utc)
-        dt_est = dt_utc.astimezone(pytz.timezone("US/Eastern"))
-        return dt_est.strftime("%Y-%m-%d %H:%M:%S %Z")
-    except (ValueError, parser.ParserError):
+        return _parse_utc_datetime(raw_value).astimezone(_EASTERN).strftime("%Y-%m-%d %H:%M:%S %Z")
+    except (ValueError, OverflowError, parser.ParserError):
         return raw_value
+
+
+def convert_to_eastern_time(value) -> str:
+    """
+    Converts a string that looks like ISO8601 date/time from UTC to US/Eastern.
+    Returns original if parsing fails.
+    """
+    if isinstance(value, str) and _ISO_DATETIME_PATTERN.search(value):
+        return _convert_salesforce_datetime_to_est_str(value)
+    return value
+
+
+def convert_values_to_eastern_time(values, datetimes_only: bool = True):
+    """
+    Bulk convert_to_eastern_time: converts an array, list or Series of values and returns
+    the same kind of container. Each distinct value is converted once.
+    With datetimes_only=False, date-only strings (e.g. report date cells) are converted too.
+    """
+    array = values.to_numpy(dtype=object) if isinstance(values, pd.Series) else np.asarray(values, dtype=object)
+    codes, uniques = pd.factorize(array.ravel(), use_na_sentinel=True)
+
+    converted_uniques = np.empty(len(uniques), dtype=object)
+    for i, value in enumerate(uniques):
+        if isinstance(value, str) and (not datetimes_only or _ISO_DATETIME_PATTERN.search(value)):
+            converted_uniques[i] = _convert_salesforce_datetime_to_est_str(value)
+        else:
+            converted_uniques[i] = value
+
+    converted = array.ravel().copy()
+    has_value = codes >= 0
+    converted[has_value] = converted_uniques[codes[has_value]]
+    converted = converted.reshape(array.shape)
+
+    if isinstance(values, pd.Series):
+        return pd.Series(converted, index=values.index, name=values.name)
+    if isinstance(values, list):
+        return converted.tolist()
+    return converted
+
     
-    
\ No newline at end of file
+    
\ No newline at end of file
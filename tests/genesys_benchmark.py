@@ -0,0 +1,124 @@
+"""
+Benchmark for the Genesys details pipeline, run against FakeGenesysAnalyticsServer.
+
+    from genesys_benchmark import run_details_benchmark
+    print(run_details_benchmark(conversation_count=20_000, latency=0.05))
+"""
+import time
+import uuid
+import tracemalloc
+from functools import partial
+import pandas as pd
+from src.py_toolkit.genesys_utility.rate_limit import GenesysRateLimiter
+from src.py_toolkit.genesys_utility.conversation_schema import NORMALIZE_MODES, _collect_conversation_pages
+from src.py_toolkit.genesys_utility.conversation_details_query import (
+    build_post_analytics_conversations_details_query_payloads,
+    iter_conversation_pages_for_conversations_details_query_payload,
+    fetch_post_analytics_conversations_details_query_df,
+    _map_payloads
+)
+from genesys_fakes import FakeGenesysAnalyticsServer
+
+
+def run_details_benchmark(
+    conversation_count: int = 5000,
+    max_workers: int = 4,
+    normalize_modes=NORMALIZE_MODES,
+    latency: float = 0.02,
+    latency_jitter: float = 0.0,
+    throttle_rate: float = 0.0,
+    recorded_conversations: list = None,
+    rate_limiter=None,
+    end_to_end: bool = True,
+    trace_memory: bool = True
+) -> pd.DataFrame:
+    """
+    Runs the details extract against a FakeGenesysAnalyticsServer and reports, per stage:
+    seconds, pages, conversations, rows, pages/sec, conversations/sec and peak_memory_mb.
+
+    peak_memory_mb is the stage's own peak: tracemalloc's peak during the stage (reset as
+    it starts) less what was already allocated when it began. It counts memory allocated
+    through Python (pandas/NumPy buffers included). The fake server shares the process,
+    so "fetch" and "end_to_end" include its response building. Tracing slows the fetch
+    stages several times over, so pass trace_memory=False (peak_memory_mb is then None)
+    for timings.
+
+    Stages: "fetch" (HTTP + SDK deserialization of every page, max_workers payloads at a time),
+    "normalize:<mode>" for each normalize mode over the fetched pages, and, with end_to_end,
+    "end_to_end" (fetch_post_analytics_conversations_details_query_df as a caller runs it).
+    The default rate limiter is generous with short backoffs, so the numbers reflect the
+    pipeline rather than the limiter.
+    """
+    if rate_limiter is None:
+        rate_limiter = GenesysRateLimiter(requests_per_minute=600_000, burst=1000, base_backoff=0.01)
+
+    ids_df = pd.DataFrame({"conversation_id": [str(uuid.UUID(int=i)) for i in range(conversation_count)]})
+    intervals = [("2023-01-01", "2023-01-02")]
+    report = []
+
+    def start_stage():
+        if not trace_memory:
+            return time.perf_counter(), None
+        tracemalloc.reset_peak()
+        return time.perf_counter(), tracemalloc.get_traced_memory()[0]
+
+    def add_stage(stage, started, pages, conversations, rows):
+        seconds = time.perf_counter() - started[0]
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+        report.append({
+            "stage": stage,
+            "seconds": seconds,
+            "pages": pages,
+            "conversations": conversations,
+            "rows": rows,
+            "pages_per_sec": pages / seconds if seconds else None,
+            "conversations_per_sec": conversations / seconds if seconds else None,
+            "peak_memory_mb": (peak - started[1]) / (1024 * 1024) if trace_memory else None,
+        })
+
+    tracing = tracemalloc.is_tracing()
+    if trace_memory and not tracing:
+        tracemalloc.start()
+    try:
+        with FakeGenesysAnalyticsServer(
+            recorded_conversations=recorded_conversations,
+            latency=latency,
+            latency_jitter=latency_jitter,
+            throttle_rate=throttle_rate
+        ) as server:
+            api_client = server.conversations_api(pool_size=max_workers)
+            payloads_json_list = build_post_analytics_conversations_details_query_payloads(
+                ids_df, "conversation_id", intervals
+            )
+
+            iter_pages = partial(
+                iter_conversation_pages_for_conversations_details_query_payload, api_client, rate_limiter=rate_limiter
+            )
+            started = start_stage()
+            payload_pages = _map_payloads(lambda p: list(iter_pages(p)), payloads_json_list, max_workers)
+            pages = [conversations for payload in payload_pages for conversations in payload]
+            conversations = sum(len(page) for page in pages)
+            add_stage("fetch", started, len(pages), conversations, conversations)
+
+            for mode in normalize_modes:
+                started = start_stage()
+                result = _collect_conversation_pages(pages, mode)
+                rows = sum(len(df) for df in result.values()) if isinstance(result, dict) else len(result)
+                add_stage(f"normalize:{mode}", started, len(pages), conversations, rows)
+
+            if end_to_end:
+                started = start_stage()
+                result_df = fetch_post_analytics_conversations_details_query_df(
+                    api_client, intervals, ids_df, "conversation_id",
+                    max_workers=max_workers, rate_limiter=rate_limiter
+                )
+                add_stage("end_to_end", started, len(pages), conversations, len(result_df))
+
+            report_df = pd.DataFrame(report)
+            report_df.attrs["requests"] = server.requests
+            report_df.attrs["throttled"] = server.throttled
+    finally:
+        if trace_memory and not tracing:
+            tracemalloc.stop()
+
+    return report_df
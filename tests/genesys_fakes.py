@@ -0,0 +1,222 @@
+"""
+Local stand-ins for the Genesys analytics endpoints, shared by the Genesys tests and
+genesys_benchmark.py.
+"""
+import json
+import time
+import zlib
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pandas as pd
+import PureCloudPlatformClientV2 as genesys
+from src.py_toolkit.genesys_utility.rate_limit import GenesysRateLimiter
+from src.py_toolkit.genesys_utility.transport import GenesysTransport
+
+DETAILS_QUERY_PATH = "/api/v2/analytics/conversations/details/query"
+
+
+def synthesize_conversation(conversation_id: str, start: pd.Timestamp) -> dict:
+    """
+    Builds one voice conversation in the API's JSON shape: a customer and an agent
+    participant, each with a session, two segments and a couple of metrics.
+    """
+    def iso(ts):
+        return ts.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+    end = start + pd.Timedelta(minutes=6)
+    participants = []
+    for purpose in ("customer", "agent"):
+        participants.append({
+            "participantId": f"{conversation_id}-{purpose}",
+            "purpose": purpose,
+            "userId": None if purpose == "customer" else "agent-0001",
+            "sessions": [{
+                "sessionId": f"{conversation_id}-{purpose}-s1",
+                "mediaType": "voice",
+                "direction": "inbound",
+                "ani": "tel:+15555550100",
+                "dnis": "tel:+15555550199",
+                "segments": [
+                    {"segmentStart": iso(start), "segmentEnd": iso(start + pd.Timedelta(minutes=1)),
+                     "segmentType": "alert", "queueId": "queue-0001"},
+                    {"segmentStart": iso(start + pd.Timedelta(minutes=1)), "segmentEnd": iso(end),
+                     "segmentType": "interact", "queueId": "queue-0001", "disconnectType": "client"},
+                ],
+                "metrics": [
+                    {"name": "tTalk", "value": 300000, "emitDate": iso(end)},
+                    {"name": "nConnected", "value": 1, "emitDate": iso(start)},
+                ],
+            }],
+        })
+
+    return {
+        "conversationId": conversation_id,
+        "conversationStart": iso(start),
+        "conversationEnd": iso(end),
+        "originatingDirection": "inbound",
+        "participants": participants,
+    }
+
+
+def record_details_conversations(api_client, payload_json, path: str, rate_limiter=None) -> int:
+    """
+    Pages a real details query and saves its conversations, in the API's JSON shape,
+    for FakeGenesysAnalyticsServer(recorded_conversations=...) to replay.
+    Returns the number of conversations recorded.
+    """
+    if rate_limiter is None:
+        rate_limiter = GenesysRateLimiter()
+
+    conversations = []
+    payload_dict = json.loads(payload_json)
+    page_size = payload_dict["paging"]["pageSize"]
+    while True:
+        response = rate_limiter.call(api_client.post_analytics_conversations_details_query, payload_dict)
+        page = api_client.api_client.sanitize_for_serialization(response).get("conversations") or []
+        conversations.extend(page)
+        if len(page) < page_size:
+            break
+        payload_dict["paging"]["pageNumber"] += 1
+
+    with open(path, "w") as file:
+        json.dump(conversations, file)
+    return len(conversations)
+
+
+class FakeGenesysAnalyticsServer:
+    """
+    Local HTTP stand-in for POST /api/v2/analytics/conversations/details/query.
+
+    Payloads filtered by conversationId get one conversation per requested ID;
+    unfiltered payloads get `conversations_per_interval` conversations, paged as the
+    real API does. Conversations are synthesized, or cloned (with new IDs) from
+    `recorded_conversations`. Every response waits `latency` seconds (plus up to
+    `latency_jitter`), and `throttle_rate` of requests are answered with a 429.
+
+        with FakeGenesysAnalyticsServer(latency=0.05, throttle_rate=0.02) as server:
+            api = server.conversations_api()
+    """
+
+    def __init__(
+        self,
+        conversations_per_interval: int = 1000,
+        recorded_conversations: list = None,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        throttle_rate: float = 0.0,
+        seed: int = 0
+    ):
+        if not 0 <= throttle_rate < 1:
+            raise ValueError("throttle_rate must be in [0, 1).")
+
+        self.conversations_per_interval = conversations_per_interval
+        self.recorded_conversations = recorded_conversations
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.throttle_rate = throttle_rate
+
+        self.requests = 0
+        self.throttled = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                status, response = server._respond(self.path, body)
+                data = json.dumps(response).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _conversation(self, conversation_id: str, start: pd.Timestamp) -> dict:
+        if not self.recorded_conversations:
+            return synthesize_conversation(conversation_id, start)
+        # crc32, unlike hash(), picks the same template in every process
+        index = zlib.crc32(conversation_id.encode("utf-8")) % len(self.recorded_conversations)
+        template = self.recorded_conversations[index]
+        return {**template, "conversationId": conversation_id}
+
+    def _respond(self, path: str, body: dict):
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + self._random.uniform(0, self.latency_jitter)
+            throttle = self._random.random() < self.throttle_rate
+            if throttle:
+                self.throttled += 1
+        time.sleep(delay)
+
+        if not path.startswith(DETAILS_QUERY_PATH):
+            return 404, {"message": f"No fake route for {path}", "status": 404}
+        if throttle:
+            return 429, {"message": "Rate limit exceeded the maximum.", "status": 429}
+
+        start = pd.Timestamp(body["interval"].split("/")[0])
+        requested_ids = [
+            predicate["value"]
+            for group in body.get("conversationFilters") or []
+            for predicate in group.get("predicates") or []
+            if predicate.get("dimension") == "conversationId"
+        ]
+        if requested_ids:
+            conversation_ids = requested_ids
+        else:
+            conversation_ids = [
+                f"{start:%Y%m%d}-{i:08d}" for i in range(self.conversations_per_interval)
+            ]
+
+        paging = body.get("paging") or {"pageSize": 100, "pageNumber": 1}
+        first = (paging["pageNumber"] - 1) * paging["pageSize"]
+        page_ids = conversation_ids[first : first + paging["pageSize"]]
+
+        response = {"totalHits": len(conversation_ids)}
+        if page_ids:
+            response["conversations"] = [
+                self._conversation(conversation_id, start + pd.Timedelta(seconds=i))
+                for i, conversation_id in enumerate(page_ids, start=first)
+            ]
+        return 200, response
+
+    def conversations_api(self, pool_size: int = 16):
+        """
+        Returns a ConversationsApi pointed at this server through a pooled transport.
+        """
+        api_client = GenesysTransport(pool_size=pool_size).attach(genesys.api_client.ApiClient(host=self.url))
+        api_client.access_token = "fake-token"
+        return genesys.ConversationsApi(api_client)
@@ -0,0 +1,156 @@
+"""
+Local stand-ins for Salesforce endpoints, shared by the Salesforce tests.
+"""
+import csv
+import io
+import json
+import uuid
+import threading
+from typing import List
+from urllib.parse import urlparse, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from src.py_toolkit.salesforce_utility.common import SALESFORCE_API_VERSION
+
+
+class FakeSalesforceBulkServer:
+    """
+    Local HTTP stand-in for the Bulk API 2.0 query endpoints.
+
+    Every job returns `records` (dicts keyed by CSV column, e.g. "Owner.Name") as CSV,
+    `chunk_size` records per result chunk linked by Sforce-Locator. Jobs report
+    InProgress for `polls_until_complete` polls, or Failed with `fail_message`.
+    `describes` maps sObject names to the field lists served by the describe endpoint.
+
+        with FakeSalesforceBulkServer(records, chunk_size=1000) as server:
+            df = query_salesforce_bulk("SELECT Id FROM Case", base_url=server.url)
+    """
+
+    def __init__(
+        self,
+        records: List[dict],
+        chunk_size: int = 10_000,
+        polls_until_complete: int = 1,
+        fail_message: str = None,
+        describes: dict = None
+    ):
+        self.records = records
+        self.chunk_size = chunk_size
+        self.polls_until_complete = polls_until_complete
+        self.fail_message = fail_message
+        self.describes = describes or {}
+
+        self.jobs = {}
+        self.requests = []
+        self._lock = threading.Lock()
+        self._httpd = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _handle(self, method):
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length)) if length else None
+                status, content_type, data, headers = server._respond(method, self.path, body)
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                self._handle("GET")
+
+            def do_POST(self):
+                self._handle("POST")
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _csv_chunk(self, offset: int, limit: int) -> bytes:
+        columns = list(dict.fromkeys(key for record in self.records for key in record))
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=columns, lineterminator="\n")
+        writer.writeheader()
+        for record in self.records[offset : offset + limit]:
+            writer.writerow({
+                key: "true" if value is True else "false" if value is False else ("" if value is None else value)
+                for key, value in record.items()
+            })
+        return buffer.getvalue().encode("utf-8")
+
+    def _respond(self, method: str, path: str, body):
+        def as_json(status, payload):
+            return status, "application/json", json.dumps(payload).encode("utf-8"), {}
+
+        url = urlparse(path)
+        params = parse_qs(url.query)
+        with self._lock:
+            self.requests.append((method, url.path, params))
+
+        sobjects_prefix = f"/services/data/{SALESFORCE_API_VERSION}/sobjects/"
+        if url.path.startswith(sobjects_prefix) and url.path.endswith("/describe/"):
+            sobject = url.path[len(sobjects_prefix):-len("/describe/")]
+            if sobject not in self.describes:
+                return as_json(404, [{"errorCode": "NOT_FOUND", "message": f"No describe for {sobject}"}])
+            return as_json(200, {"name": sobject, "fields": self.describes[sobject]})
+
+        prefix = f"/services/data/{SALESFORCE_API_VERSION}/jobs/query"
+        if not url.path.startswith(prefix):
+            return as_json(404, [{"errorCode": "NOT_FOUND", "message": f"No fake route for {url.path}"}])
+        parts = [part for part in url.path[len(prefix):].split("/") if part]
+
+        if method == "POST" and not parts:
+            job_id = uuid.uuid4().hex[:18]
+            with self._lock:
+                self.jobs[job_id] = {"id": job_id, "query": body["query"], "operation": body["operation"], "polls": 0}
+            return as_json(200, {"id": job_id, "state": "UploadComplete", "operation": body["operation"]})
+
+        job = self.jobs.get(parts[0]) if parts else None
+        if job is None:
+            return as_json(404, [{"errorCode": "NOT_FOUND", "message": "Job not found"}])
+
+        if len(parts) == 1:
+            with self._lock:
+                job["polls"] += 1
+                polls = job["polls"]
+            if polls <= self.polls_until_complete:
+                return as_json(200, {"id": job["id"], "state": "InProgress"})
+            if self.fail_message:
+                return as_json(200, {"id": job["id"], "state": "Failed", "errorMessage": self.fail_message})
+            return as_json(200, {"id": job["id"], "state": "JobComplete", "numberRecordsProcessed": len(self.records)})
+
+        offset = int(params.get("locator", ["0"])[0])
+        limit = min(int(params.get("maxRecords", [self.chunk_size])[0]), self.chunk_size)
+        next_offset = offset + limit
+        headers = {
+            "Sforce-Locator": str(next_offset) if next_offset < len(self.records) else "null",
+            "Sforce-NumberOfRecords": str(len(self.records[offset:next_offset])),
+        }
+        return 200, "text/csv", self._csv_chunk(offset, limit), headers
@@ -1,6 +1,7 @@
 import pytest
 import os
 import json
+import time
 import requests
 import pandas as pd
 from unittest.mock import patch, MagicMock
@@ -8,15 +9,18 @@ from unittest.mock import patch, MagicMock
 #
 # ---------------- 1) TEST auth.py (get_genesys_access_token) ----------------
 #
-@patch("src.utility_functions.genesys_utility.auth.requests.post")
-@patch("src.utility_functions.genesys_utility.auth._update_env_file")
-def test_get_genesys_access_token_success(mock_update_env_file, mock_requests_post):
+@patch("src.py_toolkit.genesys_utility.auth.get_genesys_transport")
+@patch("src.py_toolkit.genesys_utility.auth._update_env_file")
+def test_get_genesys_access_token_success(mock_update_env_file, mock_get_transport):
     """
     If the request is successful (status_code=200),
     we set genesys.configuration.access_token and update the .env file.
     """
-    from src.utility_functions.genesys_utility.auth import get_genesys_access_token
+    from src.py_toolkit.genesys_utility.auth import get_genesys_access_token
     import PureCloudPlatformClientV2 as genesys
+
+    # The token request goes through the pooled transport's POST
+    mock_requests_post = mock_get_transport.return_value.post
     
     # 1) Mock the POST response
     mock_requests_post.return_value.status_code = 200
@@ -39,12 +43,14 @@ def test_get_genesys_access_token_success(mock_update_env_file, mock_requests_po
     mock_update_env_file.assert_called_once_with("GENESYS_ACCESS_TOKEN", "FAKE_TOKEN_123")
 
 
-@patch("src.utility_functions.genesys_utility.auth.requests.post")
-def test_get_genesys_access_token_error(mock_requests_post):
+@patch("src.py_toolkit.genesys_utility.auth.get_genesys_transport")
+def test_get_genesys_access_token_error(mock_get_transport):
     """
     If the POST returns a non-200 status, the function should raise_for_status().
     """
-    from src.utility_functions.genesys_utility.auth import get_genesys_access_token
+    from src.py_toolkit.genesys_utility.auth import get_genesys_access_token
+
+    mock_requests_post = mock_get_transport.return_value.post
 
     # Mock a 400 response
     mock_resp = MagicMock()
@@ -66,7 +72,7 @@ def test_get_genesys_access_token_error(mock_requests_post):
 #
 
 def test_build_post_analytics_conversations_details_query_payloads():
-    from src.utility_functions.genesys_utility.conversation_details_query import (
+    from src.py_toolkit.genesys_utility.conversation_details_query import (
         build_post_analytics_conversations_details_query_payloads
     )
 
@@ -93,9 +99,67 @@ def test_build_post_analytics_conversations_details_query_payloads():
         # Each chunk should have 2 conversation IDs
         assert len(conv_predicates) == 2
 
-@patch("src.utility_functions.genesys_utility.conversation_details_query.fetch_all_pages_for_conversations_details_query_payload")
+def test_build_post_analytics_conversations_details_query_payloads_packs_to_api_max():
+    from src.py_toolkit.genesys_utility.conversation_details_query import (
+        build_post_analytics_conversations_details_query_payloads,
+        MAX_PREDICATES_PER_FILTER,
+        MAX_PAGE_SIZE
+    )
+
+    # 250 distinct IDs, each listed twice
+    ids = [f"id-{i}" for i in range(250)]
+    df = pd.DataFrame({"conversationId": ids + ids})
+
+    payloads = build_post_analytics_conversations_details_query_payloads(
+        df, "conversationId", [("2023-01-01", "2023-01-02")]
+    )
+
+    # Duplicates dropped, then packed 100 per payload => 100, 100, 50
+    assert len(payloads) == 3
+    sizes = [len(json.loads(p)["conversationFilters"][0]["predicates"]) for p in payloads]
+    assert sizes == [MAX_PREDICATES_PER_FILTER, MAX_PREDICATES_PER_FILTER, 50]
+    assert all(json.loads(p)["paging"]["pageSize"] == MAX_PAGE_SIZE for p in payloads)
+
+    with pytest.raises(ValueError):
+        build_post_analytics_conversations_details_query_payloads(
+            df, "conversationId", [("2023-01-01", "2023-01-02")], chunk_size=MAX_PREDICATES_PER_FILTER + 1
+        )
+
+
+def test_fetch_all_pages_stops_at_total_hits():
+    from src.py_toolkit.genesys_utility.conversation_details_query import (
+        fetch_all_pages_for_conversations_details_query_payload
+    )
+    from src.py_toolkit.genesys_utility.rate_limit import GenesysRateLimiter
+
+    def fake_query(payload_dict):
+        page_number = payload_dict["paging"]["pageNumber"]
+        page = MagicMock()
+        page.to_dict.return_value = {
+            "conversations": [{"conversation_id": f"p{page_number}-a"}, {"conversation_id": f"p{page_number}-b"}],
+            "total_hits": 4
+        }
+        return page
+
+    api_client = MagicMock()
+    api_client.post_analytics_conversations_details_query.side_effect = fake_query
+
+    payload_json = json.dumps({
+        "interval": "2023-01-01T05:00:00.000Z/2023-01-03T05:00:00.000Z",
+        "paging": {"pageSize": 2, "pageNumber": 1}
+    })
+    result_df = fetch_all_pages_for_conversations_details_query_payload(
+        api_client, payload_json, rate_limiter=GenesysRateLimiter(requests_per_minute=60000, burst=100)
+    )
+
+    # Both pages are full, but totalHits says there is no third one to ask for
+    assert api_client.post_analytics_conversations_details_query.call_count == 2
+    assert result_df["conversation_id"].tolist() == ["p1-a", "p1-b", "p2-a", "p2-b"]
+
+
+@patch("src.py_toolkit.genesys_utility.conversation_details_query.fetch_all_pages_for_conversations_details_query_payload")
 def test_fetch_post_analytics_conversations_details_query_df(mock_fetch_all_pages):
-    from src.utility_functions.genesys_utility.conversation_details_query import (
+    from src.py_toolkit.genesys_utility.conversation_details_query import (
         fetch_post_analytics_conversations_details_query_df
     )
     # Mock return of one DataFrame per payload
@@ -124,17 +188,624 @@ def test_fetch_post_analytics_conversations_details_query_df(mock_fetch_all_page
     mock_fetch_all_pages.assert_called_once()
 
 
+@patch("src.py_toolkit.genesys_utility.conversation_details_query.fetch_all_pages_for_conversations_details_query_payload")
+def test_fetch_post_analytics_conversations_details_query_df_concurrent_order(mock_fetch_all_pages):
+    """
+    With max_workers > 1 the payloads run on a thread pool,
+    but the combined DataFrame must still follow payload order.
+    """
+    import time
+    from src.py_toolkit.genesys_utility.conversation_details_query import (
+        fetch_post_analytics_conversations_details_query_df
+    )
+
+    def slow_then_fast(api_client, payload_json, rate_limiter=None):
+        # The first interval sleeps longest, so it finishes last
+        interval = json.loads(payload_json)["interval"]
+        delay = {"2023-01-01": 0.2, "2023-01-02": 0.1, "2023-01-03": 0.0}[interval[:10]]
+        time.sleep(delay)
+        return pd.DataFrame([{"interval": interval[:10]}])
+
+    mock_fetch_all_pages.side_effect = slow_then_fast
+
+    df_in = pd.DataFrame({"conv": ["123", "456"]})
+    intervals = [
+        ("2023-01-01", "2023-01-02"),
+        ("2023-01-02", "2023-01-03"),
+        ("2023-01-03", "2023-01-04"),
+    ]
+
+    result_df = fetch_post_analytics_conversations_details_query_df(
+        MagicMock(), intervals, df_in, "conv", max_workers=3
+    )
+
+    assert result_df["interval"].tolist() == ["2023-01-01", "2023-01-02", "2023-01-03"]
+    assert mock_fetch_all_pages.call_count == 3
+
+
+def _paged_details_api(pages_per_payload=2):
+    """
+    MagicMock details API returning `pages_per_payload` full pages per payload,
+    with conversation IDs tagged by the payload's start date and page number.
+    """
+    def fake_query(payload_dict):
+        start_date = payload_dict["interval"][:10]
+        page_size = payload_dict["paging"]["pageSize"]
+        page_number = payload_dict["paging"]["pageNumber"]
+        page = MagicMock()
+        page.to_dict.return_value = {
+            "conversations": [
+                {"conversation_id": f"{start_date}-p{page_number}-{i}"} for i in range(page_size)
+            ],
+            "total_hits": pages_per_payload * page_size
+        }
+        return page
+
+    api_client = MagicMock()
+    api_client.post_analytics_conversations_details_query.side_effect = fake_query
+    return api_client
+
+
+def test_iter_post_analytics_conversations_details_query_batches_streams_pages_in_order():
+    from src.py_toolkit.genesys_utility.conversation_details_query import (
+        iter_post_analytics_conversations_details_query_batches
+    )
+
+    api_client = _paged_details_api(pages_per_payload=2)
+    df_in = pd.DataFrame({"conv": ["a"]})
+    intervals = [
+        ("2023-01-01", "2023-01-02"),
+        ("2023-01-02", "2023-01-03"),
+        ("2023-01-03", "2023-01-04"),
+    ]
+
+    batches = iter_post_analytics_conversations_details_query_batches(
+        api_client, intervals, df_in, "conv", max_workers=2
+    )
+    first = next(batches)
+    # Pages come back one at a time, not as one concatenated frame
+    assert len(first) == 100
+    assert first["conversation_id"].iloc[0] == "2023-01-01-p1-0"
+
+    rest = list(batches)
+    assert len(rest) == 5
+    assert [batch["conversation_id"].iloc[0] for batch in rest] == [
+        "2023-01-01-p2-0",
+        "2023-01-02-p1-0", "2023-01-02-p2-0",
+        "2023-01-03-p1-0", "2023-01-03-p2-0",
+    ]
+
+
+def test_write_post_analytics_conversations_details_query_batches_csv(tmp_path):
+    from src.py_toolkit.genesys_utility.conversation_details_query import (
+        write_post_analytics_conversations_details_query_batches
+    )
+
+    api_client = _paged_details_api(pages_per_payload=3)
+    df_in = pd.DataFrame({"conv": ["a"]})
+
+    written = write_post_analytics_conversations_details_query_batches(
+        api_client, [("2023-01-01", "2023-01-02")], df_in, "conv",
+        output_dir=str(tmp_path / "extract"), file_format="csv"
+    )
+
+    assert [os.path.basename(p) for p in written] == ["part-00000.csv", "part-00001.csv", "part-00002.csv"]
+    assert pd.read_csv(written[2])["conversation_id"].iloc[0] == "2023-01-01-p3-0"
+
+    with pytest.raises(ValueError):
+        write_post_analytics_conversations_details_query_batches(
+            api_client, [], df_in, "conv", output_dir=str(tmp_path), file_format="xlsx"
+        )
+
+
+class _FakeClock:
+    """
+    Stands in for the time module so rate limiter waits are instant but still observable.
+    """
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@patch("src.py_toolkit.genesys_utility.rate_limit.time", new_callable=_FakeClock)
+def test_fetch_all_pages_retries_throttled_page(fake_clock):
+    """
+    A 429 on a page is retried after the Retry-After delay instead of killing the extract.
+    """
+    from PureCloudPlatformClientV2.rest import ApiException
+    from src.py_toolkit.genesys_utility.conversation_details_query import (
+        fetch_all_pages_for_conversations_details_query_payload
+    )
+    from src.py_toolkit.genesys_utility.rate_limit import GenesysRateLimiter
+
+    throttled = ApiException(status=429, reason="Too Many Requests")
+    throttled.headers = {"Retry-After": "3"}
+
+    page = MagicMock()
+    page.to_dict.return_value = {"conversations": [{"conversation_id": "c1"}]}
+
+    api_client = MagicMock()
+    api_client.post_analytics_conversations_details_query.side_effect = [throttled, page]
+
+    limiter = GenesysRateLimiter(requests_per_minute=60, base_backoff=0)
+    payload_json = json.dumps({"paging": {"pageSize": 50, "pageNumber": 1}})
+
+    result_df = fetch_all_pages_for_conversations_details_query_payload(
+        api_client, payload_json, rate_limiter=limiter
+    )
+
+    assert result_df["conversation_id"].tolist() == ["c1"]
+    assert api_client.post_analytics_conversations_details_query.call_count == 2
+    # The bucket paused for the Retry-After period before retrying
+    assert sum(fake_clock.sleeps) >= 3
+
+
+@patch("src.py_toolkit.genesys_utility.rate_limit.time", new_callable=_FakeClock)
+def test_genesys_rate_limiter_gives_up_after_max_retries(fake_clock):
+    from PureCloudPlatformClientV2.rest import ApiException
+    from src.py_toolkit.genesys_utility.rate_limit import GenesysRateLimiter
+
+    limiter = GenesysRateLimiter(requests_per_minute=60, max_retries=2, base_backoff=0)
+    func = MagicMock(side_effect=ApiException(status=429, reason="Too Many Requests"))
+
+    with pytest.raises(ApiException):
+        limiter.call(func)
+    assert func.call_count == 3
+
+    # Non-throttling errors are not retried at all
+    func = MagicMock(side_effect=ApiException(status=400, reason="Bad Request"))
+    with pytest.raises(ApiException):
+        limiter.call(func)
+    func.assert_called_once()
+
+
+class _FakeDetailsJobsApi:
+    """
+    Test double for the async details job endpoints.
+    The job reports QUEUED for `polls_before_done` polls, then `final_state`;
+    results are served as cursor pages from `pages`.
+    """
+    def __init__(self, pages, polls_before_done=1, final_state="FULFILLED"):
+        self.pages = pages
+        self.polls_before_done = polls_before_done
+        self.final_state = final_state
+        self.submitted = []
+        self.result_calls = []
+
+    def post_analytics_conversations_details_jobs(self, body):
+        self.submitted.append(body)
+        return MagicMock(job_id=f"job-{len(self.submitted)}")
+
+    def get_analytics_conversations_details_job(self, job_id):
+        if self.polls_before_done > 0:
+            self.polls_before_done -= 1
+            return MagicMock(state="QUEUED", error_message=None)
+        return MagicMock(state=self.final_state, error_message="boom")
+
+    def get_analytics_conversations_details_job_results(self, job_id, cursor=None, page_size=None):
+        self.result_calls.append(cursor)
+        index = int(cursor) if cursor else 0
+        next_cursor = str(index + 1) if index + 1 < len(self.pages) else None
+        response = MagicMock()
+        response.to_dict.return_value = {"conversations": self.pages[index], "cursor": next_cursor}
+        return response
+
+
+@patch("src.py_toolkit.genesys_utility.conversation_details_jobs.time", new_callable=_FakeClock)
+def test_fetch_post_analytics_conversations_details_query_df_jobs_mode(fake_clock):
+    from src.py_toolkit.genesys_utility.conversation_details_query import (
+        fetch_post_analytics_conversations_details_query_df
+    )
+
+    api_client = _FakeDetailsJobsApi(
+        pages=[
+            [{"conversation_id": "c1"}, {"conversation_id": "c2"}],
+            [{"conversation_id": "c3"}],
+        ],
+        polls_before_done=2
+    )
+    df_in = pd.DataFrame({"conv": ["c1", "c2", "c3"]})
+
+    result_df = fetch_post_analytics_conversations_details_query_df(
+        api_client, [("2023-01-01", "2023-01-15")], df_in, "conv", mode="jobs"
+    )
+
+    assert result_df["conversation_id"].tolist() == ["c1", "c2", "c3"]
+    # Jobs take no paging block, and the cursor is followed to the end
+    assert len(api_client.submitted) == 1
+    assert "paging" not in api_client.submitted[0]
+    assert api_client.result_calls == [None, "1"]
+    # Polled with growing waits while the job was queued
+    assert fake_clock.sleeps == [2.0, 3.0]
+
+    with pytest.raises(ValueError):
+        fetch_post_analytics_conversations_details_query_df(
+            api_client, [("2023-01-01", "2023-01-15")], df_in, "conv", mode="bulk"
+        )
+
+
+@patch("src.py_toolkit.genesys_utility.conversation_details_jobs.time", new_callable=_FakeClock)
+def test_fetch_all_pages_for_conversations_details_job_payload_failed_job(fake_clock):
+    from src.py_toolkit.genesys_utility.conversation_details_jobs import (
+        fetch_all_pages_for_conversations_details_job_payload
+    )
+
+    api_client = _FakeDetailsJobsApi(pages=[[]], final_state="FAILED")
+    payload_json = json.dumps({"interval": "x/y", "paging": {"pageSize": 100, "pageNumber": 1}})
+
+    with pytest.raises(RuntimeError, match="FAILED"):
+        fetch_all_pages_for_conversations_details_job_payload(api_client, payload_json)
+    assert api_client.result_calls == []
+
+
+def _sample_conversation(conversation_id, media_type="voice"):
+    """
+    Minimal details-query conversation in the SDK's to_dict() shape.
+    """
+    from datetime import datetime, timezone
+    start = datetime(2023, 1, 1, 15, 0, tzinfo=timezone.utc)
+    return {
+        "conversation_id": conversation_id,
+        "conversation_start": start,
+        "originating_direction": "inbound",
+        "participants": [
+            {
+                "participant_id": f"{conversation_id}-cust",
+                "purpose": "customer",
+                "sessions": [{
+                    "session_id": f"{conversation_id}-s1",
+                    "media_type": media_type,
+                    "direction": "inbound",
+                    "metrics": [{"name": "nConnected", "value": 1, "emit_date": start}],
+                    "segments": [
+                        {"segment_type": "interact", "segment_start": start, "segment_end": start},
+                    ],
+                }],
+            },
+            {
+                "participant_id": f"{conversation_id}-agent",
+                "purpose": "agent",
+                "user_id": "user-1",
+                "sessions": [{
+                    "session_id": f"{conversation_id}-s2",
+                    "media_type": media_type,
+                    "direction": "inbound",
+                    "segments": [
+                        {"segment_type": "alert", "segment_start": start, "queue_id": "q1"},
+                        {"segment_type": "interact", "segment_start": start, "queue_id": "q1"},
+                    ],
+                }],
+            },
+            # A participant with no sessions still gets a row
+            {"participant_id": f"{conversation_id}-ivr", "purpose": "ivr"},
+        ],
+    }
+
+
+def test_normalize_conversations_segments_schema():
+    from src.py_toolkit.genesys_utility.conversation_schema import (
+        normalize_conversations,
+        SEGMENT_EXPLOSION_SCHEMA
+    )
+
+    segments_df = normalize_conversations([_sample_conversation("c1")], normalize="segments")
+
+    assert list(segments_df.columns) == list(SEGMENT_EXPLOSION_SCHEMA)
+    assert len(segments_df) == 4
+    assert segments_df["purpose"].tolist() == ["customer", "agent", "agent", "ivr"]
+    assert isinstance(segments_df["media_type"].dtype, pd.CategoricalDtype)
+    assert isinstance(segments_df["purpose"].dtype, pd.CategoricalDtype)
+    assert str(segments_df["segment_start"].dtype) == "datetime64[ns, UTC]"
+    assert str(segments_df["conversation_id"].dtype) == "string"
+
+    # Empty pages keep the declared columns and dtypes
+    empty_df = normalize_conversations([], normalize="segments")
+    assert empty_df.empty
+    assert list(empty_df.columns) == list(SEGMENT_EXPLOSION_SCHEMA)
+    assert str(empty_df["conversation_start"].dtype) == "datetime64[ns, UTC]"
+
+    with pytest.raises(ValueError):
+        normalize_conversations([], normalize="wide")
+
+
+def test_fetch_post_analytics_conversations_details_query_df_segments():
+    from src.py_toolkit.genesys_utility.conversation_details_query import (
+        fetch_post_analytics_conversations_details_query_df
+    )
+
+    def fake_query(payload_dict):
+        page = MagicMock()
+        media_type = "voice" if payload_dict["interval"].startswith("2023-01-01") else "callback"
+        page.to_dict.return_value = {
+            "conversations": [_sample_conversation(payload_dict["interval"][:10], media_type)],
+            "total_hits": 1
+        }
+        return page
+
+    api_client = MagicMock()
+    api_client.post_analytics_conversations_details_query.side_effect = fake_query
+    df_in = pd.DataFrame({"conv": ["c1"]})
+    intervals = [("2023-01-01", "2023-01-02"), ("2023-01-02", "2023-01-03")]
+
+    result_df = fetch_post_analytics_conversations_details_query_df(
+        api_client, intervals, df_in, "conv", max_workers=2, normalize="segments"
+    )
+
+    assert len(result_df) == 8
+    assert result_df["conversation_id"].unique().tolist() == ["2023-01-01", "2023-01-02"]
+    # Categories stay categorical across payloads instead of degrading to object
+    assert isinstance(result_df["media_type"].dtype, pd.CategoricalDtype)
+    assert set(result_df["media_type"].cat.categories) == {"voice", "callback"}
+
+
+def test_normalize_conversations_tables_are_linked():
+    from src.py_toolkit.genesys_utility.conversation_schema import (
+        normalize_conversations,
+        CONVERSATION_TABLE_SCHEMAS
+    )
+
+    tables = normalize_conversations(
+        [_sample_conversation("c1"), _sample_conversation("c2")], normalize="tables"
+    )
+
+    assert set(tables) == set(CONVERSATION_TABLE_SCHEMAS)
+    assert len(tables["conversations"]) == 2
+    assert len(tables["participants"]) == 6
+    assert len(tables["sessions"]) == 4
+    assert len(tables["segments"]) == 6
+    assert len(tables["metrics"]) == 2
+
+    # Child tables join back up to their parents on the carried keys
+    joined = tables["segments"].merge(
+        tables["participants"], on=["conversation_id", "participant_id"]
+    ).merge(tables["conversations"], on="conversation_id")
+    assert len(joined) == 6
+    agent_segments = joined[joined["purpose"] == "agent"]
+    assert agent_segments["segment_type"].tolist() == ["alert", "interact", "alert", "interact"]
+    assert agent_segments["segment_index"].tolist() == [0, 1, 0, 1]
+
+    metrics = tables["metrics"]
+    assert metrics["session_id"].tolist() == ["c1-s1", "c2-s1"]
+    assert str(metrics["value"].dtype) == "Int64"
+    assert isinstance(tables["sessions"]["media_type"].dtype, pd.CategoricalDtype)
+
+
+def test_fetch_post_analytics_conversations_details_query_df_tables():
+    from src.py_toolkit.genesys_utility.conversation_details_query import (
+        fetch_post_analytics_conversations_details_query_df
+    )
+
+    page = MagicMock()
+    page.to_dict.return_value = {"conversations": [_sample_conversation("c1")], "total_hits": 1}
+    api_client = MagicMock()
+    api_client.post_analytics_conversations_details_query.return_value = page
+
+    tables = fetch_post_analytics_conversations_details_query_df(
+        api_client, [("2023-01-01", "2023-01-02")], pd.DataFrame({"conv": ["c1"]}), "conv",
+        normalize="tables"
+    )
+
+    assert tables["conversations"]["conversation_id"].tolist() == ["c1"]
+    assert tables["sessions"]["participant_id"].tolist() == ["c1-cust", "c1-agent"]
+
+
+def test_fetch_post_analytics_conversations_details_query_incremental_skips_completed(tmp_path):
+    from src.py_toolkit.genesys_utility.conversation_details_query import (
+        fetch_post_analytics_conversations_details_query_incremental
+    )
+    from src.py_toolkit.genesys_utility.extract_state import GenesysExtractStateStore
+
+    today = pd.Timestamp.now(tz="UTC").date()
+    intervals = [
+        ("2023-01-01", "2023-01-02"),
+        ("2023-01-02", "2023-01-03"),
+        (str(today), str(today + pd.Timedelta(days=1))),  # still open, never recorded
+    ]
+    df_in = pd.DataFrame({"conv": ["a"]})
+    store = GenesysExtractStateStore(str(tmp_path / "state.sqlite"))
+    output_dir = str(tmp_path / "extract")
+
+    api_client = _paged_details_api(pages_per_payload=1)
+    written = fetch_post_analytics_conversations_details_query_incremental(
+        api_client, intervals, df_in, "conv", output_dir, state_store=store, file_format="csv"
+    )
+    assert len(written) == 3
+    assert api_client.post_analytics_conversations_details_query.call_count == 3
+
+    manifest = store.completed_payloads()
+    assert len(manifest) == 2
+    assert manifest["row_count"].tolist() == [100, 100]
+
+    # A rerun only re-fetches the unsettled interval
+    api_client = _paged_details_api(pages_per_payload=1)
+    written = fetch_post_analytics_conversations_details_query_incremental(
+        api_client, intervals, df_in, "conv", output_dir, state_store=store, file_format="csv"
+    )
+    assert len(written) == 1
+    sent = api_client.post_analytics_conversations_details_query.call_args[0][0]
+    assert sent["interval"].startswith(str(today))
+
+    # A new ID (sorting ahead of "a", so fixed-position chunks would all shift) is the
+    # only one fetched for the settled intervals
+    api_client = _paged_details_api(pages_per_payload=1)
+    fetch_post_analytics_conversations_details_query_incremental(
+        api_client, intervals, pd.DataFrame({"conv": ["a", "0"]}), "conv", output_dir,
+        state_store=store, file_format="csv"
+    )
+    sent_ids = {
+        call.args[0]["interval"][:10]: [p["value"] for p in call.args[0]["conversationFilters"][0]["predicates"]]
+        for call in api_client.post_analytics_conversations_details_query.call_args_list
+    }
+    assert sent_ids == {"2023-01-01": ["0"], "2023-01-02": ["0"], str(today): ["0", "a"]}
+    assert store.completed_conversation_ids(manifest["interval"][0], ["0", "a", "b"]) == {"0", "a"}
+
+    # The open interval's earlier "a"-only file was replaced, not left beside the new one
+    open_files = [name for name in os.listdir(output_dir) if name.startswith("open-")]
+    assert len(open_files) == 1
+    assert len(pd.read_csv(os.path.join(output_dir, open_files[0]))) == 100
+    assert len(os.listdir(output_dir)) == 5
+
+
+def test_fetch_all_pages_for_conversations_details_query_payload_uses_response_cache(tmp_path):
+    from src.py_toolkit.genesys_utility.conversation_details_query import (
+        build_post_analytics_conversations_details_query_payloads,
+        fetch_all_pages_for_conversations_details_query_payload
+    )
+    from src.py_toolkit.genesys_utility.response_cache import GenesysResponseCache
+
+    cache = GenesysResponseCache(str(tmp_path / "cache.sqlite"))
+    payload_json = build_post_analytics_conversations_details_query_payloads(
+        pd.DataFrame({"conv": ["a"]}), "conv", [("2023-01-01", "2023-01-02")]
+    )[0]
+
+    api_client = _paged_details_api(pages_per_payload=2)
+    first = fetch_all_pages_for_conversations_details_query_payload(api_client, payload_json, cache=cache)
+    assert api_client.post_analytics_conversations_details_query.call_count == 2
+
+    # A rerun is served entirely from disk
+    api_client = _paged_details_api(pages_per_payload=2)
+    second = fetch_all_pages_for_conversations_details_query_payload(api_client, payload_json, cache=cache)
+    assert api_client.post_analytics_conversations_details_query.call_count == 0
+    pd.testing.assert_frame_equal(first, second)
+
+    # Expired entries are misses
+    expired = GenesysResponseCache(cache.path, ttl_seconds=0)
+    assert expired.get(payload_json, 1) is None
+
+    # Over the size budget, the least recently used page goes first
+    small = GenesysResponseCache(str(tmp_path / "small.sqlite"), max_bytes=1)
+    small.put(payload_json, 1, {"conversations": [{"conversation_id": "x"}]})
+    small.put(payload_json, 2, {"conversations": [{"conversation_id": "y"}]})
+    assert small.get(payload_json, 1) is None
+
+    # Open intervals are never cached
+    today = str(pd.Timestamp.now(tz="UTC").date())
+    open_payload = json.loads(payload_json)
+    open_payload["interval"] = f"{today}T00:00:00.000Z/{today}T23:59:59.000Z"
+    cache.put(json.dumps(open_payload), 1, {"conversations": []})
+    assert cache.get(json.dumps(open_payload), 1) is None
+
+    # Pages are stored as plain JSON: datetimes come back as ISO strings, as put() returns them
+    from datetime import datetime, timezone
+    page = {"conversations": [{"conversation_id": "z", "conversation_start": datetime(2023, 1, 1, tzinfo=timezone.utc)}]}
+    stored = cache.put(payload_json, 3, page)
+    assert stored == cache.get(payload_json, 3)
+    assert stored["conversations"][0]["conversation_start"] == "2023-01-01T00:00:00+00:00"
+
+
+def test_fetch_post_analytics_conversations_aggregates_query_df():
+    from src.py_toolkit.genesys_utility.conversation_aggregates_query import (
+        fetch_post_analytics_conversations_aggregates_query_df
+    )
+
+    def fake_aggregates(payload_dict):
+        day = payload_dict["interval"][:10]
+        response = MagicMock()
+        response.to_dict.return_value = {"results": [
+            {
+                "group": {"queueId": f"q-{day}", "mediaType": "voice"},
+                "data": [{
+                    "interval": f"{day}T05:00:00.000Z/{day}T05:30:00.000Z",
+                    "metrics": [
+                        {"metric": "nOffered", "qualifier": None, "stats": {"count": 3}},
+                        {"metric": "tHandle", "qualifier": None, "stats": {"count": 2, "sum": 540000.0, "max": 300000.0}},
+                    ],
+                }],
+            }
+        ]}
+        return response
+
+    api_client = MagicMock()
+    api_client.post_analytics_conversations_aggregates_query.side_effect = fake_aggregates
+
+    result_df = fetch_post_analytics_conversations_aggregates_query_df(
+        api_client,
+        [("2023-01-01", "2023-01-02"), ("2023-01-02", "2023-01-03")],
+        metrics=["nOffered", "tHandle"],
+        group_by=["queueId", "mediaType"],
+        granularity="PT30M",
+        max_workers=2
+    )
+
+    sent = api_client.post_analytics_conversations_aggregates_query.call_args_list[0][0][0]
+    assert sent["groupBy"] == ["queueId", "mediaType"] and sent["granularity"] == "PT30M"
+
+    assert result_df["queueId"].tolist() == ["q-2023-01-01"] * 2 + ["q-2023-01-02"] * 2
+    assert result_df["metric"].tolist() == ["nOffered", "tHandle"] * 2
+    assert str(result_df["interval_start"].dtype) == "datetime64[ns, UTC]"
+    assert str(result_df["count"].dtype) == "Int64"
+    assert result_df["sum"].iloc[1] == 540000.0
+    assert pd.isna(result_df["sum"].iloc[0])
+
+    with pytest.raises(ValueError):
+        fetch_post_analytics_conversations_aggregates_query_df(api_client, [], metrics=[])
+
+
+def test_local_day_intervals_follow_dst():
+    from src.py_toolkit.genesys_utility.interval_planner import local_day_intervals
+    from src.py_toolkit.genesys_utility.conversation_details_query import (
+        build_post_analytics_conversations_details_query_payloads
+    )
+
+    # US clocks spring forward on 2023-03-12, so that local day is 23 hours long
+    intervals = local_day_intervals("2023-03-11", "2023-03-14", time_zone="America/New_York")
+    assert intervals == [
+        "2023-03-11T05:00:00.000Z/2023-03-12T05:00:00.000Z",
+        "2023-03-12T05:00:00.000Z/2023-03-13T04:00:00.000Z",
+        "2023-03-13T04:00:00.000Z/2023-03-14T04:00:00.000Z",
+    ]
+
+    # The interval strings feed straight into the details payload builder
+    payloads = build_post_analytics_conversations_details_query_payloads(
+        pd.DataFrame({"conv": ["a"]}), "conv", intervals
+    )
+    assert json.loads(payloads[1])["interval"] == intervals[1]
+
+
+def test_run_details_benchmark_against_fake_server():
+    from genesys_benchmark import run_details_benchmark
+
+    report = run_details_benchmark(conversation_count=150, max_workers=2, latency=0.0, throttle_rate=0.3)
+
+    assert report["stage"].tolist() == [
+        "fetch", "normalize:json", "normalize:segments", "normalize:tables", "end_to_end"
+    ]
+    # Throttled pages are retried, so every conversation still arrives
+    assert report.attrs["throttled"] > 0
+    assert report["conversations"].tolist() == [150] * 5
+    assert report.set_index("stage").loc["normalize:segments", "rows"] == 600
+    assert (report["seconds"] > 0).all()
+    # Each stage reports its own peak, not the process-wide high-water mark
+    assert (report["peak_memory_mb"] >= 0).all()
+    assert report["peak_memory_mb"].max() < 500
+
+
 #
 # ---------------- 3) TEST conversation.py + users.py (basic setup) ----------------
 #
-@patch("src.utility_functions.genesys_utility.conversation.genesys.api_client.ApiClient")
-def test_genesys_conversation_setup(mock_ApiClient):
-    from src.utility_functions.genesys_utility.conversation import genesys_conversation_setup
+def _mock_token_post(mock_get_transport, access_token, expires_in=86399):
+    """
+    Makes the pooled transport's /oauth/token POST return `access_token`.
+    """
+    mock_post = mock_get_transport.return_value.post
+    mock_post.return_value.status_code = 200
+    mock_post.return_value.json.return_value = {"access_token": access_token, "expires_in": expires_in}
+    return mock_post
+
+
+@patch("src.py_toolkit.genesys_utility.token_manager.get_genesys_transport")
+def test_genesys_conversation_setup(mock_get_transport):
+    from src.py_toolkit.genesys_utility.conversation import genesys_conversation_setup
     import PureCloudPlatformClientV2 as genesys
 
-    mock_client = MagicMock()
-    mock_client.access_token = "FAKE_CONV_TOKEN"
-    mock_ApiClient.return_value.get_client_credentials_token.return_value = mock_client
+    mock_post = _mock_token_post(mock_get_transport, "FAKE_CONV_TOKEN")
 
     api_instance = genesys_conversation_setup("ID123", "SEC456")
 
@@ -143,21 +814,22 @@ def test_genesys_conversation_setup(mock_ApiClient):
     # Confirm the access_token is set
     assert genesys.configuration.access_token == "FAKE_CONV_TOKEN"
 
+    # The token comes from the region's login host
+    assert mock_post.call_args.args[0] == "https://login.use2.us-gov-pure.cloud/oauth/token"
+
     # Check the type WITHOUT importing from .rest
     assert isinstance(api_instance, genesys.ConversationsApi)
 
 
-@patch("src.utility_functions.genesys_utility.users.genesys.api_client.ApiClient")
-def test_genesys_users_setup(mock_ApiClient):
+@patch("src.py_toolkit.genesys_utility.token_manager.get_genesys_transport")
+def test_genesys_users_setup(mock_get_transport):
     """
     Ensure users setup sets region host and obtains token, returning a UsersApi instance.
     """
-    from src.utility_functions.genesys_utility.users import genesys_users_setup
+    from src.py_toolkit.genesys_utility.users import genesys_users_setup
     import PureCloudPlatformClientV2 as genesys
 
-    mock_client = MagicMock()
-    mock_client.access_token = "FAKE_USERS_TOKEN"
-    mock_ApiClient.return_value.get_client_credentials_token.return_value = mock_client
+    _mock_token_post(mock_get_transport, "FAKE_USERS_TOKEN")
 
     api_instance = genesys_users_setup("ID999", "SEC999")
     assert genesys.configuration.host == genesys.PureCloudRegionHosts.us_east_2.get_api_host()
@@ -165,11 +837,229 @@ def test_genesys_users_setup(mock_ApiClient):
     assert api_instance.__class__.__name__ == "UsersApi"
 
 
+@patch("src.py_toolkit.genesys_utility.token_manager.get_genesys_transport")
+def test_genesys_setups_share_one_token(mock_get_transport):
+    """
+    Users and Conversations setups with the same credentials log in only once,
+    and keep the token for the lifetime /oauth/token gave it.
+    """
+    from src.py_toolkit.genesys_utility.conversation import genesys_conversation_setup
+    from src.py_toolkit.genesys_utility.users import genesys_users_setup
+    from src.py_toolkit.genesys_utility.token_manager import get_token_manager
+    import PureCloudPlatformClientV2 as genesys
+
+    mock_post = _mock_token_post(mock_get_transport, "FAKE_SHARED_TOKEN", expires_in=3600)
+
+    genesys_users_setup("ID_SHARED", "SEC_SHARED")
+    genesys_conversation_setup("ID_SHARED", "SEC_SHARED")
+    genesys_users_setup("ID_SHARED", "SEC_SHARED")
+
+    assert genesys.configuration.access_token == "FAKE_SHARED_TOKEN"
+    mock_post.assert_called_once()
+
+    # Expiry follows the response's expires_in rather than an assumed 24 hours
+    manager = get_token_manager("ID_SHARED", "SEC_SHARED", genesys.configuration.host, fetch_token=None)
+    assert 3500 < manager.expires_at - time.monotonic() <= 3600
+    manager.invalidate()
+
+
+@patch("src.py_toolkit.genesys_utility.auth.get_genesys_transport")
+@patch("src.py_toolkit.genesys_utility.auth._update_env_file")
+def test_get_genesys_access_token_follows_refreshes(mock_update_env_file, mock_get_transport):
+    """
+    Tokens fetched later by the shared manager (e.g. its background refresh) reach
+    genesys.configuration and .env too, and another transport gets its own manager.
+    """
+    from src.py_toolkit.genesys_utility.auth import get_genesys_access_token
+    from src.py_toolkit.genesys_utility.token_manager import get_token_manager
+    import PureCloudPlatformClientV2 as genesys
+
+    mock_post = _mock_token_post(mock_get_transport, "FIRST_TOKEN", expires_in=3600)
+    transport = mock_get_transport.return_value
+    assert get_genesys_access_token("ID_REFRESH", "SEC_REFRESH", "mypurecloud.de") == "FIRST_TOKEN"
+
+    manager = get_token_manager(
+        "ID_REFRESH", "SEC_REFRESH", "https://api.mypurecloud.de", fetch_token=None, transport=transport
+    )
+    mock_post.return_value.json.return_value = {"access_token": "REFRESHED_TOKEN", "expires_in": 3600}
+    manager.get_token(force_refresh=True)
+
+    assert genesys.configuration.access_token == "REFRESHED_TOKEN"
+    assert mock_update_env_file.call_args_list[-1].args == ("GENESYS_ACCESS_TOKEN", "REFRESHED_TOKEN")
+    other = get_token_manager(
+        "ID_REFRESH", "SEC_REFRESH", "https://api.mypurecloud.de", fetch_token=None, transport=MagicMock()
+    )
+    assert other is not manager
+    manager.invalidate()
+
+
+@patch("src.py_toolkit.genesys_utility.token_manager.time", new_callable=_FakeClock)
+def test_genesys_token_manager_refreshes_before_expiry(fake_clock):
+    from src.py_toolkit.genesys_utility.token_manager import GenesysTokenManager
+
+    tokens = iter([("T1", 600), ("T2", 600)])
+    seen = []
+    manager = GenesysTokenManager(lambda: next(tokens), refresh_margin=60, auto_refresh=False)
+    manager.add_listener(seen.append)
+
+    assert manager.get_token() == "T1"
+    fake_clock.sleep(500)
+    assert manager.get_token() == "T1"
+    # Inside the refresh margin, the next call fetches a new token
+    fake_clock.sleep(50)
+    assert manager.get_token() == "T2"
+    assert seen == ["T1", "T2"]
+
+
+def _fake_users_api(user_count, page_size=500):
+    """
+    MagicMock UsersApi serving `user_count` users in pages, and bulk lookups by `id`.
+    """
+    all_users = [
+        {"id": f"u{i}", "name": f"Agent {i}", "division": {"id": "d1", "name": "Home"}, "version": 1}
+        for i in range(user_count)
+    ]
+
+    def fake_get_users(page_size=25, page_number=1, id=None, state=None):
+        users = [u for u in all_users if u["id"] in id] if id else all_users
+        start = (page_number - 1) * page_size
+        listing = MagicMock()
+        listing.to_dict.return_value = {
+            "entities": users[start : start + page_size],
+            "page_count": -(-len(users) // page_size),
+        }
+        return listing
+
+    users_api = MagicMock()
+    users_api.get_users.side_effect = fake_get_users
+    return users_api, all_users
+
+
+def test_genesys_user_directory_load_map_and_snapshot(tmp_path):
+    from src.py_toolkit.genesys_utility.user_directory import GenesysUserDirectory
+
+    users_api, _ = _fake_users_api(1200)
+    snapshot = str(tmp_path / "users.json")
+    directory = GenesysUserDirectory(users_api, snapshot_path=snapshot)
+
+    assert directory.load() == 1200
+    # 1200 users at 500 per page => 3 page calls
+    assert users_api.get_users.call_count == 3
+    assert directory.get("u1100")["division_name"] == "Home"
+
+    conversations = pd.DataFrame({"user_id": ["u5", "missing", "u1199"]})
+    assert directory.map(conversations["user_id"]).tolist()[0::2] == ["Agent 5", "Agent 1199"]
+    assert pd.isna(directory.map(conversations["user_id"]).iloc[1])
+
+    # A fresh directory restores the snapshot without calling the API
+    directory.save_snapshot()
+    restored = GenesysUserDirectory(MagicMock(), snapshot_path=snapshot)
+    assert len(restored) == 1200
+    assert restored.refresh() == 0
+
+
+def test_genesys_user_directory_fetches_only_missing_ids(tmp_path):
+    from src.py_toolkit.genesys_utility.user_directory import GenesysUserDirectory
+
+    users_api, _ = _fake_users_api(10)
+    directory = GenesysUserDirectory(users_api, snapshot_path=str(tmp_path / "users.json"))
+
+    names = directory.map(["u1", "u2", "u1"], fetch_missing=True)
+    assert names.tolist() == ["Agent 1", "Agent 2", "Agent 1"]
+    assert users_api.get_users.call_count == 1
+    assert sorted(users_api.get_users.call_args.kwargs["id"]) == ["u1", "u2"]
+
+    # Already-indexed IDs cost nothing
+    directory.map(["u1"], fetch_missing=True)
+    assert users_api.get_users.call_count == 1
+
+
+def test_genesys_user_directory_pages_through_queue_members(tmp_path):
+    from src.py_toolkit.genesys_utility.user_directory import GenesysUserDirectory
+
+    users_api, _ = _fake_users_api(250)
+
+    def fake_get_routing_queues(page_size=25, page_number=1):
+        listing = MagicMock()
+        listing.to_dict.return_value = {"entities": [{"id": "q1", "name": "Support"}], "page_count": 1}
+        return listing
+
+    def fake_get_routing_queue_members(queue_id, page_size=25, page_number=1):
+        # Queue member listings carry next_uri but no page_count
+        start = (page_number - 1) * page_size
+        listing = MagicMock()
+        listing.to_dict.return_value = {
+            "entities": [{"id": f"u{i}"} for i in range(start, min(start + page_size, 250))],
+            "next_uri": f"/api/v2/routing/queues/{queue_id}/members?pageNumber={page_number + 1}"
+            if start + page_size < 250 else None,
+        }
+        return listing
+
+    routing_api = MagicMock()
+    routing_api.get_routing_queues.side_effect = fake_get_routing_queues
+    routing_api.get_routing_queue_members.side_effect = fake_get_routing_queue_members
+
+    directory = GenesysUserDirectory(users_api, routing_api=routing_api, snapshot_path=str(tmp_path / "users.json"))
+    directory.load()
+
+    # 250 members at 100 per page => 3 page calls, and the last page's members are mapped too
+    assert routing_api.get_routing_queue_members.call_count == 3
+    assert directory.get("u249")["queue_names"] == ["Support"]
+
+
+def test_genesys_transport_shares_pools_and_sets_timeouts():
+    from src.py_toolkit.genesys_utility.transport import GenesysTransport
+    import PureCloudPlatformClientV2 as genesys
+
+    transport = GenesysTransport(pool_size=8, connect_timeout=5.0, read_timeout=30.0)
+    first = transport.attach(genesys.api_client.ApiClient())
+    second = transport.attach(genesys.api_client.ApiClient())
+
+    assert first.rest_client.pool_manager is second.rest_client.pool_manager
+    pool = transport.pool_manager.connection_from_host("api.example.com", scheme="https")
+    assert pool.pool.maxsize == 8
+    assert pool.timeout.connect_timeout == 5.0
+
+    with patch.object(transport.session, "post") as mock_post:
+        transport.post("https://login.example.com/oauth/token", data={})
+    assert mock_post.call_args.kwargs["timeout"] == (5.0, 30.0)
+    transport.close()
+
+
+@patch("src.py_toolkit.genesys_utility.client_factory._client_credentials_token")
+def test_genesys_client_factory_isolates_orgs(mock_handshake):
+    from src.py_toolkit.genesys_utility.client_factory import GenesysClientFactory
+    import PureCloudPlatformClientV2 as genesys
+
+    mock_handshake.side_effect = lambda client_id, client_secret, host=None, transport=None: (
+        f"TOKEN-{client_id}", 86399
+    )
+    global_host = genesys.configuration.host
+    global_token = genesys.configuration.access_token
+
+    org_a = GenesysClientFactory("ORG_A", "SEC_A", region="us_east_2")
+    org_b = GenesysClientFactory("ORG_B", "SEC_B", region="mypurecloud.ie")
+
+    api_a, api_b = org_a.conversations_api(), org_b.users_api()
+    assert api_a.api_client.host == genesys.PureCloudRegionHosts.us_east_2.get_api_host()
+    assert api_b.api_client.host == "https://api.mypurecloud.ie"
+    assert (api_a.api_client.access_token, api_b.api_client.access_token) == ("TOKEN-ORG_A", "TOKEN-ORG_B")
+    assert org_a.api_client.rest_client.pool_manager is not org_b.api_client.rest_client.pool_manager
+    assert org_a.rate_limiter is not org_b.rate_limiter
+
+    # The global configuration is left alone
+    assert genesys.configuration.host == global_host
+    assert genesys.configuration.access_token == global_token
+
+    with pytest.raises(ValueError):
+        GenesysClientFactory("ORG_C", "SEC_C", region=None)
+
+
 #
 # ---------------- 4) TEST transformations.py (clean_genesys_id_column) ----------------
 #
 def test_clean_genesys_id_column():
-    from src.utility_functions.genesys_utility.transformations import clean_genesys_id_column
+    from src.py_toolkit.genesys_utility.transformations import clean_genesys_id_column
 
     df = pd.DataFrame({
         "conversation_id": [
@@ -198,3 +1088,30 @@ def test_clean_genesys_id_column():
         "00000000-0000-0000-0000-000000000000",
         "11111111-1111-1111-1111-111111111111"
     ]
+
+
+def test_clean_genesys_id_column_mask_and_ids_leave_input_untouched():
+    from src.py_toolkit.genesys_utility.transformations import clean_genesys_id_column
+
+    df = pd.DataFrame({
+        "conversation_id": [
+            "/queue/00000000-0000-0000-0000-000000000000",
+            "admin",
+            "00000000-0000-0000-0000-000000000000",
+            None,
+        ]
+    })
+    original = df.copy()
+
+    assert clean_genesys_id_column(df, "conversation_id", return_type="mask").tolist() == [
+        True, False, True, False
+    ]
+    assert clean_genesys_id_column(df, "conversation_id", return_type="ids").tolist() == [
+        "00000000-0000-0000-0000-000000000000"
+    ]
+    cleaned_df = clean_genesys_id_column(df, "conversation_id")
+    assert cleaned_df.index.tolist() == [0, 2]
+    pd.testing.assert_frame_equal(df, original)
+
+    with pytest.raises(ValueError):
+        clean_genesys_id_column(df, "conversation_id", return_type="list")
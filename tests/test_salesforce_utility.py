@@ -7,9 +7,9 @@ import pandas as pd
 #
 # ==================== 1) TEST auth.py ====================
 #
-@patch("src.utility_functions.salesforce_utility.auth.requests.post")
-@patch("src.utility_functions.salesforce_utility.auth._update_env_file")
-@patch("src.utility_functions.salesforce_utility.auth.load_dotenv")
+@patch("src.py_toolkit.salesforce_utility.auth.requests.post")
+@patch("src.py_toolkit.salesforce_utility.auth._update_env_file")
+@patch("src.py_toolkit.salesforce_utility.auth.load_dotenv")
 def test_get_salesforce_refresh_token(
     mock_load_dotenv,
     mock_update_env_file,
@@ -19,7 +19,7 @@ def test_get_salesforce_refresh_token(
     Test that get_salesforce_refresh_token makes the correct requests, 
     updates .env, and returns the new token.
     """
-    from src.utility_functions.salesforce_utility.auth import get_salesforce_refresh_token
+    from src.py_toolkit.salesforce_utility.auth import get_salesforce_refresh_token
 
     # 1. Mock environment variables
     with patch.dict(os.environ, {"SF_KEY": "FakeKey", "SF_SECRET": "FakeSecret"}, clear=True):
@@ -44,12 +44,12 @@ def test_get_salesforce_refresh_token(
         assert "refresh_token=FAKE_REFRESH_TOKEN" in second_call_url
 
 
-@patch("src.utility_functions.salesforce_utility.auth.load_dotenv")
+@patch("src.py_toolkit.salesforce_utility.auth.load_dotenv")
 def test_print_salesforce_authorize_url(mock_load_dotenv, capsys):
     """
     Test that print_salesforce_authorize_url prints the correct URL.
     """
-    from src.utility_functions.salesforce_utility.auth import print_salesforce_authorize_url
+    from src.py_toolkit.salesforce_utility.auth import print_salesforce_authorize_url
 
     with patch.dict(os.environ, {"SF_KEY": "FakeKey"}, clear=True):
         print_salesforce_authorize_url()
@@ -61,17 +61,17 @@ def test_print_salesforce_authorize_url(mock_load_dotenv, capsys):
 #
 # ==================== 2) TEST common.py ====================
 #
-@patch("src.utility_functions.salesforce_utility.common.os.path.exists", return_value=True)
+@patch("src.py_toolkit.salesforce_utility.common.os.path.exists", return_value=True)
 def test_update_env_file(mock_exists, tmp_path):
     """
     Basic test to confirm _update_env_file writes or updates a key in .env.
     We use a temp file to simulate the .env path.
     """
-    from src.utility_functions.salesforce_utility.common import _update_env_file, _get_env_path
+    from src.py_toolkit.salesforce_utility.common import _update_env_file, _get_env_path
 
     # Patch _get_env_path so it returns a path to a temp file
     env_file = tmp_path / ".env"
-    with patch("src.utility_functions.salesforce_utility.common._get_env_path", return_value=str(env_file)):
+    with patch("src.py_toolkit.salesforce_utility.common._get_env_path", return_value=str(env_file)):
         # Write a starter .env
         env_file.write_text("OLD_KEY=OLD_VALUE\n")
 
@@ -89,7 +89,7 @@ def test_update_env_file(mock_exists, tmp_path):
 # ==================== 3) TEST transformations.py ====================
 #
 def test_flatten_record():
-    from src.utility_functions.salesforce_utility.transformations import flatten_record
+    from src.py_toolkit.salesforce_utility.transformations import flatten_record
 
     nested_record = {
         "Id": "001",
@@ -112,7 +112,7 @@ def test_flatten_record():
 
 
 def test_convert_to_eastern_time():
-    from src.utility_functions.salesforce_utility.transformations import convert_to_eastern_time
+    from src.py_toolkit.salesforce_utility.transformations import convert_to_eastern_time
     # Example UTC datetime string
     original_utc = "2023-06-01T12:00:00Z"
     converted = convert_to_eastern_time(original_utc)
@@ -121,14 +121,72 @@ def test_convert_to_eastern_time():
     assert "2023-06-01" in converted
     assert "EDT" in converted or "EST" in converted
 
+
+def test_convert_values_to_eastern_time_bulk():
+    import numpy as np
+    from src.py_toolkit.salesforce_utility.transformations import (
+        convert_values_to_eastern_time,
+        convert_to_eastern_time,
+        _convert_salesforce_datetime_to_est_str
+    )
+
+    _convert_salesforce_datetime_to_est_str.cache_clear()
+    values = ["2023-06-01T12:00:00.000+0000", None, "2023-06-01T12:00:00.000+0000", "2023-01-01", 7]
+
+    converted = convert_values_to_eastern_time(values)
+    assert converted == ["2023-06-01 08:00:00 EDT", None, "2023-06-01 08:00:00 EDT", "2023-01-01", 7]
+    # Repeated values are converted once
+    assert _convert_salesforce_datetime_to_est_str.cache_info().misses == 1
+
+    series = convert_values_to_eastern_time(pd.Series(values, index=list("abcde"), name="d"), datetimes_only=False)
+    assert series.index.tolist() == list("abcde") and series.name == "d"
+    assert series["d"] == "2022-12-31 19:00:00 EST"
+
+    array = convert_values_to_eastern_time(np.array(["2023-01-01T12:00:00Z"], dtype=object))
+    assert array.tolist() == [convert_to_eastern_time("2023-01-01T12:00:00Z")]
+    # Non-ISO strings still go through the fuzzy parser
+    assert _convert_salesforce_datetime_to_est_str("06/01/2023 12:00 UTC") == "2023-06-01 08:00:00 EDT"
+
+
+def test_flatten_records_and_convert_datetime_columns():
+    from src.py_toolkit.salesforce_utility.transformations import (
+        flatten_records,
+        convert_datetime_columns_to_eastern_time,
+        convert_to_eastern_time
+    )
+
+    records = [
+        {"attributes": {"type": "Case"}, "Id": "500A", "Amount": 5,
+         "Owner": {"attributes": {"type": "User"}, "Name": "Ann"},
+         "CreatedDate": "2023-01-01T12:00:00.000+0000", "Subject": "2023-01-01T is not a date"},
+        {"attributes": {"type": "Case"}, "Id": "500B", "Amount": None, "Owner": None,
+         "CreatedDate": None, "Subject": "hello"},
+    ]
+
+    df = convert_datetime_columns_to_eastern_time(flatten_records(records))
+
+    assert df.columns.tolist() == ["Id", "Amount", "Owner__Name", "CreatedDate", "Subject", "Owner"]
+    assert df.loc[0, "Owner__Name"] == "Ann"
+    assert df.loc[0, "CreatedDate"] == convert_to_eastern_time("2023-01-01T12:00:00.000+0000")
+    assert pd.isna(df.loc[1, "CreatedDate"])
+    # Cells that look like date/times but don't parse are left alone
+    assert df["Subject"].tolist() == ["2023-01-01T is not a date", "hello"]
+
+    # Compound fields and child subquery results aren't relationships, so they stay one cell
+    account = {"attributes": {"type": "Account"}, "Id": "001", "BillingAddress": {"city": "Reno"},
+               "Contacts": {"totalSize": 1, "done": True, "records": [{"attributes": {}, "Id": "003"}]}}
+    compound = flatten_records([account])
+    assert compound.columns.tolist() == ["Id", "BillingAddress", "Contacts"]
+    assert compound.loc[0, "BillingAddress"] == {"city": "Reno"}
+
 #
 # ==================== 4) TEST query.py ====================
 #
-@patch("src.utility_functions.salesforce_utility.query.requests.get")
-@patch("src.utility_functions.salesforce_utility.query.load_dotenv")
+@patch("src.py_toolkit.salesforce_utility.query.requests.get")
+@patch("src.py_toolkit.salesforce_utility.common.load_dotenv")
 def test_query_salesforce_soql(mock_load_dotenv, mock_requests_get):
-    from src.utility_functions.salesforce_utility.query import query_salesforce_soql
-    from src.utility_functions.salesforce_utility.transformations import convert_to_eastern_time
+    from src.py_toolkit.salesforce_utility.query import query_salesforce_soql
+    from src.py_toolkit.salesforce_utility.transformations import convert_to_eastern_time
 
     # Mock environment: set SF_REFRESH
     with patch.dict(os.environ, {"SF_REFRESH": "FakeRefreshToken"}, clear=True):
@@ -161,12 +219,303 @@ def test_query_salesforce_soql(mock_load_dotenv, mock_requests_get):
         # The date in row 0 should have EDT or EST appended
         assert "EDT" in df.loc[0, "createddate"] or "EST" in df.loc[0, "createddate"]
 
+def _soql_response(payload):
+    response = MagicMock()
+    response.json.return_value = payload
+    return response
+
+
+@patch("src.py_toolkit.salesforce_utility.query.requests.get")
+@patch("src.py_toolkit.salesforce_utility.common.load_dotenv")
+def test_query_salesforce_soql_follows_next_records_url(mock_load_dotenv, mock_requests_get):
+    from src.py_toolkit.salesforce_utility.query import query_salesforce_soql
+
+    mock_requests_get.side_effect = [
+        _soql_response({
+            "done": False,
+            "nextRecordsUrl": "/services/data/v60.0/query/01gXX-2000",
+            "records": [{"attributes": {"type": "Case"}, "Id": "500A"}],
+        }),
+        _soql_response({"done": True, "records": [{"attributes": {"type": "Case"}, "Id": "500B"}]}),
+    ]
+
+    with patch.dict(os.environ, {"SF_REFRESH": "FakeRefreshToken"}, clear=True):
+        df = query_salesforce_soql("SELECT Id FROM Case")
+
+    assert df["id"].tolist() == ["500A", "500B"]
+    assert mock_requests_get.call_args_list[1][0][0].endswith("/services/data/v60.0/query/01gXX-2000")
+
+
+@patch("src.py_toolkit.salesforce_utility.query.requests.get")
+@patch("src.py_toolkit.salesforce_utility.common.load_dotenv")
+def test_query_salesforce_soql_parallel_slices(mock_load_dotenv, mock_requests_get):
+    from src.py_toolkit.salesforce_utility.query import query_salesforce_soql
+
+    def fake_get(url, params=None, headers=None):
+        soql = params["q"]
+        if soql.startswith("SELECT MIN(CreatedDate)"):
+            return _soql_response({"done": True, "records": [
+                {"lo": "2023-01-01T00:00:00.000+0000", "hi": "2023-01-04T00:00:00.000+0000"}
+            ]})
+        # One record per slice, tagged with the slice's lower bound
+        lower = soql.split("CreatedDate >= ")[1][:10]
+        return _soql_response({"done": True, "records": [{"Id": f"500-{lower}"}]})
+
+    mock_requests_get.side_effect = fake_get
+
+    with patch.dict(os.environ, {"SF_REFRESH": "FakeRefreshToken"}, clear=True):
+        df = query_salesforce_soql(
+            "SELECT Id FROM Case WHERE IsClosed = true ORDER BY CreatedDate", parallel_slices=3
+        )
+
+    assert df["id"].tolist() == ["500-2023-01-01", "500-2023-01-02", "500-2023-01-03"]
+    slice_queries = [c.kwargs["params"]["q"] for c in mock_requests_get.call_args_list[1:]]
+    assert all(q.startswith("SELECT Id FROM Case WHERE (IsClosed = true) AND CreatedDate >= ") for q in slice_queries)
+    assert all(q.endswith("ORDER BY CreatedDate") for q in slice_queries)
+    assert sum("CreatedDate <= 2023-01-04T00:00:00.000Z" in q for q in slice_queries) == 1
+
+    with pytest.raises(ValueError):
+        query_salesforce_soql("SELECT Id FROM Case LIMIT 10", parallel_slices=2)
+
+@patch("src.py_toolkit.salesforce_utility.query.requests.get")
+@patch("src.py_toolkit.salesforce_utility.common.load_dotenv")
+def test_write_salesforce_soql_batches_appends_pages(mock_load_dotenv, mock_requests_get, tmp_path):
+    from src.py_toolkit.salesforce_utility.query import write_salesforce_soql_batches
+
+    pages = [
+        {"done": False, "nextRecordsUrl": "/services/data/v60.0/query/01gXX-2",
+         "records": [{"Id": "500A", "Amount": 1, "Owner": {"attributes": {}, "Name": "Ann"}, "Note": None}]},
+        {"done": True,
+         "records": [{"Id": "500B", "Amount": 2.5, "Owner": {"attributes": {}, "Name": "Bo"}, "Note": "hi"}]},
+    ]
+
+    with patch.dict(os.environ, {"SF_REFRESH": "FakeRefreshToken"}, clear=True):
+        mock_requests_get.side_effect = [_soql_response(page) for page in pages]
+        paths = write_salesforce_soql_batches(
+            "SELECT Id, Amount, Owner.Name, Note FROM Case", str(tmp_path / "case.parquet"), batch_size=200
+        )
+        assert mock_requests_get.call_args_list[0].kwargs["headers"]["Sforce-Query-Options"] == "batchSize=200"
+
+        mock_requests_get.side_effect = [_soql_response(page) for page in pages]
+        part_paths = write_salesforce_soql_batches(
+            "SELECT Id FROM Case", str(tmp_path / "case_parts"), file_format="csv", partitioned=True
+        )
+
+    df = pd.read_parquet(paths[0])
+    assert df["id"].tolist() == ["500A", "500B"]
+    assert df["amount"].tolist() == [1.0, 2.5]
+    assert df["note"].tolist() == [None, "hi"]
+    assert [os.path.basename(p) for p in part_paths] == ["part-00000.csv", "part-00001.csv"]
+
+
+@patch("src.py_toolkit.salesforce_utility.query.requests.get")
+@patch("src.py_toolkit.salesforce_utility.common.load_dotenv")
+def test_write_salesforce_soql_batches_takes_columns_from_select(mock_load_dotenv, mock_requests_get, tmp_path):
+    from src.py_toolkit.salesforce_utility.query import write_salesforce_soql_batches
+
+    # Every Owner lookup on the first page is empty, so that page has a bare Owner column
+    pages = [
+        {"done": False, "nextRecordsUrl": "/services/data/v60.0/query/01gXX-2",
+         "records": [{"Id": "500A", "Owner": None}]},
+        {"done": True, "records": [{"Id": "500B", "Owner": {"attributes": {}, "Name": "Bo"}}]},
+    ]
+    output_path = str(tmp_path / "case.parquet")
+
+    with patch.dict(os.environ, {"SF_REFRESH": "FakeRefreshToken"}, clear=True):
+        mock_requests_get.side_effect = [_soql_response(page) for page in pages]
+        paths = write_salesforce_soql_batches("SELECT Id, Owner.Name FROM Case", output_path)
+
+        df = pd.read_parquet(paths[0])
+        assert df.columns.tolist() == ["id", "owner_name"]
+        assert df["owner_name"].tolist() == [None, "Bo"]
+
+        # A failure part-way through leaves neither a partial file nor the temporary one
+        os.remove(output_path)
+        mock_requests_get.side_effect = [_soql_response(pages[0]), requests.exceptions.ConnectionError("reset")]
+        with pytest.raises(requests.exceptions.ConnectionError):
+            write_salesforce_soql_batches("SELECT Id, Owner.Name FROM Case", output_path, file_format="csv")
+    assert os.listdir(tmp_path) == []
+
+
+@patch("src.py_toolkit.salesforce_utility.query.requests.get")
+@patch("src.py_toolkit.salesforce_utility.common.load_dotenv")
+def test_write_salesforce_soql_batches_keeps_compound_fields_and_int64(mock_load_dotenv, mock_requests_get, tmp_path):
+    from src.py_toolkit.salesforce_utility.query import write_salesforce_soql_batches
+    from src.py_toolkit.salesforce_utility.describe_cache import SalesforceDescribeCache
+
+    fields = [{"name": "Id", "type": "id"}, {"name": "NumberOfEmployees", "type": "int"},
+              {"name": "BillingAddress", "type": "address"}]
+    pages = [
+        {"done": False, "nextRecordsUrl": "/services/data/v60.0/query/01gXX-2", "records": [
+            {"attributes": {}, "Id": "001A", "NumberOfEmployees": 42, "BillingAddress": {"city": "Reno"}}]},
+        {"done": True, "records": [
+            {"attributes": {}, "Id": "001B", "NumberOfEmployees": None, "BillingAddress": {"city": "Ely"}}]},
+    ]
+
+    def fake_get(url, params=None, headers=None):
+        if "/describe" in url:
+            return _soql_response({"name": "Account", "fields": fields})
+        return _soql_response(pages[0] if params else pages[1])
+
+    mock_requests_get.side_effect = fake_get
+    with patch.dict(os.environ, {"SF_REFRESH": "FakeRefreshToken"}, clear=True):
+        paths = write_salesforce_soql_batches(
+            "SELECT Id, NumberOfEmployees, BillingAddress FROM Account", str(tmp_path / "account.parquet"),
+            typed=True, describe_cache=SalesforceDescribeCache(str(tmp_path / "describe.sqlite"))
+        )
+
+    df = pd.read_parquet(paths[0], dtype_backend="numpy_nullable")
+    assert df.columns.tolist() == ["id", "numberofemployees", "billingaddress"]
+    assert str(df["numberofemployees"].dtype) == "Int64"
+    assert df["numberofemployees"].tolist()[0] == 42 and pd.isna(df["numberofemployees"].iloc[1])
+    assert [address["city"] for address in df["billingaddress"]] == ["Reno", "Ely"]
+
+
+@patch("src.py_toolkit.salesforce_utility.query.requests.get")
+@patch("src.py_toolkit.salesforce_utility.common.load_dotenv")
+def test_query_salesforce_soql_typed_uses_describe_cache(mock_load_dotenv, mock_requests_get, tmp_path):
+    from src.py_toolkit.salesforce_utility.query import query_salesforce_soql
+    from src.py_toolkit.salesforce_utility.describe_cache import SalesforceDescribeCache
+
+    describes = {
+        "Opportunity": [
+            {"name": "Id", "type": "id"},
+            {"name": "Amount", "type": "currency"},
+            {"name": "IsWon", "type": "boolean"},
+            {"name": "CloseDate", "type": "date"},
+            {"name": "CreatedDate", "type": "datetime"},
+            {"name": "Stage__c", "type": "picklist"},
+            {"name": "Account__c", "type": "reference", "relationshipName": "Account__r", "referenceTo": ["Account"]},
+        ],
+        "Account": [{"name": "NumberOfEmployees", "type": "int"}],
+    }
+
+    def fake_get(url, params=None, headers=None):
+        if "/describe" in url:
+            sobject = url.split("/sobjects/")[1].split("/")[0]
+            return _soql_response({"name": sobject, "fields": describes[sobject]})
+        return _soql_response({"done": True, "records": [{
+            "attributes": {"type": "Opportunity"}, "Id": "006A", "Amount": 1200, "IsWon": True,
+            "CloseDate": "2023-06-30", "CreatedDate": "2023-06-01T12:00:00.000+0000", "Stage__c": "Won",
+            "Account__r": {"attributes": {"type": "Account"}, "NumberOfEmployees": 42},
+        }]})
+
+    mock_requests_get.side_effect = fake_get
+    query = "SELECT Id, Amount, IsWon, CloseDate, CreatedDate, Stage__c, Account__r.NumberOfEmployees FROM Opportunity"
+
+    with patch.dict(os.environ, {"SF_REFRESH": "FakeRefreshToken"}, clear=True):
+        cache = SalesforceDescribeCache(str(tmp_path / "describe.sqlite"))
+        df = query_salesforce_soql(query, typed=True, describe_cache=cache)
+        # A fresh cache on the same file serves the describes without another request
+        query_salesforce_soql(query, typed=True, describe_cache=SalesforceDescribeCache(cache.path))
+
+    describe_urls = [c[0][0] for c in mock_requests_get.call_args_list if "/describe" in c[0][0]]
+    assert len(describe_urls) == 2
+    assert df["amount"].dtype == "float64"
+    assert df["iswon"].dtype == "boolean"
+    assert df["stage_c"].dtype == "category"
+    assert df["account_r_numberofemployees"].dtype == "Int64"
+    assert df.loc[0, "closedate"] == pd.Timestamp("2023-06-30")
+    assert df.loc[0, "createddate"] == pd.Timestamp("2023-06-01 08:00", tz="US/Eastern")
+
+
+_BULK_RECORDS = [
+    {"Id": "500A", "CaseNumber": "00001026", "IsClosed": True, "Owner.Name": "Ann",
+     "CreatedDate": "2023-01-01T12:00:00.000+0000"},
+    {"Id": "500B", "CaseNumber": "00001027", "IsClosed": False, "Owner.Name": None,
+     "CreatedDate": "2023-07-01T12:00:00.000+0000"},
+    {"Id": "500C", "CaseNumber": "00001028", "IsClosed": True, "Owner.Name": "NA",
+     "CreatedDate": "2023-07-02T12:00:00.000+0000"},
+]
+
+
+@patch("src.py_toolkit.salesforce_utility.common.load_dotenv")
+def test_query_salesforce_bulk_streams_every_chunk(mock_load_dotenv, tmp_path):
+    from src.py_toolkit.salesforce_utility.bulk_query import query_salesforce_bulk
+    from salesforce_fakes import FakeSalesforceBulkServer
+
+    with patch.dict(os.environ, {"SF_REFRESH": "FakeRefreshToken"}, clear=True), \
+            FakeSalesforceBulkServer(_BULK_RECORDS, chunk_size=2, polls_until_complete=2) as server:
+        df = query_salesforce_bulk(
+            "SELECT Id, CaseNumber, IsClosed, Owner.Name, CreatedDate FROM Case",
+            base_url=server.url,
+            poll_interval=0.01
+        )
+        paths = query_salesforce_bulk(
+            "SELECT Id FROM Case", base_url=server.url, poll_interval=0.01, output_dir=str(tmp_path), file_format="csv"
+        )
+        result_requests = [r for r in server.requests if r[1].endswith("/results")]
+
+    assert df.columns.tolist() == ["id", "casenumber", "isclosed", "owner_name", "createddate"]
+    assert df["id"].tolist() == ["500A", "500B", "500C"]
+    # Numeric-looking text keeps its leading zeros, and "NA" is a name, not a null
+    assert df["casenumber"].tolist() == ["00001026", "00001027", "00001028"]
+    assert df["owner_name"].tolist()[::2] == ["Ann", "NA"]
+    assert pd.isna(df["owner_name"].iloc[1])
+    assert df["isclosed"].tolist() == [True, False, True]
+    assert df["createddate"].tolist()[:2] == ["2023-01-01 07:00:00 EST", "2023-07-01 08:00:00 EDT"]
+    assert [params.get("locator") for _, _, params in result_requests[:2]] == [None, ["2"]]
+    assert [os.path.basename(p) for p in paths] == ["part-00000.csv", "part-00001.csv"]
+
+
+@patch("src.py_toolkit.salesforce_utility.common.load_dotenv")
+def test_query_salesforce_bulk_typed_describes_in_its_own_org(mock_load_dotenv, tmp_path):
+    from src.py_toolkit.salesforce_utility.bulk_query import query_salesforce_bulk
+    from src.py_toolkit.salesforce_utility.common import SALESFORCE_API_VERSION
+    from src.py_toolkit.salesforce_utility.describe_cache import SalesforceDescribeCache
+    from salesforce_fakes import FakeSalesforceBulkServer
+
+    describes = {
+        "Case": [
+            {"name": "Id", "type": "id"},
+            {"name": "IsClosed", "type": "boolean"},
+            {"name": "CreatedDate", "type": "datetime"},
+            {"name": "OwnerId", "type": "reference", "relationshipName": "Owner", "referenceTo": ["User"]},
+        ],
+        "User": [{"name": "Name", "type": "string"}],
+    }
+    records = [{k: v for k, v in r.items() if k != "CaseNumber"} for r in _BULK_RECORDS]
+    cache = SalesforceDescribeCache(str(tmp_path / "describe.sqlite"))
+
+    with patch.dict(os.environ, {"SF_REFRESH": "FakeRefreshToken"}, clear=True), \
+            FakeSalesforceBulkServer(records, describes=describes) as server:
+        df = query_salesforce_bulk(
+            "SELECT Id, IsClosed, Owner.Name, CreatedDate FROM Case",
+            base_url=server.url,
+            poll_interval=0.01,
+            typed=True,
+            describe_cache=cache
+        )
+        describe_paths = [path for _, path, _ in server.requests if path.endswith("/describe/")]
+        org = server.url
+
+    # The describes come from the query's org and are cached under it, not the default org
+    assert sorted(describe_paths) == [
+        f"/services/data/{SALESFORCE_API_VERSION}/sobjects/Case/describe/",
+        f"/services/data/{SALESFORCE_API_VERSION}/sobjects/User/describe/",
+    ]
+    assert cache.get(org, "Case", SALESFORCE_API_VERSION)["fields"][0]["name"] == "Id"
+    assert df["isclosed"].dtype == "boolean"
+    assert df.loc[0, "createddate"] == pd.Timestamp("2023-01-01 07:00", tz="US/Eastern")
+
+
+@patch("src.py_toolkit.salesforce_utility.common.load_dotenv")
+def test_query_salesforce_bulk_failed_job_raises(mock_load_dotenv):
+    from src.py_toolkit.salesforce_utility.bulk_query import query_salesforce_bulk
+    from salesforce_fakes import FakeSalesforceBulkServer
+
+    with patch.dict(os.environ, {"SF_REFRESH": "FakeRefreshToken"}, clear=True), \
+            FakeSalesforceBulkServer(_BULK_RECORDS, fail_message="INVALID_FIELD: Foo") as server:
+        with pytest.raises(RuntimeError, match="INVALID_FIELD"):
+            query_salesforce_bulk("SELECT Foo FROM Case", base_url=server.url, poll_interval=0.01)
+
 #
 # ==================== 5) TEST reporting.py ====================
 #
-@patch("src.utility_functions.salesforce_utility.reporting.requests.get")
-def test_query_salesforce_report(mock_requests_get):
-    from src.utility_functions.salesforce_utility.reporting import query_salesforce_report
+@patch("src.py_toolkit.salesforce_utility.reporting.requests.get")
+@patch("src.py_toolkit.salesforce_utility.common.load_dotenv")
+def test_query_salesforce_report(mock_load_dotenv, mock_requests_get):
+    from src.py_toolkit.salesforce_utility.reporting import query_salesforce_report
     # Mock environment
     with patch.dict(os.environ, {"SF_REFRESH": "FakeRefreshToken"}, clear=True):
         # We create a fake JSON that matches a typical Analytics report structure
@@ -218,3 +567,176 @@ def test_query_salesforce_report(mock_requests_get):
         mock_requests_get.assert_called_once()
         url_called = mock_requests_get.call_args[0][0]
         assert "analytics/reports/FAKE_REPORT_ID" in url_called
+
+
+@patch("src.py_toolkit.salesforce_utility.reporting.requests.post")
+@patch("src.py_toolkit.salesforce_utility.reporting.requests.get")
+@patch("src.py_toolkit.salesforce_utility.common.load_dotenv")
+def test_query_salesforce_report_full_slices_past_row_cap(mock_load_dotenv, mock_requests_get, mock_requests_post):
+    import random
+    from src.py_toolkit.salesforce_utility.reporting import query_salesforce_report_full, REPORT_ROW_LIMIT
+
+    # 3,000 dated rows (1,500 of them on one busy day) plus 50 blanks, in no particular order
+    dates = [f"2023-03-{1 + i % 28:02d}" for i in range(1500)] + ["2023-03-15"] * 1500 + [None] * 50
+    rows = [(f"006{i:05d}", date) for i, date in enumerate(dates)]
+    random.Random(0).shuffle(rows)
+
+    metadata = {"detailColumns": ["OPPORTUNITY_ID", "CLOSE_DATE"], "reportFilters": [{"column": "STAGE"}]}
+    column_info = {"OPPORTUNITY_ID": {"dataType": "id"}, "CLOSE_DATE": {"dataType": "date"}}
+    describe = MagicMock()
+    describe.json.return_value = {"reportMetadata": metadata, "reportExtendedMetadata": {"detailColumnInfo": column_info}}
+    mock_requests_get.return_value = describe
+
+    def keep(date, report_filter):
+        operator, value = report_filter["operator"], report_filter["value"]
+        if operator == "equals":
+            return (date or "") == value
+        if operator == "notEqual":
+            return (date or "") != value
+        if date is None:
+            return False
+        return {"greaterOrEqual": date >= value, "greaterThan": date > value, "lessThan": date < value}[operator]
+
+    def run_report(url, params=None, headers=None, json=None):
+        filters = [f for f in json["reportMetadata"]["reportFilters"] if f.get("column") == "CLOSE_DATE"]
+        matched = [row for row in rows if all(keep(row[1], f) for f in filters)]
+        response = MagicMock()
+        response.json.return_value = {
+            "allData": len(matched) <= REPORT_ROW_LIMIT,
+            "reportMetadata": json["reportMetadata"],
+            "reportExtendedMetadata": {"detailColumnInfo": column_info},
+            "factMap": {"T!T": {"rows": [
+                {"dataCells": [{"value": row_id, "label": row_id}, {"value": date, "label": date or "-"}]}
+                for row_id, date in matched[:REPORT_ROW_LIMIT]
+            ]}},
+        }
+        return response
+
+    mock_requests_post.side_effect = run_report
+
+    with patch.dict(os.environ, {"SF_REFRESH": "FakeRefreshToken"}, clear=True):
+        df = query_salesforce_report_full("FAKE_REPORT_ID", slice_column="CLOSE_DATE", slices=3, max_workers=3)
+        with pytest.raises(ValueError):
+            query_salesforce_report_full("FAKE_REPORT_ID")
+
+    assert len(df) == len(rows)
+    assert df["opportunity_id"].is_unique
+    assert df["close_date"].isna().sum() == 50
+    # Blanks are their own slice, merged last
+    assert df["close_date"].tail(50).isna().all()
+    # Existing report filters are kept on every run
+    assert all(
+        c.kwargs["json"]["reportMetadata"]["reportFilters"][0] == {"column": "STAGE"}
+        for c in mock_requests_post.call_args_list
+    )
+
+
+@patch("src.py_toolkit.salesforce_utility.reporting.requests.post")
+@patch("src.py_toolkit.salesforce_utility.reporting.requests.get")
+@patch("src.py_toolkit.salesforce_utility.common.load_dotenv")
+def test_query_salesforce_report_full_slices_on_numeric_column(mock_load_dotenv, mock_requests_get, mock_requests_post):
+    from decimal import Decimal
+    from src.py_toolkit.salesforce_utility.reporting import query_salesforce_report_full, REPORT_ROW_LIMIT
+
+    # Large amounts a cent apart, which 6-significant-digit formatting would collapse
+    rows = [(f"006{i:05d}", 123_456_000 + i * 0.01) for i in range(3000)]
+    metadata = {"detailColumns": ["OPPORTUNITY_ID", "AMOUNT"]}
+    column_info = {"OPPORTUNITY_ID": {"dataType": "id"}, "AMOUNT": {"dataType": "currency"}}
+    describe = MagicMock()
+    describe.json.return_value = {"reportMetadata": metadata, "reportExtendedMetadata": {"detailColumnInfo": column_info}}
+    mock_requests_get.return_value = describe
+    filter_values = []
+
+    def keep(amount, report_filter):
+        operator, value = report_filter["operator"], report_filter["value"]
+        if value == "":
+            return operator == "notEqual"
+        filter_values.append(value)
+        amount, value = Decimal(repr(amount)), Decimal(value)
+        return {"equals": amount == value, "greaterOrEqual": amount >= value,
+                "greaterThan": amount > value, "lessThan": amount < value}[operator]
+
+    def run_report(url, params=None, headers=None, json=None):
+        filters = json["reportMetadata"]["reportFilters"]
+        matched = [row for row in rows if all(keep(row[1], f) for f in filters)]
+        response = MagicMock()
+        response.json.return_value = {
+            "allData": len(matched) <= REPORT_ROW_LIMIT,
+            "reportMetadata": json["reportMetadata"],
+            "reportExtendedMetadata": {"detailColumnInfo": column_info},
+            "factMap": {"T!T": {"rows": [
+                {"dataCells": [{"value": row_id, "label": row_id}, {"value": {"amount": amount}, "label": f"${amount:,.2f}"}]}
+                for row_id, amount in matched[:REPORT_ROW_LIMIT]
+            ]}},
+        }
+        return response
+
+    mock_requests_post.side_effect = run_report
+
+    with patch.dict(os.environ, {"SF_REFRESH": "FakeRefreshToken"}, clear=True):
+        df = query_salesforce_report_full("FAKE_REPORT_ID", slice_column="AMOUNT", slices=2, typed=True)
+
+    assert len(df) == len(rows)
+    assert df["opportunity_id"].is_unique
+    assert df["amount"].is_monotonic_increasing
+    assert filter_values and all("e" not in value.lower() for value in filter_values)
+    assert {Decimal(value) for value in filter_values} <= {Decimal(repr(amount)) for _, amount in rows}
+
+
+@patch("src.py_toolkit.salesforce_utility.reporting.requests.get")
+@patch("src.py_toolkit.salesforce_utility.common.load_dotenv")
+def test_query_salesforce_report_keeps_groupings_and_types(mock_load_dotenv, mock_requests_get):
+    from src.py_toolkit.salesforce_utility.reporting import query_salesforce_report
+
+    def cells(name, amount, close_date):
+        return {"dataCells": [
+            {"label": name, "value": name},
+            {"label": f"{name} owner", "value": f"005{len(name):03d}"},
+            {"label": f"${amount:,.2f}", "value": {"amount": amount, "currency": None}},
+            {"label": close_date or "-", "value": close_date},
+        ]}
+
+    report_json = {
+        "reportMetadata": {
+            "detailColumns": ["OPPORTUNITY_NAME", "OWNER", "AMOUNT", "CLOSE_DATE"],
+            "groupingsDown": [{"name": "ACCOUNT.TYPE"}, {"name": "STAGE_NAME"}],
+        },
+        "reportExtendedMetadata": {"detailColumnInfo": {
+            "OPPORTUNITY_NAME": {"dataType": "string"},
+            "OWNER": {"dataType": "string"},
+            "AMOUNT": {"dataType": "currency"},
+            "CLOSE_DATE": {"dataType": "date"},
+        }},
+        "groupingsDown": {"groupings": [
+            {"key": "0", "label": "Customer", "groupings": [
+                {"key": "0_0", "label": "Won", "groupings": []},
+                {"key": "0_1", "label": "Lost", "groupings": []},
+            ]},
+        ]},
+        "factMap": {
+            "0_0!T": {"rows": [cells("Big deal", 1200.0, "2023-06-30"), cells("Small deal", 5.5, None)]},
+            "0_1!T": {"rows": [cells("Lost deal", 300.0, "2023-07-01")]},
+            "0!T": {"aggregates": [{"value": 1505.5}]},
+            "T!T": {"aggregates": [{"value": 1505.5}]},
+        },
+    }
+    mock_req = MagicMock()
+    mock_req.status_code = 200
+    mock_req.json.return_value = report_json
+    mock_requests_get.return_value = mock_req
+
+    with patch.dict(os.environ, {"SF_REFRESH": "FakeRefreshToken"}, clear=True):
+        df = query_salesforce_report("FAKE_REPORT_ID")
+        typed_df = query_salesforce_report("FAKE_REPORT_ID", typed=True)
+
+    assert df.columns.tolist() == ["account_type", "stage_name", "opportunity_name", "owner", "amount", "close_date"]
+    assert df["account_type"].tolist() == ["Customer"] * 3
+    assert df["stage_name"].tolist() == ["Won", "Won", "Lost"]
+    assert df["amount"].tolist() == ["$1,200.00", "$5.50", "$300.00"]
+    assert df.loc[1, "close_date"] is None
+
+    assert typed_df["amount"].tolist() == [1200.0, 5.5, 300.0]
+    # Lookup cells keep their label (the owner's name), not the raw record Id
+    assert typed_df["owner"].tolist() == df["owner"].tolist() == ["Big deal owner", "Small deal owner", "Lost deal owner"]
+    assert typed_df["close_date"].dtype == "datetime64[ns]"
+    assert typed_df.loc[0, "close_date"] == pd.Timestamp("2023-06-30")